@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""CLI entrypoint compiling job definitions into the offline job-config bundle."""
+
+from __future__ import annotations
+
+import sys
+
+from gov_governance.orchestration.job_config_compiler import JobConfigBundleCompiler
+from gov_governance.state_loader import GovernanceStateLoader
+from pipeline_common.helpers.config import _required_env
+
+
+def main() -> int:
+    """Write the bundle to the path given as argument or in ``JOB_CONFIG_BUNDLE_PATH``."""
+
+    output_path = sys.argv[1] if len(sys.argv) > 1 else _required_env("JOB_CONFIG_BUNDLE_PATH")
+    bundle = JobConfigBundleCompiler(GovernanceStateLoader.load_definition_snapshot()).compile()
+    bundle.write(output_path)
+    print(f"wrote {len(bundle.jobs)} jobs to {output_path} (checksum {bundle.checksum})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,6 @@
 """Governance orchestration package."""
 
 from gov_governance.orchestration.governance_applier import GovernanceApplier
+from gov_governance.orchestration.job_config_compiler import JobConfigBundleCompiler
 
-__all__ = ["GovernanceApplier"]
+__all__ = ["GovernanceApplier", "JobConfigBundleCompiler"]
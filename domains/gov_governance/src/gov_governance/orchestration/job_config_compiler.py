@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Compile job definitions into the offline job-config bundle."""
+
+from __future__ import annotations
+
+from gov_governance.entities.shared.definitions import PipelineDefinition
+from gov_governance.state_loader.governance_definitions_state import GovernanceDefinitionSnapshot
+from pipeline_common.gateways.lineage.job_config_bundle import JobConfigBundle, JobConfigEntry
+
+
+class JobConfigBundleCompiler:
+    """Build a ``JobConfigBundle`` from the ``600_jobs`` definitions of a snapshot.
+
+    Custom properties are stringified the same way DataHub returns them, so
+    bundle and live checksums agree for an applied definition.
+    """
+
+    def __init__(self, snapshot: GovernanceDefinitionSnapshot) -> None:
+        self.snapshot = snapshot
+
+    def compile(self) -> JobConfigBundle:
+        """Return one bundle entry per job of every pipeline."""
+        pipelines = [PipelineDefinition.from_mapping(payload) for payload in self.snapshot.pipelines]
+        if not any(pipeline.jobs for pipeline in pipelines):
+            raise ValueError("No job definitions found; refusing to compile an empty job config bundle")
+        return JobConfigBundle.from_entries(
+            [
+                JobConfigEntry(
+                    flow_platform=pipeline.flow.platform,
+                    flow_id=pipeline.flow.id,
+                    job_id=job.id,
+                    custom_properties={str(k): str(v) for k, v in job.custom_properties.items()},
+                )
+                for pipeline in pipelines
+                for job in pipeline.jobs
+            ]
+        )
@@ -51,7 +51,7 @@ class GovernanceStateLoader:
     def _governance_dir(cls) -> Path:
         """Resolve the governance directory from this module location."""
 
-        return FileSystemHelper.find_dir_upwards(Path(__file__), n=2)
+        return FileSystemHelper.find_dir_upwards(Path(__file__), n=3)
 
     @classmethod
     def load_definition_snapshot(cls) -> GovernanceDefinitionSnapshot:
@@ -7,11 +7,12 @@ from typing import Any, ClassVar, Iterator
 from worker_chunk_text.chunking.stage_contract import ChunkingStage, ChunkingStages
 from worker_chunk_text.chunking.stage_splitter import StageSplitter
 from langchain_core.documents import Document
-from pipeline_common.gateways.object_storage import ObjectStorageGateway
+from pipeline_common.gateways.object_storage import ObjectStorageGateway, ObjectWrite
 from pipeline_common.gateways.queue import Envelope, QueueGateway
 from pipeline_common.provenance import build_id, chunk_params_hash, sha256_hex
 from pipeline_common.stages_contracts import (
     BaseProcessor,
+    ChunkBundle,
     Content,
     ProcessResult,
     ProcessorContext,
@@ -35,10 +36,16 @@ class ChunkTextProcessor(BaseProcessor):
     The processor handles the full chunking pipeline for a single payload:
     split source text into chunk records, write chunk artifacts, and return
     metadata required by downstream manifest assembly.
+
+    With ``bundle_chunks`` every chunk of a run is packed into one JSONL
+    bundle plus an offset index object, and the published URIs are
+    ``ChunkBundleRef`` URIs that address single chunks by byte range.
     """
 
     VERSION: ClassVar[str] = "1.0.0"
     CHUNK_OBJECT_KEY_PATTERN: ClassVar[str] = "{doc_id}/runs/{run_id}/chunks/{chunk_id}.json"
+    CHUNK_BUNDLE_KEY_PATTERN: ClassVar[str] = "{doc_id}/runs/{run_id}/chunks.bundle.jsonl"
+    CHUNK_BUNDLE_INDEX_KEY_PATTERN: ClassVar[str] = "{doc_id}/runs/{run_id}/chunks.index.json"
 
     def __init__(
         self,
@@ -46,12 +53,14 @@ class ChunkTextProcessor(BaseProcessor):
         queue_gateway: QueueGateway,
         storage_bucket: str,
         output_prefix: str,
+        bundle_chunks: bool = False,
     ) -> None:
         """Initialize the processor dependencies used for storage and queue output."""
         self.object_storage = object_storage
         self.queue_gateway = queue_gateway
         self.storage_bucket = storage_bucket
         self.output_prefix = output_prefix
+        self.bundle_chunks = bundle_chunks
 
     def process(
         self,
@@ -152,34 +161,75 @@ class ChunkTextProcessor(BaseProcessor):
         stage_doc_metadata: FileMetadata,
     ) -> ChunkingExecutionMetadata:
         """Persist chunk artifacts, enqueue their URIs, and summarize write results."""
-        chunk_count_expected = 0
-        written = 0
-        chunk_entries: list[str] = []
-
-        for storage_stage_artifact in self._build_chunk_artifacts(
+        storage_stage_artifacts = self._build_chunk_artifacts(
             docs=docs,
             serialized_stages=serialized_stages,
             input_uri=input_uri,
             run_id=run_id,
             root_metadata=root_metadata,
             stage_doc_metadata=stage_doc_metadata,
-        ):
+        )
+        if self.bundle_chunks:
+            return self._write_chunk_bundle(
+                list(storage_stage_artifacts),
+                doc_id=root_metadata.doc_id,
+                run_id=run_id,
+            )
+        chunk_count_expected = 0
+        chunk_entries: list[str] = []
+        chunk_writes: list[ObjectWrite] = []
+
+        for storage_stage_artifact in storage_stage_artifacts:
             chunk_count_expected += 1
             chunk_entries.append(storage_stage_artifact.destination_key)
             destination_uri = self.object_storage.build_uri(
                 self.storage_bucket,
                 storage_stage_artifact.destination_key,
             )
-            self._write_chunk_object(storage_stage_artifact.to_payload, destination_uri=destination_uri)
-            self._push_chunk_message(destination_uri)
-            written += 1
+            chunk_writes.append(
+                self._chunk_object_write(storage_stage_artifact.to_payload, destination_uri=destination_uri)
+            )
 
+        destination_uris = self._write_chunk_objects(chunk_writes)
+        written = len(destination_uris)
+        self._push_chunk_messages(destination_uris)
         return ChunkingExecutionMetadata(
             chunk_count_expected=chunk_count_expected,
             chunk_count_written=written,
             chunk_entries=chunk_entries,
         )
 
+    def _write_chunk_bundle(
+        self,
+        storage_stage_artifacts: list[StorageStageArtifact],
+        *,
+        doc_id: str,
+        run_id: str,
+    ) -> ChunkingExecutionMetadata:
+        """Write one bundle and its index for the run, then enqueue one chunk reference per chunk."""
+        if not storage_stage_artifacts:
+            return ChunkingExecutionMetadata(chunk_count_expected=0, chunk_count_written=0, chunk_entries=[])
+        bundle = ChunkBundle.from_artifacts([item.artifact for item in storage_stage_artifacts])
+        bundle_key = self._run_object_key(self.CHUNK_BUNDLE_KEY_PATTERN, doc_id=doc_id, run_id=run_id)
+        bundle_uri = self.object_storage.build_uri(self.storage_bucket, bundle_key)
+        index_uri = self.object_storage.build_uri(
+            self.storage_bucket,
+            self._run_object_key(self.CHUNK_BUNDLE_INDEX_KEY_PATTERN, doc_id=doc_id, run_id=run_id),
+        )
+        self._write_chunk_objects(
+            [
+                ObjectWrite(uri=bundle_uri, payload=bundle.payload, content_type="application/x-ndjson"),
+                self._chunk_object_write(bundle.index.to_dict, destination_uri=index_uri),
+            ]
+        )
+        chunk_refs = bundle.index.refs(bundle_uri)
+        self._push_chunk_messages([chunk_ref.uri for chunk_ref in chunk_refs])
+        return ChunkingExecutionMetadata(
+            chunk_count_expected=len(storage_stage_artifacts),
+            chunk_count_written=len(chunk_refs),
+            chunk_entries=[f"{bundle_key}#{chunk_ref.fragment}" for chunk_ref in chunk_refs],
+        )
+
     def _build_chunk_artifacts(
         self,
         *,
@@ -262,9 +312,13 @@ class ChunkTextProcessor(BaseProcessor):
         )
         return f"{self.output_prefix}{object_key}"
 
-    def _write_chunk_object(self, chunk_payload: dict[str, Any], *, destination_uri: str) -> None:
-        """Write one chunk artifact payload to object storage as canonical JSON."""
-        self.object_storage.write_object(
+    def _run_object_key(self, pattern: str, *, doc_id: str, run_id: str) -> str:
+        """Render the object-storage key of a per-run bundle object."""
+        return f"{self.output_prefix}{pattern.format(doc_id=doc_id, run_id=run_id)}"
+
+    def _chunk_object_write(self, chunk_payload: dict[str, Any], *, destination_uri: str) -> ObjectWrite:
+        """Serialize one chunk artifact payload as canonical JSON."""
+        return ObjectWrite(
             uri=destination_uri,
             payload=json.dumps(
                 chunk_payload,
@@ -275,10 +329,26 @@ class ChunkTextProcessor(BaseProcessor):
             content_type="application/json",
         )
 
-    def _push_chunk_message(self, destination_uri: str) -> None:
-        """Publish the written chunk URI to the downstream queue."""
-        self.queue_gateway.push(
+    def _write_chunk_objects(self, chunk_writes: list[ObjectWrite]) -> list[str]:
+        """Write chunk artifacts concurrently and return their URIs in chunk order.
+
+        Raises:
+            RuntimeError: When any chunk fails to write, so the message is not
+                acknowledged with a partial chunk set; rewrites are idempotent.
+        """
+        results = self.object_storage.write_many(chunk_writes)
+        failed = [result for result in results.values() if not result.ok]
+        if failed:
+            raise RuntimeError(
+                f"Failed to write {len(failed)} of {len(results)} chunk objects; first error: {failed[0].error}"
+            ) from failed[0].error
+        return [chunk_write.uri for chunk_write in chunk_writes]
+
+    def _push_chunk_messages(self, destination_uris: list[str]) -> None:
+        """Publish the written chunk URIs to the downstream queue in committed batches."""
+        self.queue_gateway.push_many(
             Envelope(
                 payload=destination_uri,
             ).to_payload
+            for destination_uri in destination_uris
         )
@@ -12,7 +12,8 @@ class ChunkingExecutionMetadata:
     Attributes:
         chunk_count_expected: Number of chunk artifacts the processor attempted to emit.
         chunk_count_written: Number of chunk artifacts successfully written.
-        chunk_entries: Destination keys written for the emitted chunk artifacts.
+        chunk_entries: Destination keys written for the emitted chunk artifacts
+            (``<bundle key>#<chunk reference>`` in bundle mode).
     """
 
     chunk_count_expected: int
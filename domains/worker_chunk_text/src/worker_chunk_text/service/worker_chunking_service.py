@@ -57,16 +57,19 @@ class WorkerChunkingService(WorkerService):
                 self._register_lineage_input(input_uri)
                 lineage_started = True
                 
-                process_result: ProcessResult = self._transform_source_to_chunks(input_uri)
+                with self._queue_gateway.lane_scope(message):
+                    process_result: ProcessResult = self._transform_source_to_chunks(input_uri)
 
                 self._write_manifest(process_result)
                 self._register_manifest_output_lineage()
             except Exception as exc:
                 if lineage_started:
                     self._lineage_gateway.fail_run(error_message=str(exc))
-                if message is not None:
-                    message.nack(requeue=False)
-                logger.exception("Chunking failed for input artifact")
+                if message is None:
+                    logger.exception("Chunking failed before a message was consumed")
+                    continue
+                message.retry(error=str(exc))
+                logger.exception("Chunking failed for input artifact on attempt %s; handed to retry policy", message.attempt)
                 continue
             message.ack()
 
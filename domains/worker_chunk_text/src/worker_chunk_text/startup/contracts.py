@@ -7,6 +7,9 @@ from typing import Any
 
 
 DEFAULT_MANIFEST_PREFIX = "07_metadata/manifest/"
+CHUNK_FORMAT_OBJECTS = "objects"
+CHUNK_FORMAT_BUNDLE = "bundle"
+CHUNK_FORMATS = (CHUNK_FORMAT_OBJECTS, CHUNK_FORMAT_BUNDLE)
 
 
 @dataclass(frozen=True)
@@ -17,19 +20,26 @@ class RawChunkStorageConfig:
         bucket: Bucket name used for both chunk and manifest writes.
         output_prefix: Base prefix where chunk artifacts should be written.
         manifest_prefix: Base prefix where manifests should be written.
+        chunk_format: ``objects`` (one object per chunk) or ``bundle`` (one
+            JSONL bundle plus offset index per run).
     """
 
     bucket: str
     output_prefix: str
     manifest_prefix: str
+    chunk_format: str = CHUNK_FORMAT_OBJECTS
 
     @classmethod
     def from_dict(cls, payload: dict[str, Any]) -> RawChunkStorageConfig:
         """Build raw storage paths from a dictionary payload."""
+        chunk_format = str(payload.get("chunk_format", CHUNK_FORMAT_OBJECTS))
+        if chunk_format not in CHUNK_FORMATS:
+            raise ValueError(f"job.storage.chunk_format must be one of {CHUNK_FORMATS}, got {chunk_format!r}")
         return cls(
             bucket=str(payload["bucket"]),
             output_prefix=str(payload["output_prefix"]),
             manifest_prefix=str(payload.get("manifest_prefix", DEFAULT_MANIFEST_PREFIX)),
+            chunk_format=chunk_format,
         )
 
 
@@ -41,11 +51,13 @@ class RuntimeChunkStorageConfig:
         bucket: Bucket name used for output writes.
         output_prefix: Environment-scoped chunk artifact prefix.
         manifest_prefix: Environment-scoped manifest prefix.
+        chunk_format: Chunk storage format, ``objects`` or ``bundle``.
     """
 
     bucket: str
     output_prefix: str
     manifest_prefix: str
+    chunk_format: str = CHUNK_FORMAT_OBJECTS
 
     @classmethod
     def from_raw(
@@ -67,6 +79,7 @@ class RuntimeChunkStorageConfig:
             bucket=raw.bucket,
             output_prefix=f"{env}/{raw.output_prefix}",
             manifest_prefix=f"{env}/{raw.manifest_prefix}",
+            chunk_format=raw.chunk_format,
         )
 
 
@@ -5,7 +5,7 @@ from pipeline_common.gateways.object_storage import ManifestWriter
 from pipeline_common.startup import WorkerRuntimeContext, WorkerServiceFactory
 from worker_chunk_text.processor.chunk_text import ChunkTextProcessor
 from worker_chunk_text.service.worker_chunking_service import WorkerChunkingService
-from worker_chunk_text.startup.contracts import RuntimeChunkJobConfig
+from worker_chunk_text.startup.contracts import CHUNK_FORMAT_BUNDLE, RuntimeChunkJobConfig
 
 
 class ChunkTextServiceFactory(WorkerServiceFactory[RuntimeChunkJobConfig, WorkerChunkingService]):
@@ -18,12 +18,19 @@ class ChunkTextServiceFactory(WorkerServiceFactory[RuntimeChunkJobConfig, Worker
     ) -> WorkerChunkingService:
         """Construct the service graph for the chunk-text worker."""
         chunking_resolver: ChunkingStagesResolver = ChunkingStagesResolver()
+        bundle_chunks = worker_config.storage.chunk_format == CHUNK_FORMAT_BUNDLE
+        if bundle_chunks and runtime.object_storage_gateway.compression.codec_for_key(worker_config.storage.output_prefix):
+            raise ValueError(
+                f"job.storage.chunk_format=bundle reads chunks by byte range, so {worker_config.storage.output_prefix!r} "
+                "must not be compressed by OBJECT_STORAGE_COMPRESSION"
+            )
 
         processor: ChunkTextProcessor = ChunkTextProcessor(
             object_storage=runtime.object_storage_gateway,
             queue_gateway=runtime.stage_queue_gateway,
             storage_bucket=worker_config.storage.bucket,
             output_prefix=worker_config.storage.output_prefix,
+            bundle_chunks=bundle_chunks,
         )
 
         manifest_writer: ManifestWriter = ManifestWriter(
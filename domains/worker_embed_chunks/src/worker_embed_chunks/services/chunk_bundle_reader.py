@@ -0,0 +1,80 @@
+"""Range reads of chunks packed in per-run chunk bundles."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+from pipeline_common.gateways.object_storage import ObjectResult, ObjectStorageGateway
+from pipeline_common.stages_contracts import ChunkBundleRef
+from pipeline_common.stages_contracts.chunk_bundle import rebuild_chunk_payload
+
+
+class ChunkBundleReader:
+    """Fetch bundled chunks by byte range and rebuild their per-chunk payloads.
+
+    Each bundle in a batch costs one header read plus one read per run of
+    adjacent chunk lines, so the consecutive chunks one chunking run
+    publishes are fetched together; bundles are read concurrently.
+    """
+
+    def __init__(self, object_storage: ObjectStorageGateway) -> None:
+        """Initialize the reader over the gateway that stores the bundles."""
+        self._storage_gateway = object_storage
+
+    def read(self, chunk_ref: ChunkBundleRef) -> bytes:
+        """Read one chunk with a header range read and a chunk range read."""
+        result = self._read_bundle(chunk_ref.bundle_uri, [chunk_ref])[0]
+        if result.error is not None:
+            raise result.error
+        return result.payload
+
+    def read_many(self, chunk_refs: Iterable[ChunkBundleRef]) -> dict[str, ObjectResult]:
+        """Read chunks grouped by bundle; one failed bundle does not fail the others.
+
+        Returns:
+            One ``ObjectResult`` per chunk reference, keyed by ``ChunkBundleRef.uri``.
+        """
+        refs_by_bundle: dict[str, list[ChunkBundleRef]] = defaultdict(list)
+        for chunk_ref in dict.fromkeys(chunk_refs):
+            refs_by_bundle[chunk_ref.bundle_uri].append(chunk_ref)
+        if not refs_by_bundle:
+            return {}
+        max_workers = min(len(refs_by_bundle), self._storage_gateway.client.max_concurrency)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            grouped = list(executor.map(lambda item: self._read_bundle(*item), refs_by_bundle.items()))
+        return {result.uri: result for results in grouped for result in results}
+
+    def _read_bundle(self, bundle_uri: str, chunk_refs: list[ChunkBundleRef]) -> list[ObjectResult]:
+        try:
+            header_line = self._storage_gateway.read_range(bundle_uri, chunk_refs[0].header_range)
+        except Exception as exc:
+            return [ObjectResult(uri=chunk_ref.uri, error=exc) for chunk_ref in chunk_refs]
+        results: list[ObjectResult] = []
+        for span in self._adjacent_spans(chunk_refs):
+            start, end = span[0].offset, span[-1].offset + span[-1].length
+            try:
+                body = self._storage_gateway.read_range(bundle_uri, (start, end - 1))
+            except Exception as exc:
+                results.extend(ObjectResult(uri=chunk_ref.uri, error=exc) for chunk_ref in span)
+                continue
+            for chunk_ref in span:
+                chunk_line = body[chunk_ref.offset - start : chunk_ref.offset - start + chunk_ref.length]
+                try:
+                    results.append(ObjectResult(uri=chunk_ref.uri, payload=rebuild_chunk_payload(header_line, chunk_line)))
+                except Exception as exc:
+                    results.append(ObjectResult(uri=chunk_ref.uri, error=exc))
+        return results
+
+    @staticmethod
+    def _adjacent_spans(chunk_refs: list[ChunkBundleRef]) -> list[list[ChunkBundleRef]]:
+        """Group references whose chunk lines are contiguous in the bundle."""
+        spans: list[list[ChunkBundleRef]] = []
+        for chunk_ref in sorted(chunk_refs, key=lambda item: item.offset):
+            previous = spans[-1][-1] if spans else None
+            if previous is not None and previous.offset + previous.length == chunk_ref.offset:
+                spans[-1].append(chunk_ref)
+            else:
+                spans.append([chunk_ref])
+        return spans
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
 
 from ai_infra.retrieval.deterministic_hash_embedder import (
@@ -13,6 +14,7 @@ from pipeline_common.gateways.object_storage import ObjectStorageGateway
 from pipeline_common.helpers.run_ids import build_source_run_id
 from pipeline_common.provenance import embedding_params_hash
 from pipeline_common.stages_contracts import (
+    ChunkBundleRef,
     EmbeddingArtifact,
     EmbeddingArtifactMetadata,
     FileMetadata,
@@ -24,6 +26,7 @@ from pipeline_common.stages_contracts.step_00_common import ProcessorMetadata
 
 EMBEDDER_NAME = "deterministic_sha256"
 EMBEDDER_VERSION = "1.0.0"
+EXISTING_KEYS_CACHE_DOCS = 128
 
 
 @dataclass(frozen=True)
@@ -69,7 +72,14 @@ class ChunkArtifactPayload:
 
 
 class EmbedChunksProcessor:
-    """Build embedding payloads from chunk payloads and write outputs."""
+    """Build embedding payloads from chunk payloads and write outputs.
+
+    Embedding keys are deterministic per chunk, so writes are create-once:
+    each document's embedding prefix is listed once (then tracked for the
+    most recent ``EXISTING_KEYS_CACHE_DOCS`` documents) to skip chunks that
+    were already embedded, and the write itself is a conditional
+    ``write_if_absent`` instead of HEAD-then-PUT.
+    """
 
     def __init__(
         self,
@@ -84,6 +94,7 @@ class EmbedChunksProcessor:
         self._storage_gateway = object_storage
         self._storage_bucket = storage_bucket
         self._output_prefix = output_prefix
+        self._existing_keys_by_doc: OrderedDict[str, set[str]] = OrderedDict()
 
     @staticmethod
     def read_chunk_payload(raw_payload: bytes, *, source_uri: str) -> ChunkArtifactPayload:
@@ -92,17 +103,28 @@ class EmbedChunksProcessor:
         artifact = StageArtifact.from_dict(payload)
         return ChunkArtifactPayload.from_stage_artifact(artifact, source_uri=source_uri)
 
+    @staticmethod
+    def chunk_source_uri(input_uri: str) -> str:
+        """Return the per-chunk object URI behind ``input_uri``, resolving bundle references."""
+        chunk_ref = ChunkBundleRef.parse(input_uri)
+        return input_uri if chunk_ref is None else chunk_ref.chunk_uri
+
     def process(
         self,
         *,
         input_uri: str,
         raw_payload: bytes,
     ) -> ProcessResult:
-        """Build one embedding artifact and return the process result."""
-        chunk_payload = self.read_chunk_payload(raw_payload, source_uri=input_uri)
-        run_id = build_source_run_id(input_uri)
+        """Build one embedding artifact and return the process result.
+
+        Provenance of a bundled chunk is derived from its per-chunk object URI
+        (``ChunkBundleRef.chunk_uri``), not from the bundle reference.
+        """
+        source_uri = self.chunk_source_uri(input_uri)
+        chunk_payload = self.read_chunk_payload(raw_payload, source_uri=source_uri)
+        run_id = build_source_run_id(source_uri)
         stage_doc_metadata = FileMetadata.from_source_bytes(
-            uri=input_uri,
+            uri=source_uri,
             payload=raw_payload,
             default_content_type="application/json",
         )
@@ -133,7 +155,12 @@ class EmbedChunksProcessor:
         embedding_run_id: str,
         stage_doc_metadata: FileMetadata,
     ) -> EmbeddingWriteResult:
-        """Write one embedding artifact for the provided chunk payload."""
+        """Write one embedding artifact for the provided chunk payload unless it already exists."""
+        doc_id = payload.root_doc_metadata.doc_id
+        chunk_id = payload.chunk_record.chunk_id
+        destination_key = self._embedding_object_key(doc_id, chunk_id)
+        if destination_key in self._existing_keys(doc_id):
+            return EmbeddingWriteResult(destination_key=destination_key, doc_id=doc_id, chunk_id=chunk_id, wrote=False)
         embedding_payload = self._build_embedding_payload(
             payload,
             run_id=run_id,
@@ -143,14 +170,12 @@ class EmbedChunksProcessor:
         return self._write_embedding_payload(embedding_payload)
 
     def _write_embedding_payload(self, embedding_artifact: EmbeddingArtifact) -> EmbeddingWriteResult:
-        """Persist one embedding payload if it does not already exist."""
+        """Persist one embedding payload with a conditional write; an existing object is left untouched."""
         doc_id = embedding_artifact.doc_id
         chunk_id = embedding_artifact.chunk_id
         destination_key = self._embedding_object_key(doc_id, chunk_id)
         destination_uri = self._storage_gateway.build_uri(self._storage_bucket, destination_key)
-        if self._storage_gateway.object_exists(self._storage_bucket, destination_key):
-            return EmbeddingWriteResult(destination_key=destination_key, doc_id=doc_id, chunk_id=chunk_id, wrote=False)
-        self._storage_gateway.write_object(
+        wrote = self._storage_gateway.write_if_absent(
             uri=destination_uri,
             payload=json.dumps(
                 embedding_artifact.to_dict,
@@ -160,7 +185,20 @@ class EmbedChunksProcessor:
             ).encode("utf-8"),
             content_type="application/json",
         )
-        return EmbeddingWriteResult(destination_key=destination_key, doc_id=doc_id, chunk_id=chunk_id, wrote=True)
+        self._existing_keys(doc_id).add(destination_key)
+        return EmbeddingWriteResult(destination_key=destination_key, doc_id=doc_id, chunk_id=chunk_id, wrote=wrote)
+
+    def _existing_keys(self, doc_id: str) -> set[str]:
+        """Return the known embedding keys of ``doc_id``, listing its prefix on first use."""
+        existing_keys = self._existing_keys_by_doc.get(doc_id)
+        if existing_keys is not None:
+            self._existing_keys_by_doc.move_to_end(doc_id)
+            return existing_keys
+        existing_keys = self._storage_gateway.existing_keys(self._storage_bucket, f"{self._output_prefix}{doc_id}/")
+        self._existing_keys_by_doc[doc_id] = existing_keys
+        while len(self._existing_keys_by_doc) > EXISTING_KEYS_CACHE_DOCS:
+            self._existing_keys_by_doc.popitem(last=False)
+        return existing_keys
 
     def _build_embedding_payload(
         self,
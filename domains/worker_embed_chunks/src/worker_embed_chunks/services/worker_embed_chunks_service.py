@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 
 from pipeline_common.gateways.lineage import DatasetPlatform, LineageRuntimeGateway
-from pipeline_common.gateways.object_storage import ObjectStorageGateway
-from pipeline_common.gateways.queue import ConsumedMessage, Envelope, QueueGateway
-from pipeline_common.stages_contracts import ProcessResult
+from pipeline_common.gateways.object_storage import ObjectResult, ObjectStorageGateway
+from pipeline_common.gateways.queue import ConsumedBatch, ConsumedMessage, Envelope, QueueGateway
+from pipeline_common.stages_contracts import ChunkBundleRef, ProcessResult
 from pipeline_common.startup.contracts import WorkerService
+from worker_embed_chunks.services.chunk_bundle_reader import ChunkBundleReader
 from worker_embed_chunks.services.embed_flow import EmbedWorkItem
 from worker_embed_chunks.services.embed_chunks_processor import EmbedChunksProcessor
 
@@ -16,7 +18,13 @@ logger = logging.getLogger(__name__)
 
 
 class WorkerEmbedChunksService(WorkerService):
-    """Transform chunk artifacts into embedding payloads."""
+    """Transform chunk artifacts into embedding payloads.
+
+    Inbound URIs are either per-chunk objects or ``ChunkBundleRef`` URIs
+    into a per-run chunk bundle; bundled chunks are fetched by byte range.
+    Index requests for a batch are published per lane with one ``push_many``
+    before the batch is settled.
+    """
 
     def __init__(
         self,
@@ -33,31 +41,127 @@ class WorkerEmbedChunksService(WorkerService):
         self._lineage_gateway = lineage
         self._poll_interval_seconds = poll_interval_seconds
         self._processor = processor
+        self._bundle_reader = ChunkBundleReader(object_storage)
 
     def serve(self) -> None:
-        """Run the embedding worker loop by polling queue messages."""
+        """Run the embedding worker loop over batches of queue messages."""
         while True:
-            message: ConsumedMessage | None = None
-            lineage_started = False
             try:
-                message = self._queue_gateway.wait_for_message(
+                batch: ConsumedBatch = self._queue_gateway.wait_for_batch(
                     poll_interval_seconds=self._poll_interval_seconds,
                 )
-                work_item = self._work_item_from_message(message)
-                self._register_lineage_input(work_item.uri)
-                lineage_started = True
-                process_result: ProcessResult = self._transform_chunk_to_embeddings(work_item.uri)
-                output_uri = self._output_uri_from_process_result(process_result)
-                self._enqueue_embeddings_object(output_uri)
-                self._register_embedding_output_lineage(output_uri)
+            except Exception:
+                logger.exception("Failed to pop embedding batch")
+                continue
+            try:
+                self._process_batch(batch)
+            except Exception:
+                logger.exception("Failed to settle embedding batch of %s messages; it will be redelivered", len(batch))
+            self._flush_lineage()
+
+    def _process_batch(self, batch: ConsumedBatch) -> None:
+        """Embed one batch, publish its index requests, then settle it.
+
+        Messages whose retry hand-off failed are requeued instead of acked.
+        """
+        try:
+            prefetched = self._prefetch_chunk_objects(batch)
+        except Exception:
+            logger.exception("Chunk prefetch failed; reading chunk artifacts one by one")
+            prefetched = {}
+        unsettled: list[ConsumedMessage] = []
+        outputs_by_lane: dict[str | None, list[tuple[ConsumedMessage, str]]] = defaultdict(list)
+        for message in batch:
+            try:
+                output_uri = self._process_message(message, prefetched)
             except Exception as exc:
-                if lineage_started:
-                    self._lineage_gateway.fail_run(error_message=str(exc))
-                if message is not None:
-                    message.nack(requeue=True)
-                logger.exception("Embedding failed for input artifact")
+                logger.exception("Embedding failed for input artifact on attempt %s; handed to retry policy", message.attempt)
+                if not self._hand_to_retry(message, str(exc)):
+                    unsettled.append(message)
                 continue
-            message.ack()
+            outputs_by_lane[message.lane].append((message, output_uri))
+        for lane, outputs in outputs_by_lane.items():
+            unsettled.extend(self._publish_embedding_outputs(lane, outputs))
+        batch.settle(failed=unsettled, requeue=True)
+
+    def _prefetch_chunk_objects(self, batch: ConsumedBatch) -> dict[str, ObjectResult]:
+        """Read every chunk artifact of the batch concurrently; malformed messages are skipped here."""
+        uris: list[str] = []
+        chunk_refs: list[ChunkBundleRef] = []
+        for message in batch:
+            try:
+                uri = self._work_item_from_message(message).uri
+                chunk_ref = ChunkBundleRef.parse(uri)
+            except Exception:
+                continue
+            if chunk_ref is None:
+                uris.append(uri)
+            else:
+                chunk_refs.append(chunk_ref)
+        return {
+            **self._storage_gateway.read_many(uris),
+            **self._bundle_reader.read_many(chunk_refs),
+        }
+
+    def _process_message(self, message: ConsumedMessage, prefetched: dict[str, ObjectResult]) -> str:
+        """Embed one chunk message and record its lineage run.
+
+        Returns:
+            URI of the embedding artifact to publish downstream.
+        """
+        work_item = self._work_item_from_message(message)
+        self._register_lineage_input(work_item.uri)
+        try:
+            process_result: ProcessResult = self._transform_chunk_to_embeddings(
+                work_item.uri,
+                prefetched.get(work_item.uri),
+            )
+            output_uri = self._output_uri_from_process_result(process_result)
+            self._register_embedding_output_lineage(output_uri)
+        except Exception as exc:
+            try:
+                self._lineage_gateway.fail_run(error_message=str(exc))
+            except Exception:
+                logger.exception("Could not record failed embedding run in lineage")
+            raise
+        return output_uri
+
+    def _publish_embedding_outputs(
+        self,
+        lane: str | None,
+        outputs: list[tuple[ConsumedMessage, str]],
+    ) -> list[ConsumedMessage]:
+        """Publish one lane's embedding URIs with a single ``push_many``; a failed publish retries every message.
+
+        Part of the lane may already be published when ``push_many`` raises;
+        those index requests are published again when the messages are retried.
+
+        Returns:
+            Messages that could not be handed to the retry policy.
+        """
+        try:
+            with self._queue_gateway.lane_scope(lane):
+                self._queue_gateway.push_many(Envelope(payload=uri).to_payload for _, uri in outputs)
+        except Exception as exc:
+            logger.exception("Publishing %d embedding object(s) failed; handing their messages to retry policy", len(outputs))
+            return [message for message, _ in outputs if not self._hand_to_retry(message, f"Publish failed: {exc}")]
+        return []
+
+    def _hand_to_retry(self, message: ConsumedMessage, error: str) -> bool:
+        """Route a failed message through the queue retry policy; ``False`` when the hand-off failed."""
+        try:
+            message.retry(error=error)
+        except Exception:
+            logger.exception("Could not hand embedding message to the retry policy; requeueing it")
+            return False
+        return True
+
+    def _flush_lineage(self) -> None:
+        """Emit the lineage run aggregated over the batch; a lineage failure never stops the worker."""
+        try:
+            self._lineage_gateway.flush()
+        except Exception:
+            logger.exception("Failed to flush lineage after embedding batch")
 
     def _register_lineage_input(self, uri: str) -> None:
         """Start a lineage run and register the source chunk artifact."""
@@ -75,19 +179,22 @@ class WorkerEmbedChunksService(WorkerService):
         )
         self._lineage_gateway.complete_run()
 
-    def _transform_chunk_to_embeddings(self, input_uri: str) -> ProcessResult:
-        """Read one chunk artifact and build the embedding process result."""
-        raw_payload = self._storage_gateway.read_object(uri=input_uri)
+    def _transform_chunk_to_embeddings(self, input_uri: str, prefetched: ObjectResult | None = None) -> ProcessResult:
+        """Build the embedding process result from a prefetched chunk artifact, reading it if the prefetch failed."""
+        if prefetched is not None and prefetched.ok:
+            raw_payload = prefetched.payload
+        else:
+            raw_payload = self._read_chunk_object(input_uri)
         process_result = self._processor.process(input_uri=input_uri, raw_payload=raw_payload)
         logger.info("Wrote embedding object '%s'", process_result.result["destination_key"])
         return process_result
 
-    def _enqueue_embeddings_object(self, uri: str) -> None:
-        self._queue_gateway.push(
-            Envelope(
-                payload=uri,
-            ).to_payload
-        )
+    def _read_chunk_object(self, uri: str) -> bytes:
+        """Read one chunk artifact, by range when the URI references a chunk bundle."""
+        chunk_ref = ChunkBundleRef.parse(uri)
+        if chunk_ref is None:
+            return self._storage_gateway.read_object(uri=uri)
+        return self._bundle_reader.read(chunk_ref)
 
     def _output_uri_from_process_result(self, process_result: ProcessResult) -> str:
         """Extract the written output URI from the process result."""
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+
+from pipeline_common.gateways.object_storage import LocalFileSystemClient, ObjectStorageGateway
+from pipeline_common.stages_contracts import ChunkBundleIndex, ChunkBundleRef
+from pipeline_common.stages_contracts.chunk_bundle import ChunkBundleEntry
+
+from worker_embed_chunks.services.chunk_bundle_reader import ChunkBundleReader
+
+_HEADER = {"format": "chunk-bundle/1", "metadata": {"processor": {"name": "chunker"}}}
+
+
+class _CountingGateway(ObjectStorageGateway):
+    def __init__(self, client: LocalFileSystemClient) -> None:
+        super().__init__(client)
+        self.ranges: list[tuple[int, int]] = []
+
+    def read_range(self, uri: str, byte_range: tuple[int, int]) -> bytes:
+        self.ranges.append(byte_range)
+        return super().read_range(uri, byte_range)
+
+
+def _line(payload: dict) -> bytes:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+class ChunkBundleReaderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._root = tempfile.TemporaryDirectory()
+        client = LocalFileSystemClient(root=self._root.name)
+        client.create_bucket("pipeline")
+        self.gateway = _CountingGateway(client)
+        self.bundle_uri = self.gateway.build_uri("pipeline", "dev/03_chunks/doc-1/run-1/chunks.bundle.jsonl")
+        header_line = _line(_HEADER)
+        lines = [header_line]
+        entries = []
+        offset = len(header_line)
+        for index in range(5):
+            line = _line({"content_metadata": {"chunk_id": f"c-{index}"}, "content": {"text": f"chunk {index}"}})
+            entries.append(ChunkBundleEntry(f"c-{index}", offset, len(line)))
+            lines.append(line)
+            offset += len(line)
+        self.gateway.write_object(self.bundle_uri, b"".join(lines), content_type="application/x-ndjson")
+        self.refs = ChunkBundleIndex(header_length=len(header_line), chunks=tuple(entries)).refs(self.bundle_uri)
+
+    def tearDown(self) -> None:
+        self._root.cleanup()
+
+    def test_adjacent_chunks_share_one_range_read(self) -> None:
+        wanted = [self.refs[2], self.refs[0], self.refs[4], self.refs[1]]
+
+        results = ChunkBundleReader(self.gateway).read_many(wanted)
+
+        self.assertEqual(len(self.gateway.ranges), 3)
+        self.assertIn((self.refs[0].offset, self.refs[2].offset + self.refs[2].length - 1), self.gateway.ranges)
+        self.assertIn(self.refs[4].chunk_range, self.gateway.ranges)
+        self.assertEqual(set(results), {ref.uri for ref in wanted})
+        for ref in wanted:
+            payload = json.loads(results[ref.uri].payload)
+            self.assertEqual(payload["metadata"], {**_HEADER["metadata"], "content_metadata": {"chunk_id": ref.chunk_id}})
+            self.assertEqual(payload["content"], {"text": f"chunk {ref.chunk_id[2:]}"})
+
+    def test_missing_bundle_fails_only_its_chunks(self) -> None:
+        missing = ChunkBundleRef(
+            bundle_uri=self.gateway.build_uri("pipeline", "dev/03_chunks/doc-2/run-1/chunks.bundle.jsonl"),
+            chunk_id="c-0",
+            header_length=self.refs[0].header_length,
+            offset=self.refs[0].offset,
+            length=self.refs[0].length,
+        )
+
+        results = ChunkBundleReader(self.gateway).read_many([missing, self.refs[3]])
+
+        self.assertIsNotNone(results[missing.uri].error)
+        self.assertIsNone(results[self.refs[3].uri].error)
+        self.assertEqual(ChunkBundleReader(self.gateway).read(self.refs[3]), results[self.refs[3].uri].payload)
+
+    def test_adjacent_spans_group_contiguous_lines_in_offset_order(self) -> None:
+        spans = ChunkBundleReader._adjacent_spans([self.refs[4], self.refs[1], self.refs[0], self.refs[3]])
+
+        self.assertEqual(
+            [[ref.chunk_id for ref in span] for span in spans],
+            [["c-0", "c-1"], ["c-3", "c-4"]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
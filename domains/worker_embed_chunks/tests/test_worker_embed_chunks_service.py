@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from types import SimpleNamespace
+from typing import Any, Iterable
+
+from pipeline_common.gateways.object_storage import LocalFileSystemClient, ObjectStorageGateway
+from pipeline_common.gateways.queue import Envelope, InMemoryBroker, InMemoryQueueBackend, QueueGateway
+
+from worker_embed_chunks.services.worker_embed_chunks_service import WorkerEmbedChunksService
+
+_QUEUE_CONFIG = {
+    "consume": "embed",
+    "produce": "index",
+    "dlq": "embed.dlq",
+    "batch_size": 4,
+    "lanes": {"high": {"weight": 3}, "low": {"weight": 1}},
+    "default_lane": "low",
+    "retry": {"max_attempts": "3", "initial_delay_seconds": "30"},
+}
+
+
+class _RecordingQueueGateway(QueueGateway):
+    def __init__(self, broker: InMemoryBroker, *, fail_publish: bool = False) -> None:
+        super().__init__(InMemoryQueueBackend(broker), _QUEUE_CONFIG)
+        self.fail_publish = fail_publish
+        self.published: list[tuple[str | None, int]] = []
+
+    def push_many(self, payloads: Iterable[dict[str, Any]], *, batch_size: int | None = None) -> int:
+        payloads = list(payloads)
+        self.published.append((self._outbound_lane, len(payloads)))
+        if self.fail_publish:
+            raise ConnectionError("channel closed")
+        return super().push_many(payloads, batch_size=batch_size)
+
+
+class _NullLineage:
+    def __init__(self) -> None:
+        self.completed = 0
+
+    def start_run(self) -> None:
+        pass
+
+    def add_input(self, name: str, platform: Any) -> str:
+        return name
+
+    def add_output(self, name: str, platform: Any) -> str:
+        return name
+
+    def complete_run(self) -> str:
+        self.completed += 1
+        return "urn"
+
+    def fail_run(self, error_message: str | None) -> str:
+        return "urn"
+
+    def flush(self) -> None:
+        pass
+
+
+class _FakeProcessor:
+    def process(self, *, input_uri: str, raw_payload: bytes) -> SimpleNamespace:
+        output_uri = input_uri.replace("04_chunks", "05_embeddings")
+        return SimpleNamespace(result={"output_uri": output_uri, "destination_key": output_uri})
+
+
+class WorkerEmbedChunksServiceTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._root = tempfile.TemporaryDirectory()
+        client = LocalFileSystemClient(root=self._root.name)
+        client.create_bucket("pipeline")
+        self.storage = ObjectStorageGateway(client)
+        self.broker = InMemoryBroker()
+        self.observer = InMemoryQueueBackend(self.broker)
+        producer = QueueGateway(InMemoryQueueBackend(self.broker), {**_QUEUE_CONFIG, "produce": "embed"})
+        payloads = []
+        for index, lane in enumerate(["high", "low", "high", "low"]):
+            uri = self.storage.build_uri("pipeline", f"dev/04_chunks/doc-1/c-{index}.json")
+            self.storage.write_object(uri, b"{}", content_type="application/json")
+            payloads.append(Envelope(payload=uri, meta={"lane": lane}).to_payload)
+        producer.push_many(payloads)
+
+    def tearDown(self) -> None:
+        self._root.cleanup()
+
+    def _process_one_batch(self, stage_queue: _RecordingQueueGateway) -> _NullLineage:
+        lineage = _NullLineage()
+        service = WorkerEmbedChunksService(
+            stage_queue=stage_queue,
+            object_storage=self.storage,
+            lineage=lineage,
+            poll_interval_seconds=0,
+            processor=_FakeProcessor(),
+        )
+        batch = stage_queue.pop_batch(max_wait=0.1)
+        self.assertEqual(len(batch), 4)
+        service._process_batch(batch)
+        return lineage
+
+    def test_batch_outputs_are_published_once_per_lane(self) -> None:
+        stage_queue = _RecordingQueueGateway(self.broker)
+
+        lineage = self._process_one_batch(stage_queue)
+
+        self.assertEqual(sorted(stage_queue.published), [("high", 2), ("low", 2)])
+        self.assertEqual((self.observer.queue_depth("index.high"), self.observer.queue_depth("index")), (2, 2))
+        self.assertEqual(stage_queue.backend._unacked, {})
+        self.assertEqual(lineage.completed, 4)
+
+    def test_failed_publish_hands_every_message_of_the_lane_to_retry(self) -> None:
+        stage_queue = _RecordingQueueGateway(self.broker, fail_publish=True)
+
+        with self.assertLogs("worker_embed_chunks.services.worker_embed_chunks_service", level="ERROR"):
+            self._process_one_batch(stage_queue)
+
+        delay_queues = [stage_queue.retry_policy.delay_queue_name(queue, 1) for queue in ("embed", "embed.high")]
+        self.assertEqual([self.observer.queue_depth(queue) for queue in delay_queues], [2, 2])
+        self.assertEqual(stage_queue.backend._unacked, {})
+        self.assertEqual(self.observer.queue_depth("index") + self.observer.queue_depth("index.high"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from dataclasses import asdict, dataclass
 
-from pipeline_common.gateways.object_storage import ObjectStorageGateway
+from pipeline_common.gateways.object_storage import ObjectResult, ObjectStorageGateway, ObjectWrite
 
 
 @dataclass(frozen=True)
@@ -48,12 +48,25 @@ class IndexStatusWriter:
         """Write one index status payload to object storage."""
         self._object_storage.write_object(
             uri=self.output_uri(destination_key),
-            payload=json.dumps(payload.to_dict, sort_keys=True, ensure_ascii=True, separators=(",", ":")).encode(
-                "utf-8"
-            ),
+            payload=self._encode(payload),
             content_type="application/json",
         )
 
+    def write_many(self, payloads: dict[str, IndexStatusArtifact]) -> dict[str, ObjectResult]:
+        """Write index status payloads keyed by destination key concurrently.
+
+        Returns:
+            One ``ObjectResult`` per written object, keyed by output URI.
+        """
+        return self._object_storage.write_many(
+            ObjectWrite(uri=self.output_uri(destination_key), payload=self._encode(payload), content_type="application/json")
+            for destination_key, payload in payloads.items()
+        )
+
     def output_uri(self, destination_key: str) -> str:
         """Build the storage URI for a written index status payload."""
         return self._object_storage.build_uri(self._storage_bucket, destination_key)
+
+    @staticmethod
+    def _encode(payload: IndexStatusArtifact) -> bytes:
+        return json.dumps(payload.to_dict, sort_keys=True, ensure_ascii=True, separators=(",", ":")).encode("utf-8")
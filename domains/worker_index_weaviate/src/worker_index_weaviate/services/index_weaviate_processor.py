@@ -10,7 +10,7 @@ from pipeline_common.gateways.object_storage import ObjectStorageGateway
 from pipeline_common.stages_contracts import EmbeddingArtifact, ProcessResult, ProcessorContext
 from pipeline_common.stages_contracts.step_00_common import ProcessorMetadata
 from worker_index_weaviate.services.index_flow import IndexStatusArtifact, IndexStatusWriter
-from worker_index_weaviate.services.weaviate_gateway import upsert_chunk, verify_query
+from worker_index_weaviate.services.weaviate_gateway import upsert_chunks, verify_query
 
 logger = logging.getLogger(__name__)
 
@@ -49,14 +49,65 @@ class IndexWeaviateProcessor:
         raw_payload: bytes,
     ) -> ProcessResult:
         """Index one embeddings artifact and build the process result."""
-        payload = self.read_embeddings_payload(raw_payload)
-        resolved_doc_id = payload.doc_id
-        resolved_chunk_id = payload.chunk_id
-        destination_key = self.build_indexed_key(resolved_doc_id, resolved_chunk_id)
-        self._upsert_embeddings(payload)
-        self._write_index_status(destination_key, resolved_doc_id, resolved_chunk_id)
+        outcome = self.process_many([(input_uri, raw_payload)])[input_uri]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def process_many(self, items: list[tuple[str, bytes]]) -> dict[str, ProcessResult | Exception]:
+        """Index many embeddings artifacts with one Weaviate batch request.
+
+        Status objects of the indexed artifacts are written concurrently and
+        the verification query runs once per call.
+
+        Args:
+            items: ``(input_uri, raw_payload)`` pairs.
+
+        Returns:
+            One ``ProcessResult``, or the exception that failed it, per input URI.
+        """
+        outcomes: dict[str, ProcessResult | Exception] = {}
+        payloads: dict[str, EmbeddingArtifact] = {}
+        for input_uri, raw_payload in items:
+            try:
+                payloads[input_uri] = self.read_embeddings_payload(raw_payload)
+            except Exception as exc:
+                outcomes[input_uri] = exc
+        upsert_items = [
+            (input_uri, item) for input_uri, payload in payloads.items() for item in self.build_upsert_items(payload)
+        ]
+        try:
+            upsert_errors = upsert_chunks(self._weaviate_url, [item for _, item in upsert_items])
+        except Exception as exc:
+            return {**outcomes, **{input_uri: exc for input_uri in payloads}}
+        for (input_uri, item), upsert_error in zip(upsert_items, upsert_errors):
+            if upsert_error is not None and input_uri not in outcomes:
+                outcomes[input_uri] = RuntimeError(f"Weaviate rejected chunk '{item['chunk_id']}': {upsert_error}")
+        indexed = {input_uri: payload for input_uri, payload in payloads.items() if input_uri not in outcomes}
+        destination_keys = {
+            input_uri: self.build_indexed_key(payload.doc_id, payload.chunk_id) for input_uri, payload in indexed.items()
+        }
+        write_results = self._status_writer.write_many(
+            {
+                destination_keys[input_uri]: self.build_index_status_payload(payload.doc_id, payload.chunk_id)
+                for input_uri, payload in indexed.items()
+            }
+        )
+        for input_uri, payload in indexed.items():
+            destination_key = destination_keys[input_uri]
+            write_result = write_results[self._status_writer.output_uri(destination_key)]
+            if write_result.error is not None:
+                outcomes[input_uri] = write_result.error
+            else:
+                outcomes[input_uri] = self._process_result(input_uri, payload, destination_key)
+        if indexed:
+            self._log_verification(len(indexed))
+        return outcomes
+
+    def _process_result(self, input_uri: str, payload: EmbeddingArtifact, destination_key: str) -> ProcessResult:
+        """Build the process result of one indexed embeddings artifact."""
         return ProcessResult(
-            run_id=resolved_chunk_id or resolved_doc_id,
+            run_id=payload.chunk_id or payload.doc_id,
             root_doc_metadata=payload.metadata.root_doc_metadata,
             stage_doc_metadata=payload.metadata.stage_doc_metadata,
             input_uri=input_uri,
@@ -104,25 +155,11 @@ class IndexWeaviateProcessor:
         """Build the storage payload for one successful indexing status."""
         return IndexStatusArtifact(doc_id=doc_id, status="indexed", chunk_id=chunk_id)
 
-    def _upsert_embeddings(self, payload: EmbeddingArtifact) -> None:
-        """Upsert the embedding records into Weaviate."""
-        items = self.build_upsert_items(payload)
-        for item in items:
-            properties = dict(item.get("properties", {}))
-            vector = list(item.get("vector", []))
-            chunk_id = str(item["chunk_id"])
-            upsert_chunk(
-                self._weaviate_url,
-                chunk_id=chunk_id,
-                vector=vector,
-                properties=properties,
-            )
-
-    def _write_index_status(self, destination_key: str, doc_id: str, chunk_id: str) -> None:
-        """Write the index status artifact and log a verification query."""
-        self._status_writer.write(
-            destination_key=destination_key,
-            payload=self.build_index_status_payload(doc_id, chunk_id),
-        )
-        result = verify_query(self._weaviate_url, "logistics")
-        logger.info("Indexed doc_id '%s' verify=%s", doc_id, bool(result))
+    def _log_verification(self, indexed_count: int) -> None:
+        """Log a verification query after a batch was indexed; a failed query does not fail the batch."""
+        try:
+            result = verify_query(self._weaviate_url, "logistics")
+        except Exception as exc:
+            logger.warning("Indexed %s artifacts; verification query failed: %s", indexed_count, exc)
+            return
+        logger.info("Indexed %s artifacts verify=%s", indexed_count, bool(result))
@@ -4,7 +4,7 @@ from typing import Any
 from urllib import error, request
 
 
-def _http_json(url: str, method: str, payload: dict[str, Any] | None = None) -> dict[str, Any]:
+def _http_json(url: str, method: str, payload: dict[str, Any] | None = None) -> Any:
     """Internal helper for http json."""
     data = None
     headers = {"Content-Type": "application/json"}
@@ -83,6 +83,36 @@ def upsert_chunk(weaviate_url: str, *, chunk_id: str, vector: list[float], prope
     _http_json(update_url, "PUT", payload)
 
 
+def upsert_chunks(weaviate_url: str, chunks: list[dict[str, Any]]) -> list[str | None]:
+    """Upsert many chunks with one batch request.
+
+    Weaviate's batch import replaces objects whose id already exists, so no
+    create-then-update fallback is needed.
+
+    Args:
+        weaviate_url: Weaviate base URL.
+        chunks: Items with ``chunk_id``, ``vector`` and ``properties``.
+
+    Returns:
+        One error message, or ``None`` on success, per chunk in input order.
+    """
+    if not chunks:
+        return []
+    objects = [
+        {
+            "class": "DocumentChunk",
+            "id": _stable_uuid_from_chunk_id(str(chunk["chunk_id"])),
+            "vector": chunk["vector"],
+            "properties": chunk["properties"],
+        }
+        for chunk in chunks
+    ]
+    response = _http_json(f"{weaviate_url.rstrip('/')}/v1/batch/objects", "POST", {"objects": objects})
+    if not isinstance(response, list) or len(response) != len(objects):
+        raise RuntimeError(f"Unexpected Weaviate batch response for {len(objects)} objects")
+    return [_batch_object_error(item) for item in response]
+
+
 def verify_query(weaviate_url: str, phrase: str) -> dict[str, Any]:
     """Execute verify query."""
     url = f"{weaviate_url.rstrip('/')}/v1/graphql"
@@ -105,3 +135,10 @@ def _is_already_exists_error(exc: error.HTTPError) -> bool:
     except Exception:
         return False
     return "already exists" in response_body
+
+
+def _batch_object_error(item: dict[str, Any]) -> str | None:
+    """Return the error message of one batch import result, or ``None`` when it succeeded."""
+    errors = ((item.get("result") or {}).get("errors") or {}).get("error") or []
+    messages = [str(entry.get("message", "")) for entry in errors if isinstance(entry, dict)]
+    return "; ".join(messages) or None
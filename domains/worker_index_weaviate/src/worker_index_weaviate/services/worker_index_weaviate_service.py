@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import logging
+
 from pipeline_common.gateways.lineage import DatasetPlatform, LineageRuntimeGateway
 from pipeline_common.gateways.object_storage import ObjectStorageGateway
-from pipeline_common.gateways.queue import ConsumedMessage, Envelope, QueueGateway
+from pipeline_common.gateways.queue import ConsumedBatch, ConsumedMessage, Envelope, QueueGateway
 from pipeline_common.stages_contracts import ProcessResult
 from pipeline_common.startup.contracts import WorkerService
 from worker_index_weaviate.services.index_flow import IndexWorkItem
 from worker_index_weaviate.services.index_weaviate_processor import IndexWeaviateProcessor
 
+logger = logging.getLogger(__name__)
+
 
 class WorkerIndexWeaviateService(WorkerService):
     """Index embeddings artifacts into Weaviate and persist status objects."""
@@ -31,26 +35,80 @@ class WorkerIndexWeaviateService(WorkerService):
         self._processor = processor
 
     def serve(self) -> None:
-        """Run the indexing worker loop by polling queue messages."""
+        """Run the indexing worker loop over batches of queue messages."""
         while True:
-            message: ConsumedMessage | None = None
-            lineage_started = False
             try:
-                message = self._queue_gateway.wait_for_message(
+                batch: ConsumedBatch = self._queue_gateway.wait_for_batch(
                     poll_interval_seconds=self._poll_interval_seconds,
                 )
-                work_item = self._work_item_from_message(message)
-                self._register_lineage_input(work_item.uri)
-                lineage_started = True
-                process_result: ProcessResult = self._index_embeddings_payload(work_item.uri)
-                self._register_index_output_lineage(self._output_uri_from_process_result(process_result))
+            except Exception:
+                logger.exception("Failed to pop indexing batch")
+                continue
+            try:
+                self._process_batch(batch)
+            except Exception:
+                logger.exception("Failed to settle indexing batch of %s messages; it will be redelivered", len(batch))
+            self._flush_lineage()
+
+    def _process_batch(self, batch: ConsumedBatch) -> None:
+        """Index one batch with a single Weaviate batch request, then settle it.
+
+        Messages whose retry hand-off failed are requeued instead of acked.
+        """
+        work_uris: dict[int, str] = {}
+        unsettled: list[ConsumedMessage] = []
+        for index, message in enumerate(batch):
+            try:
+                work_uris[index] = self._work_item_from_message(message).uri
             except Exception as exc:
-                if lineage_started:
+                logger.exception("Invalid indexing message on attempt %s; handed to retry policy", message.attempt)
+                if not self._retry(message, error_message=str(exc)):
+                    unsettled.append(message)
+        outcomes = self._index_embeddings_payloads(sorted(set(work_uris.values())))
+        for index, message in enumerate(batch):
+            if index in work_uris and not self._record_outcome(message, work_uris[index], outcomes[work_uris[index]]):
+                unsettled.append(message)
+        batch.settle(failed=unsettled, requeue=True)
+
+    def _record_outcome(self, message: ConsumedMessage, uri: str, outcome: ProcessResult | Exception) -> bool:
+        """Record lineage for one indexed message; failures go through the queue retry policy.
+
+        Returns:
+            ``False`` when the message could not be handed to the retry policy.
+        """
+        lineage_started = False
+        try:
+            self._register_lineage_input(uri)
+            lineage_started = True
+            if isinstance(outcome, Exception):
+                raise outcome
+            self._register_index_output_lineage(self._output_uri_from_process_result(outcome))
+            return True
+        except Exception as exc:
+            if lineage_started:
+                try:
                     self._lineage_gateway.fail_run(error_message=str(exc))
-                if message is not None:
-                    message.nack(requeue=True)
-                continue
-            message.ack()
+                except Exception:
+                    logger.exception("Could not record failed indexing run in lineage")
+            logger.exception("Indexing failed for input artifact on attempt %s; handed to retry policy", message.attempt)
+            return self._retry(message, error_message=str(exc))
+
+    @staticmethod
+    def _retry(message: ConsumedMessage, *, error_message: str) -> bool:
+        """Hand one message to the retry policy; return ``False`` when that failed."""
+        try:
+            message.retry(error=error_message)
+        except Exception:
+            logger.exception("Could not hand indexing message to the retry policy; requeueing it")
+            return False
+        return True
+
+    def _flush_lineage(self) -> None:
+        """Emit the lineage run aggregated over the batch; a lineage failure never stops the worker."""
+        try:
+            self._lineage_gateway.flush()
+        except Exception:
+            logger.exception("Failed to flush lineage after indexing batch")
 
     def _register_lineage_input(self, uri: str) -> None:
         """Start a lineage run and register the source embeddings artifact."""
@@ -72,10 +130,18 @@ class WorkerIndexWeaviateService(WorkerService):
         )
         self._lineage_gateway.complete_run()
 
-    def _index_embeddings_payload(self, input_uri: str) -> ProcessResult:
-        """Read one embeddings artifact and build the indexing process result."""
-        raw_payload = self._storage_gateway.read_object(uri=input_uri)
-        return self._processor.process(input_uri=input_uri, raw_payload=raw_payload)
+    def _index_embeddings_payloads(self, input_uris: list[str]) -> dict[str, ProcessResult | Exception]:
+        """Read embeddings artifacts concurrently and index the readable ones in one batch."""
+        if not input_uris:
+            return {}
+        reads = self._storage_gateway.read_many(input_uris)
+        outcomes: dict[str, ProcessResult | Exception] = {
+            uri: read.error for uri, read in reads.items() if read.error is not None
+        }
+        outcomes.update(
+            self._processor.process_many([(uri, read.payload) for uri, read in reads.items() if read.error is None])
+        )
+        return outcomes
 
     def _output_uri_from_process_result(self, process_result: ProcessResult) -> str:
         """Extract the written output URI from the process result."""
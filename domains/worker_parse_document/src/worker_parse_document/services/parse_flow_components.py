@@ -44,9 +44,25 @@ class DocumentParserProcessor(BaseProcessor):
         destination_key: str,
     ) -> ProcessResult:
         """Parse one source payload and build the process result."""
+        return self.process_text(
+            source_uri=source_uri,
+            doc_id=doc_id,
+            raw_text=raw_payload.decode("utf-8", errors="ignore"),
+            raw_content_hash=source_content_hash(raw_payload),
+            destination_key=destination_key,
+        )
+
+    def process_text(
+        self,
+        *,
+        source_uri: str,
+        doc_id: str,
+        raw_text: str,
+        raw_content_hash: str,
+        destination_key: str,
+    ) -> ProcessResult:
+        """Parse source text already decoded (and hashed) while streaming, and build the process result."""
         timestamp = utc_now_iso()
-        raw_text = raw_payload.decode("utf-8", errors="ignore")
-        raw_content_hash = source_content_hash(raw_payload)
         payload = self._build_payload(
             source_uri=source_uri,
             doc_id=doc_id,
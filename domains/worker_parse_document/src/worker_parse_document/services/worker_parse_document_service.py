@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import codecs
 import logging
 from pipeline_common.gateways.lineage import DatasetPlatform, LineageRuntimeGateway
 from pipeline_common.gateways.object_storage import ObjectStorageGateway
 from pipeline_common.gateways.queue import ConsumedMessage, Envelope, QueueGateway
 
 from pipeline_common.helpers.contracts import doc_id_from_source_uri, utc_now_iso
+from pipeline_common.provenance import StreamingSha256
 from pipeline_common.stages_contracts import ProcessResult
 from pipeline_common.startup.contracts import WorkerService
 from worker_parse_document.services.parse_flow_components import DocumentParserProcessor
@@ -51,13 +53,15 @@ class WorkerParseDocumentService(WorkerService):
                 self._register_lineage_input(parse_job)
                 process_result: ProcessResult = self._transform_source_to_processed_document(parse_job)
                 self._write_processed_payload(process_result)
-                self._publish_parse_output(process_result)
+                with self._queue_gateway.lane_scope(message):
+                    self._publish_parse_output(process_result)
                 self._register_parse_output_lineage(process_result)
                 logger.info("Wrote processed document '%s'", parse_job.destination_key)
             except Exception as exc:
-                self._handle_parse_failure(input_uri, error_message=str(exc))
-                message.nack(requeue=True)
-                logger.exception("Failed processing input URI '%s'; requeued message", input_uri)
+                self._handle_parse_failure(message, input_uri, error_message=str(exc))
+                logger.exception(
+                    "Failed processing input URI '%s' on attempt %s; handed to retry policy", input_uri, message.attempt
+                )
                 continue
             message.ack()
 
@@ -71,14 +75,28 @@ class WorkerParseDocumentService(WorkerService):
 
     def _transform_source_to_processed_document(self, parse_job: ParseWorkItem) -> ProcessResult:
         """Build the process result for one parsed document."""
-        raw_payload = self._storage_gateway.read_object(uri=parse_job.input_uri)
-        return self._parser_processor.process(
+        raw_text, raw_content_hash = self._read_source_text(parse_job.input_uri)
+        return self._parser_processor.process_text(
             source_uri=parse_job.input_uri,
             doc_id=parse_job.doc_id,
-            raw_payload=raw_payload,
+            raw_text=raw_text,
+            raw_content_hash=raw_content_hash,
             destination_key=parse_job.destination_key,
         )
 
+    def _read_source_text(self, uri: str) -> tuple[str, str]:
+        """Stream a source object, decoding UTF-8 and hashing it chunk by chunk.
+
+        The raw bytes are never held whole: peak memory is the decoded text
+        plus one read chunk.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        hasher = StreamingSha256()
+        with self._storage_gateway.open_read(uri) as stream:
+            parts = [decoder.decode(hasher.update(chunk)) for chunk in stream]
+        parts.append(decoder.decode(b"", final=True))
+        return "".join(parts), hasher.hexdigest()
+
     def _write_processed_payload(self, process_result: ProcessResult) -> None:
         """Write the processed parse artifact for a completed run."""
         self._output_writer.write(
@@ -102,18 +120,19 @@ class WorkerParseDocumentService(WorkerService):
             ).to_payload
         )
 
-    def _handle_parse_failure(self, input_uri: str, *, error_message: str) -> None:
-        self._queue_gateway.push_dlq(
-            Envelope(
+    def _handle_parse_failure(self, message: ConsumedMessage, input_uri: str, *, error_message: str) -> None:
+        """Fail the lineage run and hand the message to the retry policy (DLQ once exhausted)."""
+        self._lineage_gateway.fail_run(error_message=error_message)
+        message.retry(
+            error=error_message,
+            dlq_payload=Envelope(
                 payload={
                     "uri": input_uri,
                     "error": error_message,
                     "failed_at": utc_now_iso(),
                 },
-            )
-            .to_payload
+            ).to_payload,
         )
-        self._lineage_gateway.fail_run(error_message=error_message)
 
     def _build_parse_job(self, input_uri: str) -> ParseWorkItem:
         doc_id = doc_id_from_source_uri(input_uri)
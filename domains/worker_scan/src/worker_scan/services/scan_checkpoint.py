@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+import logging
+
+from pipeline_common.gateways.object_storage import ObjectStorageGateway
+from pipeline_common.helpers.contracts import utc_now_iso
+
+logger = logging.getLogger(__name__)
+
+
+class ScanCheckpointStore:
+    """Persist the last promoted key so an interrupted listing resumes where it stopped.
+
+    The checkpoint is a small JSON object (``source_prefix``, ``start_after``,
+    ``updated_at``) under the metadata prefix. It is only honoured for the
+    prefix it was written for, and cleared when a listing runs to the end so
+    the next cycle starts over and picks up keys that sort before it.
+    """
+
+    def __init__(self, *, object_storage: ObjectStorageGateway, bucket: str, key: str, source_prefix: str) -> None:
+        """Initialize instance state and dependencies."""
+        self._storage_gateway = object_storage
+        self._uri = object_storage.build_uri(bucket, key)
+        self._source_prefix = source_prefix
+        self._saved: str | None = None
+
+    def load(self) -> str | None:
+        """Return the key to resume after, or ``None`` to list from the start."""
+        try:
+            checkpoint = json.loads(self._storage_gateway.read_object(self._uri))
+        except Exception:
+            logger.info("No usable scan checkpoint at '%s'; listing from the start", self._uri)
+            checkpoint = {}
+        start_after = checkpoint.get("start_after") if checkpoint.get("source_prefix") == self._source_prefix else None
+        self._saved = start_after
+        return start_after
+
+    def save(self, start_after: str | None) -> None:
+        """Persist ``start_after``; ``None`` clears the checkpoint. Unchanged values are not rewritten."""
+        if start_after == self._saved:
+            return
+        self._storage_gateway.write_object(
+            self._uri,
+            json.dumps(
+                {"source_prefix": self._source_prefix, "start_after": start_after, "updated_at": utc_now_iso()},
+                sort_keys=True,
+            ).encode("utf-8"),
+            content_type="application/json",
+        )
+        self._saved = start_after
+
+    def clear(self) -> None:
+        """Mark the listing as complete."""
+        self.save(None)
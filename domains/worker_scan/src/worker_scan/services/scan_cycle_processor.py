@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from pipeline_common.stages_contracts import ProcessResult
 from worker_scan.startup.contracts import RuntimeScanStorageConfig
 
 
@@ -11,6 +12,20 @@ class ScanWorkItem:
 
     source_uri: str
     destination_uri: str
+    lane: str | None = None
+
+
+@dataclass(frozen=True)
+class ScanPromotion:
+    """Outcome of one promotion: a process result when moved, an error message otherwise."""
+
+    work_item: ScanWorkItem
+    process_result: ProcessResult | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
 
 
 class StorageScanCycleProcessor:
@@ -25,6 +40,7 @@ class StorageScanCycleProcessor:
         self._bucket = storage_config.bucket
         self._source_prefix = storage_config.source_prefix
         self._destination_prefix = storage_config.output_prefix
+        self._checkpoint_key = storage_config.checkpoint_key
 
     @property
     def bucket(self) -> str:
@@ -38,6 +54,22 @@ class StorageScanCycleProcessor:
     def destination_prefix(self) -> str:
         return self._destination_prefix
 
+    @property
+    def checkpoint_key(self) -> str:
+        return self._checkpoint_key
+
     def destination_key(self, source_key: str) -> str:
         """Map a source key to its destination key."""
         return source_key.replace(self._source_prefix, self._destination_prefix, 1)
+
+    def lane_for_key(self, source_key: str, lanes: tuple[str, ...]) -> str | None:
+        """Return the priority lane named by the key's first folder under the source prefix.
+
+        ``<source_prefix>interactive/report.pdf`` maps to lane ``interactive``
+        when that lane is configured; any other key gets no explicit lane.
+        """
+        relative_key = source_key[len(self._source_prefix):] if source_key.startswith(self._source_prefix) else ""
+        folder, separator, _ = relative_key.partition("/")
+        if separator and folder in lanes:
+            return folder
+        return None
@@ -1,22 +1,37 @@
+import dataclasses
+import itertools
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from pipeline_common.gateways.lineage import DatasetPlatform
 from pipeline_common.gateways.lineage import LineageRuntimeGateway
-from pipeline_common.gateways.object_storage import ObjectStorageGateway
+from pipeline_common.gateways.object_storage import SHA256_METADATA_KEY, ObjectStorageGateway
 from pipeline_common.gateways.queue import Envelope, QueueGateway
-from pipeline_common.helpers.contracts import doc_id_from_source_uri, utc_now_iso
+from pipeline_common.helpers.contracts import doc_id_from_source_uri
 from pipeline_common.helpers.run_ids import build_source_run_id
+from pipeline_common.provenance import sha256_hex_chunks
 from pipeline_common.stages_contracts import FileMetadata, ProcessResult, ProcessorContext
 from pipeline_common.stages_contracts.step_00_common import ProcessorMetadata
 from pipeline_common.startup.contracts import WorkerService
-from worker_scan.services.scan_cycle_processor import ScanWorkItem, StorageScanCycleProcessor
+from worker_scan.services.scan_checkpoint import ScanCheckpointStore
+from worker_scan.services.scan_cycle_processor import ScanPromotion, ScanWorkItem, StorageScanCycleProcessor
 
 logger = logging.getLogger(__name__)
 
 
 class WorkerScanService(WorkerService):
-    """Run scan cycles repeatedly using the configured processor."""
+    """Run scan cycles repeatedly using the configured processor.
+
+    Keys are listed lazily and promoted in batches of ``batch_size``: stat +
+    copy run on a pool of ``max_workers`` threads, downstream messages are
+    published as one batch, sources are then removed with batched deletes, and
+    each object then gets its own lineage run. An object that fails is reported
+    on its lineage run only and stays in the source prefix for the next cycle,
+    which copies and publishes it again; consumers are idempotent on the
+    destination URI. It is not dead-lettered: it is retried every cycle, so a
+    permanently failing key would otherwise reach the DLQ once per poll.
+    """
     def __init__(
         self,
         *,
@@ -25,6 +40,8 @@ class WorkerScanService(WorkerService):
         object_storage: ObjectStorageGateway,
         lineage: LineageRuntimeGateway,
         poll_interval_seconds: int,
+        max_workers: int = 16,
+        batch_size: int = 1000,
     ) -> None:
         """Initialize instance state and dependencies."""
         self._processor = processor
@@ -32,53 +49,171 @@ class WorkerScanService(WorkerService):
         self._storage_gateway = object_storage
         self._lineage_gateway = lineage
         self._poll_interval_seconds = poll_interval_seconds
+        self._max_workers = max_workers
+        self._batch_size = batch_size
+        self._checkpoint = ScanCheckpointStore(
+            object_storage=object_storage,
+            bucket=processor.bucket,
+            key=processor.checkpoint_key,
+            source_prefix=processor.source_prefix,
+        )
 
     def serve(self) -> None:
         """Run the worker loop indefinitely."""
         while True:
             try:
-                keys = self._storage_gateway.list_keys(
-                    self._processor.bucket,
-                    self._processor.source_prefix,
-                )
-                processed = 0
-                for key in keys:
-                    work_item = self._build_work_item(key)
-                    process_result: ProcessResult = self._move_file(work_item)
-                    output_uri = self._output_uri_from_process_result(process_result)
-                    self._publish_scan_output(output_uri)
-                    self._register_lineage_output(output_uri)
-                    processed += 1
-                logger.info("Scan cycle processed %d item(s)", processed)
+                self._run_scan_cycle()
             except Exception as exc:
                 self._handle_scan_cycle_failure(error_message=str(exc))
             self._sleep_until_next_cycle()
 
-    def _move_file(self, work_item: ScanWorkItem) -> ProcessResult:
-        """Move one source object to its destination and return the process result."""
-        raw_payload = self._storage_gateway.read_object(uri=work_item.source_uri)
-        self._register_lineage_input(work_item.source_uri)
-        self._storage_gateway.copy_object(work_item.source_uri, work_item.destination_uri)
-        self._storage_gateway.delete_object(work_item.source_uri)
+    def _run_scan_cycle(self) -> None:
+        """Promote keys page by page as the listing streams in, checkpointing after each batch.
+
+        Memory stays bounded by one batch regardless of prefix size, and the
+        first batch starts as soon as its keys are listed. The cycle resumes
+        after the checkpointed key and clears the checkpoint once the listing
+        is exhausted.
+        """
+        keys = self._storage_gateway.iter_keys(
+            self._processor.bucket,
+            self._processor.source_prefix,
+            start_after=self._checkpoint.load(),
+        )
+        processed = 0
+        failed = 0
+        lineage_failed = 0
+        while batch_keys := list(itertools.islice(keys, self._batch_size)):
+            promotions, batch_lineage_failed = self._promote_batch([self._build_work_item(key) for key in batch_keys])
+            processed += sum(promotion.ok for promotion in promotions)
+            failed += sum(not promotion.ok for promotion in promotions)
+            lineage_failed += batch_lineage_failed
+            self._checkpoint.save(batch_keys[-1])
+        self._checkpoint.clear()
         logger.info(
-            "Moved '%s' -> '%s' (source_doc_id=%s, dest_doc_id=%s)",
+            "Scan cycle processed %d item(s), %d failed, %d lineage run(s) not recorded",
+            processed,
+            failed,
+            lineage_failed,
+        )
+
+    def _promote_batch(self, work_items: list[ScanWorkItem]) -> tuple[list[ScanPromotion], int]:
+        """Promote one batch of objects; one failed object does not fail the others.
+
+        Sources are deleted only after their destination was published, so a
+        failed publish leaves every object of the batch in the source prefix.
+        Lineage is recorded per object once the batch is settled; a lineage
+        failure is logged and counted and never affects other objects.
+
+        Returns:
+            The promotions and the number of objects whose lineage run failed.
+        """
+        promotions = self._delete_promoted_sources(self._publish_copied(self._copy_batch(work_items)))
+        for promotion in (promotion for promotion in promotions if promotion.ok):
+            logger.info(
+                "Moved '%s' -> '%s' (source_doc_id=%s, dest_doc_id=%s)",
+                promotion.work_item.source_uri,
+                promotion.work_item.destination_uri,
+                doc_id_from_source_uri(promotion.work_item.source_uri),
+                doc_id_from_source_uri(promotion.work_item.destination_uri),
+            )
+        lineage_failed = 0
+        for promotion in promotions:
+            try:
+                self._register_promotion_lineage(promotion)
+            except Exception:
+                lineage_failed += 1
+                logger.exception("Could not record lineage for '%s'", promotion.work_item.source_uri)
+                self._abort_lineage_run()
+        return promotions, lineage_failed
+
+    def _copy_batch(self, work_items: list[ScanWorkItem]) -> list[ScanPromotion]:
+        """Copy every object of the batch to its destination on a bounded thread pool."""
+        workers = min(self._max_workers, len(work_items))
+        if workers <= 1:
+            return [self._capture_copy(work_item) for work_item in work_items]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan-promote") as executor:
+            return list(executor.map(self._capture_copy, work_items))
+
+    def _capture_copy(self, work_item: ScanWorkItem) -> ScanPromotion:
+        try:
+            return ScanPromotion(work_item=work_item, process_result=self._copy_file(work_item))
+        except Exception as exc:
+            logger.exception("Promotion of '%s' failed", work_item.source_uri)
+            return ScanPromotion(work_item=work_item, error=str(exc))
+
+    def _publish_copied(self, promotions: list[ScanPromotion]) -> list[ScanPromotion]:
+        """Publish the copied objects downstream; a failed publish fails every copied promotion.
+
+        Part of the batch may already be published when ``push_many`` raises;
+        the next cycle publishes those objects again.
+        """
+        copied = [promotion for promotion in promotions if promotion.ok]
+        if not copied:
+            return promotions
+        try:
+            self._publish_scan_outputs(copied)
+        except Exception as exc:
+            logger.exception("Publishing %d promoted object(s) failed; sources are kept", len(copied))
+            return [
+                dataclasses.replace(promotion, process_result=None, error=f"Publish failed: {exc}")
+                if promotion.ok
+                else promotion
+                for promotion in promotions
+            ]
+        return promotions
+
+    def _delete_promoted_sources(self, promotions: list[ScanPromotion]) -> list[ScanPromotion]:
+        """Delete published sources in batched calls; a failed delete fails its promotion.
+
+        The destination copy is then left in place and overwritten by the
+        next cycle, which retries the whole promotion.
+        """
+        copied = [promotion.work_item.source_uri for promotion in promotions if promotion.ok]
+        if not copied:
+            return promotions
+        deleted = self._storage_gateway.delete_many(copied)
+        return [
+            promotion
+            if not promotion.ok or deleted[promotion.work_item.source_uri].ok
+            else dataclasses.replace(
+                promotion,
+                process_result=None,
+                error=f"Source delete failed: {deleted[promotion.work_item.source_uri].error}",
+            )
+            for promotion in promotions
+        ]
+
+    def _copy_file(self, work_item: ScanWorkItem) -> ProcessResult:
+        """Copy one source object to its destination and return the process result.
+
+        The content hash comes from object metadata, so the copy costs the
+        same for any file size. Legacy sources without a persisted checksum
+        are hashed once while streaming and the hash is stamped on the copy.
+        Runs on pool threads, so it must not touch the lineage gateway.
+        """
+        source_stat = self._storage_gateway.stat_object(work_item.source_uri)
+        content_hash = source_stat.sha256
+        copy_metadata: dict[str, str] | None = None
+        if content_hash is None:
+            logger.warning("No persisted SHA-256 for '%s'; hashing the payload stream", work_item.source_uri)
+            content_hash = self._source_content_hash(work_item.source_uri)
+            copy_metadata = {**source_stat.metadata, SHA256_METADATA_KEY: content_hash}
+        self._storage_gateway.copy_object(
             work_item.source_uri,
             work_item.destination_uri,
-            doc_id_from_source_uri(work_item.source_uri),
-            doc_id_from_source_uri(work_item.destination_uri),
+            metadata=copy_metadata,
+            content_type=source_stat.content_type,
+        )
+        source_metadata = FileMetadata.from_source_hash(
+            uri=work_item.source_uri,
+            content_hash=content_hash,
+            default_content_type=source_stat.content_type or "application/octet-stream",
         )
         return ProcessResult(
             run_id=build_source_run_id(work_item.source_uri),
-            root_doc_metadata=FileMetadata.from_source_bytes(
-                uri=work_item.source_uri,
-                payload=raw_payload,
-                default_content_type="application/octet-stream",
-            ),
-            stage_doc_metadata=FileMetadata.from_source_bytes(
-                uri=work_item.source_uri,
-                payload=raw_payload,
-                default_content_type="application/octet-stream",
-            ),
+            root_doc_metadata=source_metadata,
+            stage_doc_metadata=source_metadata,
             input_uri=work_item.source_uri,
             processor_context=ProcessorContext(params_hash="", params=[]),
             processor=ProcessorMetadata(name="StorageScanCycleProcessor", version="1.0.0"),
@@ -87,6 +222,26 @@ class WorkerScanService(WorkerService):
             },
         )
 
+    def _source_content_hash(self, uri: str) -> str:
+        """Hash a legacy source object while streaming it, so memory stays bounded by the read chunk size."""
+        with self._storage_gateway.open_read(uri) as stream:
+            return sha256_hex_chunks(stream)
+
+    def _register_promotion_lineage(self, promotion: ScanPromotion) -> None:
+        """Record one lineage run per object: completed when moved, failed otherwise."""
+        self._register_lineage_input(promotion.work_item.source_uri)
+        if promotion.ok:
+            self._register_lineage_output(self._output_uri_from_process_result(promotion.process_result))
+            return
+        self._lineage_gateway.fail_run(error_message=promotion.error)
+
+    def _abort_lineage_run(self) -> None:
+        """Drop a half-recorded lineage run so the next object starts clean."""
+        try:
+            self._lineage_gateway.abort_run()
+        except Exception:
+            logger.exception("Could not abort lineage run")
+
     def _register_lineage_input(self, uri: str) -> None:
         """Start a lineage run and register the source object."""
         self._lineage_gateway.start_run()
@@ -103,12 +258,14 @@ class WorkerScanService(WorkerService):
         )
         self._lineage_gateway.complete_run()
 
-    def _publish_scan_output(self, uri: str) -> None:
-        """Publish the promoted object URI to the downstream queue."""
-        self._queue_gateway.push(
+    def _publish_scan_outputs(self, promotions: list[ScanPromotion]) -> None:
+        """Publish promoted object URIs downstream in one batch, each in its priority lane if any."""
+        self._queue_gateway.push_many(
             Envelope(
-                payload=uri,
+                payload=self._output_uri_from_process_result(promotion.process_result),
+                meta={"lane": promotion.work_item.lane} if promotion.work_item.lane else None,
             ).to_payload
+            for promotion in promotions
         )
 
     def _output_uri_from_process_result(self, process_result: ProcessResult) -> str:
@@ -120,6 +277,7 @@ class WorkerScanService(WorkerService):
         return ScanWorkItem(
             source_uri=self._storage_gateway.build_uri(self._processor.bucket, key),
             destination_uri=self._storage_gateway.build_uri(self._processor.bucket, destination_key),
+            lane=self._processor.lane_for_key(key, self._queue_gateway.lane_names),
         )
 
     def _handle_scan_cycle_failure(self, *, error_message: str) -> None:
@@ -22,4 +22,5 @@ class ScanConfigExtractor(WorkerConfigExtractor[RuntimeScanJobConfig]):
         return RuntimeScanJobConfig(
             storage=RuntimeScanStorageConfig.from_raw(raw_job_config.storage, env=env),
             poll_interval_seconds=raw_job_config.poll_interval_seconds,
+            promotion=raw_job_config.promotion,
         )
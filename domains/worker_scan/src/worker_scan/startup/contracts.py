@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+DEFAULT_CHECKPOINT_KEY = "07_metadata/checkpoints/worker_scan.json"
+
 
 @dataclass(frozen=True)
 class RawScanStorageConfig:
@@ -13,6 +15,7 @@ class RawScanStorageConfig:
     bucket: str
     source_prefix: str
     output_prefix: str
+    checkpoint_key: str = DEFAULT_CHECKPOINT_KEY
 
     @classmethod
     def from_dict(cls, payload: dict[str, Any]) -> RawScanStorageConfig:
@@ -24,6 +27,7 @@ class RawScanStorageConfig:
             bucket=str(payload["bucket"]),
             source_prefix=str(source_prefix),
             output_prefix=str(payload["output_prefix"]),
+            checkpoint_key=str(payload.get("checkpoint_key", DEFAULT_CHECKPOINT_KEY)),
         )
 
 
@@ -34,6 +38,7 @@ class RuntimeScanStorageConfig:
     bucket: str
     source_prefix: str
     output_prefix: str
+    checkpoint_key: str = DEFAULT_CHECKPOINT_KEY
 
     @classmethod
     def from_raw(
@@ -47,7 +52,27 @@ class RuntimeScanStorageConfig:
             bucket=raw.bucket,
             source_prefix=f"{env}/{raw.source_prefix}",
             output_prefix=f"{env}/{raw.output_prefix}",
+            checkpoint_key=f"{env}/{raw.checkpoint_key}",
+        )
+
+
+@dataclass(frozen=True)
+class ScanPromotionConfig:
+    """Concurrency and batch size for promoting listed objects."""
+
+    max_workers: int = 16
+    batch_size: int = 1000
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> ScanPromotionConfig:
+        """Build promotion config from a dictionary payload; missing keys keep defaults."""
+        config = cls(
+            max_workers=int(payload.get("max_workers", cls.max_workers)),
+            batch_size=int(payload.get("batch_size", cls.batch_size)),
         )
+        if config.max_workers <= 0 or config.batch_size <= 0:
+            raise ValueError("job.scan.max_workers and job.scan.batch_size must be greater than zero")
+        return config
 
 
 @dataclass(frozen=True)
@@ -56,6 +81,7 @@ class RawScanJobConfig:
 
     storage: RawScanStorageConfig
     poll_interval_seconds: int
+    promotion: ScanPromotionConfig
 
     @classmethod
     def from_dict(cls, payload: dict[str, Any]) -> RawScanJobConfig:
@@ -63,6 +89,7 @@ class RawScanJobConfig:
         return cls(
             storage=RawScanStorageConfig.from_dict(payload["storage"]),
             poll_interval_seconds=int(payload["poll_interval_seconds"]),
+            promotion=ScanPromotionConfig.from_dict(payload.get("scan", {})),
         )
 
 
@@ -72,3 +99,4 @@ class RuntimeScanJobConfig:
 
     storage: RuntimeScanStorageConfig
     poll_interval_seconds: int
+    promotion: ScanPromotionConfig
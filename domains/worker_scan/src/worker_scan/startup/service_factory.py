@@ -26,4 +26,6 @@ class ScanServiceFactory(WorkerServiceFactory[RuntimeScanJobConfig, WorkerScanSe
             object_storage=runtime.object_storage_gateway,
             lineage=runtime.lineage_gateway,
             poll_interval_seconds=worker_config.poll_interval_seconds,
+            max_workers=worker_config.promotion.max_workers,
+            batch_size=worker_config.promotion.batch_size,
         )
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+
+from pipeline_common.gateways.object_storage import LocalFileSystemClient, ObjectStorageGateway
+
+from worker_scan.services.scan_checkpoint import ScanCheckpointStore
+
+_CHECKPOINT_KEY = "dev/07_metadata/scan/checkpoint.json"
+
+
+class ScanCheckpointStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._root = tempfile.TemporaryDirectory()
+        self.client = LocalFileSystemClient(root=self._root.name)
+        self.client.create_bucket("pipeline")
+        self.gateway = ObjectStorageGateway(self.client)
+
+    def tearDown(self) -> None:
+        self._root.cleanup()
+
+    def _store(self, source_prefix: str = "dev/01_landing/") -> ScanCheckpointStore:
+        return ScanCheckpointStore(
+            object_storage=self.gateway, bucket="pipeline", key=_CHECKPOINT_KEY, source_prefix=source_prefix
+        )
+
+    def test_missing_checkpoint_lists_from_the_start(self) -> None:
+        self.assertIsNone(self._store().load())
+
+    def test_saved_key_resumes_the_listing(self) -> None:
+        for index in range(5):
+            self.client.write_bytes("pipeline", f"dev/01_landing/doc-{index}.pdf", b"%PDF", content_type="application/pdf")
+        self._store().save("dev/01_landing/doc-2.pdf")
+
+        start_after = self._store().load()
+
+        self.assertEqual(start_after, "dev/01_landing/doc-2.pdf")
+        self.assertEqual(
+            list(self.gateway.iter_keys("pipeline", "dev/01_landing/", start_after=start_after)),
+            ["dev/01_landing/doc-3.pdf", "dev/01_landing/doc-4.pdf"],
+        )
+
+    def test_checkpoint_of_another_prefix_is_ignored(self) -> None:
+        self._store().save("dev/01_landing/doc-2.pdf")
+
+        self.assertIsNone(self._store("dev/02_other/").load())
+
+    def test_clear_restarts_the_next_listing(self) -> None:
+        store = self._store()
+        store.save("dev/01_landing/doc-2.pdf")
+        store.clear()
+
+        self.assertIsNone(self._store().load())
+
+    def test_unchanged_value_is_not_rewritten(self) -> None:
+        store = self._store()
+        store.save("dev/01_landing/doc-2.pdf")
+        self.client.delete_object("pipeline", _CHECKPOINT_KEY)
+
+        store.save("dev/01_landing/doc-2.pdf")
+
+        self.assertFalse(self.client.object_exists("pipeline", _CHECKPOINT_KEY))
+
+
+if __name__ == "__main__":
+    unittest.main()
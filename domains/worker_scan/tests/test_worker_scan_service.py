@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+
+from pipeline_common.gateways.lineage import DatasetPlatform
+from pipeline_common.gateways.object_storage import LocalFileSystemClient, ObjectStorageGateway
+from pipeline_common.gateways.queue import InMemoryBroker, InMemoryQueueBackend, QueueGateway
+
+from worker_scan.services.scan_cycle_processor import StorageScanCycleProcessor
+from worker_scan.services.worker_scan_service import WorkerScanService
+from worker_scan.startup.contracts import RuntimeScanStorageConfig
+
+_CHECKPOINT_KEY = "dev/07_metadata/checkpoints/worker_scan.json"
+
+
+class _RecordingLineage:
+    def __init__(self, *, failing_input: str | None = None) -> None:
+        self.failing_input = failing_input
+        self.runs: list[tuple[str, str]] = []
+        self.aborted = 0
+        self._input: str | None = None
+
+    def start_run(self) -> None:
+        self._input = None
+
+    def add_input(self, name: str, platform: DatasetPlatform) -> str:
+        if name == self.failing_input:
+            raise ConnectionError("DataHub unavailable")
+        self._input = name
+        return name
+
+    def add_output(self, name: str, platform: DatasetPlatform) -> str:
+        return name
+
+    def complete_run(self) -> str:
+        self.runs.append((self._input, "completed"))
+        return "urn"
+
+    def fail_run(self, error_message: str | None) -> str:
+        self.runs.append((self._input, "failed"))
+        return "urn"
+
+    def abort_run(self) -> None:
+        self.aborted += 1
+
+
+class _CopyFailingGateway(ObjectStorageGateway):
+    def __init__(self, client: LocalFileSystemClient, *, failing_source: str) -> None:
+        super().__init__(client)
+        self.failing_source = failing_source
+
+    def copy_object(self, source_uri: str, destination_uri: str, **kwargs) -> None:
+        if source_uri == self.failing_source:
+            raise PermissionError("copy denied")
+        super().copy_object(source_uri, destination_uri, **kwargs)
+
+
+class WorkerScanServiceTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._root = tempfile.TemporaryDirectory()
+        self.client = LocalFileSystemClient(root=self._root.name)
+        self.client.create_bucket("pipeline")
+        for index in range(3):
+            self.client.write_bytes("pipeline", f"dev/01_landing/doc-{index}.pdf", b"%PDF", content_type="application/pdf")
+        self.broker = InMemoryBroker()
+        self.observer = InMemoryQueueBackend(self.broker)
+
+    def tearDown(self) -> None:
+        self._root.cleanup()
+
+    def _service(self, gateway: ObjectStorageGateway, lineage: _RecordingLineage) -> WorkerScanService:
+        processor = StorageScanCycleProcessor(
+            storage_config=RuntimeScanStorageConfig(
+                bucket="pipeline",
+                source_prefix="dev/01_landing/",
+                output_prefix="dev/02_raw/",
+                checkpoint_key=_CHECKPOINT_KEY,
+            )
+        )
+        return WorkerScanService(
+            processor=processor,
+            stage_queue=QueueGateway(InMemoryQueueBackend(self.broker), {"produce": "parse", "dlq": "scan.dlq"}),
+            object_storage=gateway,
+            lineage=lineage,
+            poll_interval_seconds=0,
+            max_workers=2,
+            batch_size=2,
+        )
+
+    def _uri(self, key: str) -> str:
+        return ObjectStorageGateway(self.client).build_uri("pipeline", key)
+
+    def test_failed_object_stays_in_source_and_is_not_dead_lettered(self) -> None:
+        failing = self._uri("dev/01_landing/doc-1.pdf")
+        lineage = _RecordingLineage()
+        service = self._service(_CopyFailingGateway(self.client, failing_source=failing), lineage)
+
+        with self.assertLogs("worker_scan.services.worker_scan_service", level="ERROR"):
+            service._run_scan_cycle()
+            service._run_scan_cycle()
+
+        self.assertEqual(self.observer.queue_depth("scan.dlq"), 0)
+        self.assertEqual(self.observer.queue_depth("parse"), 2)
+        self.assertTrue(self.client.object_exists("pipeline", "dev/01_landing/doc-1.pdf"))
+        self.assertEqual(lineage.runs.count((failing, "failed")), 2)
+
+    def test_lineage_failure_does_not_abort_the_batch(self) -> None:
+        lineage = _RecordingLineage(failing_input=self._uri("dev/01_landing/doc-0.pdf"))
+        service = self._service(ObjectStorageGateway(self.client), lineage)
+
+        with self.assertLogs("worker_scan.services.worker_scan_service", level="ERROR") as logs:
+            service._run_scan_cycle()
+
+        self.assertEqual(
+            lineage.runs,
+            [(self._uri("dev/01_landing/doc-1.pdf"), "completed"), (self._uri("dev/01_landing/doc-2.pdf"), "completed")],
+        )
+        self.assertEqual(lineage.aborted, 1)
+        self.assertEqual(self.client.list_keys("pipeline", "dev/01_landing/"), [])
+        self.assertEqual(self.observer.queue_depth("parse"), 3)
+        self.assertIsNone(json.loads(self.client.read_bytes("pipeline", _CHECKPOINT_KEY))["start_after"])
+        self.assertTrue(any("Could not record lineage" in line for line in logs.output))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Measure bulk object-storage throughput (objects/sec) versus concurrency.
+
+Writes and then reads ``--objects`` small JSON-sized objects under
+``09_tmp/bench/`` of the storage selected by ``S3_ENDPOINT`` (an S3-compatible
+endpoint with ``S3_ACCESS_KEY``/``S3_SECRET_KEY``, or ``local:///<root>``) with
+``ObjectStorageGateway.write_many`` and ``read_many`` at each concurrency
+level. Concurrency 1 is the sequential baseline that ``write_object`` loops in
+the chunk and embed stages used to pay; running the same sizes against
+``local://`` shows what the HTTP hop costs.
+
+Usage:
+    S3_ENDPOINT=http://localhost:9000 S3_ACCESS_KEY=... S3_SECRET_KEY=... \\
+        python benchmarks/object_storage_bulk_throughput.py --objects 500 --concurrency 1 4 16 32 64
+    S3_ENDPOINT=local:///tmp/objects python benchmarks/object_storage_bulk_throughput.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import os
+import time
+import uuid
+
+from pipeline_common.gateways.factories import ObjectStorageGatewayFactory
+from pipeline_common.gateways.object_storage import ObjectStorageGateway, ObjectWrite
+from pipeline_common.gateways.object_storage.settings import S3StorageSettings
+
+
+def _run_level(
+    gateway: ObjectStorageGateway,
+    *,
+    bucket: str,
+    objects: int,
+    object_bytes: int,
+    concurrency: int,
+) -> dict[str, float]:
+    run_prefix = f"09_tmp/bench/bulk/{uuid.uuid4().hex}/"
+    payload = b"x" * object_bytes
+    writes = [
+        ObjectWrite(
+            uri=gateway.build_uri(bucket, f"{run_prefix}{index:06d}.json"),
+            payload=payload,
+            content_type="application/json",
+        )
+        for index in range(objects)
+    ]
+
+    started_at = time.perf_counter()
+    written = gateway.write_many(writes, max_concurrency=concurrency)
+    write_seconds = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    read = gateway.read_many([write.uri for write in writes], max_concurrency=concurrency)
+    read_seconds = time.perf_counter() - started_at
+
+    for write in writes:
+        gateway.delete_object(write.uri)
+    return {
+        "write_per_sec": objects / write_seconds,
+        "read_per_sec": objects / read_seconds,
+        "errors": sum(not result.ok for result in (*written.values(), *read.values())),
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bucket", default=os.getenv("S3_BUCKET", "rag-data"))
+    parser.add_argument("--objects", type=int, default=500)
+    parser.add_argument("--object-bytes", type=int, default=2048)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 32, 64])
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    settings = dataclasses.replace(S3StorageSettings.from_env(), s3_max_pool_connections=max(args.concurrency))
+    gateway = ObjectStorageGatewayFactory(s3_settings=settings).build()
+    if not gateway.bucket_exists(args.bucket):
+        gateway.client.create_bucket(args.bucket)
+    print(f"{'concurrency':>11} {'writes/sec':>11} {'reads/sec':>10} {'errors':>7}")
+    for concurrency in args.concurrency:
+        result = _run_level(
+            gateway,
+            bucket=args.bucket,
+            objects=args.objects,
+            object_bytes=args.object_bytes,
+            concurrency=concurrency,
+        )
+        print(
+            f"{concurrency:>11} {result['write_per_sec']:>11.1f} {result['read_per_sec']:>10.1f} "
+            f"{result['errors']:>7.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
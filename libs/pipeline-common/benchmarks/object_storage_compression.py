@@ -0,0 +1,136 @@
+"""Measure stored bytes, PUT latency and read CPU per storage codec.
+
+Writes ``--objects`` embedding-shaped JSON artifacts (chunk text, a float
+vector and the two repeated ``FileMetadata`` blocks every artifact carries)
+under ``09_tmp/bench/compression/`` of the storage selected by
+``S3_ENDPOINT``, once uncompressed and once per available codec, then reads
+them back through ``read_object``. ``zstd`` is skipped when the optional
+``zstandard`` package is not installed.
+
+Usage:
+    S3_ENDPOINT=http://localhost:9000 S3_ACCESS_KEY=... S3_SECRET_KEY=... \\
+        python benchmarks/object_storage_compression.py --objects 500
+    S3_ENDPOINT=local:///tmp/objects python benchmarks/object_storage_compression.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import os
+import random
+import statistics
+import time
+import uuid
+
+from pipeline_common.gateways.factories import ObjectStorageGatewayFactory
+from pipeline_common.gateways.object_storage import CompressionPolicy, ObjectStorageGateway
+from pipeline_common.gateways.object_storage.compression import STORAGE_CODECS
+from pipeline_common.gateways.object_storage.settings import S3StorageSettings
+
+BENCH_PREFIX = "09_tmp/bench/compression/"
+
+
+def _file_metadata(doc_id: str, uri: str) -> dict[str, str]:
+    return {
+        "doc_id": doc_id,
+        "uri": uri,
+        "timestamp": "2026-10-16T12:00:00+00:00",
+        "security_clearance": "internal",
+        "source_type": "pdf",
+        "content_type": "application/json",
+        "source_content_hash": uuid.uuid4().hex * 2,
+        "schema_version": "1.0",
+    }
+
+
+def _embedding_artifact(index: int, dimension: int) -> bytes:
+    doc_id = uuid.uuid4().hex[:16]
+    chunk_id = f"{doc_id}-{index:06d}"
+    words = ("governed", "retrieval", "policy", "document", "quarterly", "revenue", "clause", "section")
+    payload = {
+        "doc_id": doc_id,
+        "chunk_id": chunk_id,
+        "chunk_text": " ".join(random.choice(words) for _ in range(180)),
+        "vector": [round(random.uniform(-1.0, 1.0), 8) for _ in range(dimension)],
+        "metadata": {
+            "run_id": uuid.uuid4().hex,
+            "embedder_name": "local-hash-embedder",
+            "embedder_version": "1.0.0",
+            "embedding_params_hash": uuid.uuid4().hex * 2,
+            "embedding_run_id": uuid.uuid4().hex,
+            "root_doc_metadata": _file_metadata(doc_id, f"s3a://rag-data/02_raw/{doc_id}.pdf"),
+            "stage_doc_metadata": _file_metadata(doc_id, f"s3a://rag-data/04_chunks/{chunk_id}.json"),
+        },
+    }
+    return json.dumps(payload, sort_keys=True, ensure_ascii=True, separators=(",", ":")).encode("utf-8")
+
+
+def _run_codec(
+    gateway: ObjectStorageGateway,
+    *,
+    bucket: str,
+    codec: str | None,
+    artifacts: list[bytes],
+) -> dict[str, float]:
+    run_prefix = f"{BENCH_PREFIX}{codec or 'none'}/{uuid.uuid4().hex}/"
+    gateway.compression = CompressionPolicy.from_spec(f"{BENCH_PREFIX}={codec}" if codec else "")
+    uris = [gateway.build_uri(bucket, f"{run_prefix}{index:06d}.embedding.json") for index in range(len(artifacts))]
+
+    put_latencies: list[float] = []
+    for uri, artifact in zip(uris, artifacts):
+        started_at = time.perf_counter()
+        gateway.write_object(uri, artifact, content_type="application/json")
+        put_latencies.append(time.perf_counter() - started_at)
+
+    stored_bytes = sum(gateway.stat_object(uri).size for uri in uris)
+
+    cpu_started_at = time.process_time()
+    for uri, artifact in zip(uris, artifacts):
+        if gateway.read_object(uri) != artifact:
+            raise RuntimeError(f"Round trip mismatch for {uri}")
+    read_cpu_seconds = time.process_time() - cpu_started_at
+
+    for uri in uris:
+        gateway.delete_object(uri)
+    return {
+        "stored_bytes": stored_bytes,
+        "put_p50_ms": statistics.median(put_latencies) * 1000,
+        "read_cpu_us": read_cpu_seconds / len(uris) * 1_000_000,
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bucket", default=os.getenv("S3_BUCKET", "rag-data"))
+    parser.add_argument("--objects", type=int, default=500)
+    parser.add_argument("--dimension", type=int, default=384)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    settings = dataclasses.replace(S3StorageSettings.from_env(), object_cache_dir=None, object_compression="")
+    gateway = ObjectStorageGatewayFactory(s3_settings=settings).build()
+    if not gateway.bucket_exists(args.bucket):
+        gateway.client.create_bucket(args.bucket)
+    artifacts = [_embedding_artifact(index, args.dimension) for index in range(args.objects)]
+    raw_bytes = sum(len(artifact) for artifact in artifacts)
+
+    print(f"{'codec':>6} {'stored bytes':>13} {'ratio':>6} {'PUT p50 ms':>11} {'read CPU us/obj':>16}")
+    for codec in (None, *STORAGE_CODECS):
+        try:
+            result = _run_codec(gateway, bucket=args.bucket, codec=codec, artifacts=artifacts)
+        except ValueError as exc:
+            print(f"{codec:>6} skipped: {exc}")
+            continue
+        print(
+            f"{codec or 'none':>6} {result['stored_bytes']:>13.0f} {raw_bytes / result['stored_bytes']:>6.2f} "
+            f"{result['put_p50_ms']:>11.3f} {result['read_cpu_us']:>16.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+"""Measure per-message encode/decode cost of queue envelope codecs.
+
+Compares the legacy ``json.dumps(sort_keys=True)`` wire format with the
+compact JSON codec and, when the optional ``msgpack`` package is installed,
+the msgpack codec. Two representative payloads are used: a small URI
+envelope (what every stage hop publishes) and a large DLQ payload carrying
+an error message and traceback.
+
+Usage:
+    python benchmarks/queue_envelope_codecs.py --iterations 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+import traceback
+from typing import Any, Callable
+
+from pipeline_common.gateways.queue import Envelope, JsonEnvelopeCodec, MsgpackEnvelopeCodec
+
+
+def _uri_envelope() -> dict[str, Any]:
+    return Envelope(payload="s3a://rag-data/04_chunks/3f9a1c0d2b7e4a51/chunk-000042.json").to_payload
+
+
+def _dlq_payload() -> dict[str, Any]:
+    try:
+        raise ValueError("Unsupported document layout: " + "x" * 512)
+    except ValueError:
+        error = traceback.format_exc() * 8
+    return Envelope(
+        payload={
+            "uri": "s3a://rag-data/02_raw/finance/2024/q3-report.pdf",
+            "error": error,
+            "failed_at": "2026-10-16T12:00:00+00:00",
+            "attempts": 5,
+        },
+        meta={"stage": "parse_document", "lane": "bulk"},
+    ).to_payload
+
+
+def _legacy_json() -> tuple[Callable[[dict[str, Any]], bytes], Callable[[bytes], dict[str, Any]]]:
+    return (lambda payload: json.dumps(payload, sort_keys=True).encode("utf-8")), json.loads
+
+
+def _codecs() -> dict[str, tuple[Callable[[dict[str, Any]], bytes], Callable[[bytes], dict[str, Any]]]]:
+    json_codec = JsonEnvelopeCodec()
+    codecs = {
+        "legacy-json": _legacy_json(),
+        "json": (json_codec.encode, json_codec.decode),
+    }
+    try:
+        msgpack_codec = MsgpackEnvelopeCodec()
+    except ValueError:
+        return codecs
+    codecs["msgpack"] = (msgpack_codec.encode, msgpack_codec.decode)
+    return codecs
+
+
+def main() -> int:
+    args = _parse_args()
+    payloads = {"uri-envelope": _uri_envelope(), "dlq-payload": _dlq_payload()}
+    print(f"{'payload':<14} {'codec':<12} {'bytes':>7} {'encode_us':>10} {'decode_us':>10}")
+    for payload_name, payload in payloads.items():
+        for codec_name, (encode, decode) in _codecs().items():
+            body = encode(payload)
+            assert decode(body) == payload
+            encode_us = min(timeit.repeat(lambda: encode(payload), number=args.iterations, repeat=3))
+            decode_us = min(timeit.repeat(lambda: decode(body), number=args.iterations, repeat=3))
+            print(
+                f"{payload_name:<14} {codec_name:<12} {len(body):>7} "
+                f"{encode_us / args.iterations * 1e6:>10.2f} {decode_us / args.iterations * 1e6:>10.2f}"
+            )
+    return 0
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=100_000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
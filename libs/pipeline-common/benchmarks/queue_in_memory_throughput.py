@@ -0,0 +1,95 @@
+"""Measure stage-queue throughput on the in-process backend.
+
+Runs a two-stage pipeline (publisher -> relay worker -> sink) over
+``InMemoryQueueBackend`` channels sharing one ``InMemoryBroker``, so gateway
+overhead (encoding, batching, settlement) can be tracked without RabbitMQ.
+A fraction of relay deliveries is nacked once to exercise requeue, and a
+fraction is rejected to exercise dead-letter routing.
+
+Usage:
+    python benchmarks/queue_in_memory_throughput.py --messages 50000 --batch-size 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+
+from pipeline_common.gateways.queue import InMemoryBroker, InMemoryQueueBackend, QueueGateway
+
+SOURCE_QUEUE = "bench.in_memory.source"
+SINK_QUEUE = "bench.in_memory.sink"
+DLQ = "bench.in_memory.dlq"
+
+
+def _relay(args: argparse.Namespace, broker: InMemoryBroker, stop: threading.Event) -> None:
+    relay = QueueGateway(
+        InMemoryQueueBackend(broker),
+        queue_config={
+            "consume": SOURCE_QUEUE,
+            "produce": SINK_QUEUE,
+            "batch_size": args.batch_size,
+            "batch_max_wait_seconds": 0.05,
+        },
+    )
+    requeued: set[int] = set()
+    while not stop.is_set():
+        batch = relay.pop_batch()
+        failed = []
+        forwarded = []
+        for message in batch:
+            sequence = int(message.payload["sequence"])
+            if args.reject_every and sequence % args.reject_every == 0:
+                message.nack(requeue=False)
+            elif args.requeue_every and sequence % args.requeue_every == 0 and sequence not in requeued:
+                requeued.add(sequence)
+                failed.append(message)
+            else:
+                forwarded.append(message.payload)
+        relay.push_many(forwarded)
+        batch.settle(failed, requeue=True)
+
+
+def main() -> int:
+    args = _parse_args()
+    broker = InMemoryBroker()
+    broker.declare(SOURCE_QUEUE, {"x-dead-letter-exchange": "", "x-dead-letter-routing-key": DLQ})
+    rejected = args.messages // args.reject_every if args.reject_every else 0
+    expected = args.messages - rejected
+    stop = threading.Event()
+    relay = threading.Thread(target=_relay, args=(args, broker, stop), daemon=True)
+    relay.start()
+    publisher = QueueGateway(InMemoryQueueBackend(broker), queue_config={"produce": SOURCE_QUEUE})
+    sink = QueueGateway(
+        InMemoryQueueBackend(broker),
+        queue_config={"consume": SINK_QUEUE, "batch_size": args.batch_size, "batch_max_wait_seconds": 0.05},
+    )
+
+    started_at = time.perf_counter()
+    publisher.push_many({"sequence": sequence} for sequence in range(1, args.messages + 1))
+    received = 0
+    while received < expected:
+        batch = sink.pop_batch()
+        received += len(batch)
+        batch.ack_all()
+    elapsed = time.perf_counter() - started_at
+    stop.set()
+    relay.join()
+
+    print(f"messages={args.messages} delivered={received} dead_lettered={sink.queue_depth(DLQ)}")
+    print(f"elapsed_s={elapsed:.3f} msgs_per_sec={received / elapsed:.0f}")
+    return 0
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=50_000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--requeue-every", type=int, default=100)
+    parser.add_argument("--reject-every", type=int, default=1000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
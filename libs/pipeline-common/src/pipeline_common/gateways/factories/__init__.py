@@ -1,8 +1,9 @@
 from pipeline_common.gateways.factories.lineage_gateway_factory import DataHubLineageGatewayFactory
 from pipeline_common.gateways.factories.object_storage_gateway_factory import ObjectStorageGatewayFactory
-from pipeline_common.gateways.factories.queue_gateway_factory import QueueGatewayFactory
+from pipeline_common.gateways.factories.queue_gateway_factory import AsyncQueueGatewayFactory, QueueGatewayFactory
 
 __all__ = [
+    "AsyncQueueGatewayFactory",
     "DataHubLineageGatewayFactory",
     "ObjectStorageGatewayFactory",
     "QueueGatewayFactory",
@@ -1,13 +1,21 @@
 """DataHub lineage gateway factory for worker runtime."""
 
+import atexit
+
 from pipeline_common.gateways.lineage.contracts import DataHubDataJobKey
-from pipeline_common.gateways.lineage import DataHubRuntimeLineage
+from pipeline_common.gateways.lineage import DataHubGraphClient, DataHubRuntimeLineage
+from pipeline_common.gateways.lineage.aggregation import AggregatingRuntimeLineage
+from pipeline_common.gateways.lineage.circuit_breaker import CircuitBreaker
+from pipeline_common.gateways.lineage.dataset_cache import DatasetPropertiesCache
+from pipeline_common.gateways.lineage.emitter import BufferedMcpEmitter, McpEmitter, install_shutdown_flush
+from pipeline_common.gateways.lineage.job_config_bundle import JobConfigBundleStore
 from pipeline_common.gateways.lineage.runtime_contracts import (
     DataHubLineageRuntimeConfig,
     DataHubRuntimeConnectionSettings,
     LineageRuntimeGateway,
 )
 from pipeline_common.gateways.lineage.settings import DataHubSettings
+from pipeline_common.gateways.lineage.spool import McpSpool, SpoolingMcpEmitter
 
 
 class DataHubLineageGatewayFactory:
@@ -26,17 +34,85 @@ class DataHubLineageGatewayFactory:
 
     def build(self) -> LineageRuntimeGateway:
         """Create and initialize runtime lineage gateway for one worker."""
+        connection_settings = DataHubRuntimeConnectionSettings(
+            server=self.datahub_settings.server,
+            env=self.env,
+            token=self.datahub_settings.token,
+            timeout_sec=self.datahub_settings.timeout_sec,
+            retry_max_times=self.datahub_settings.retry_max_times,
+        )
+        graph_client = DataHubGraphClient(
+            connection_settings=connection_settings,
+            breaker=CircuitBreaker(
+                failure_threshold=self.datahub_settings.breaker_failure_threshold,
+                reset_timeout_sec=self.datahub_settings.breaker_reset_sec,
+            ),
+        )
         gateway = DataHubRuntimeLineage(
             client_config=DataHubLineageRuntimeConfig(
-                connection_settings=DataHubRuntimeConnectionSettings(
-                    server=self.datahub_settings.server,
-                    env=self.env,
-                    token=self.datahub_settings.token,
-                    timeout_sec=self.datahub_settings.timeout_sec,
-                    retry_max_times=self.datahub_settings.retry_max_times,
-                ),
+                connection_settings=connection_settings,
                 data_job_key=self.data_job_key,
-            )
+            ),
+            graph_client=graph_client,
+            emitter=self._build_emitter(graph_client),
+            dataset_cache=DatasetPropertiesCache(
+                max_entries=self.datahub_settings.dataset_cache_entries,
+                path=self.datahub_settings.dataset_cache_path or None,
+                max_store_entries=self.datahub_settings.dataset_cache_store_entries,
+            ),
+            job_config_store=self._build_job_config_store(),
         )
         gateway.resolve_job_metadata()
-        return gateway
+        if self.datahub_settings.run_mode != "aggregated":
+            return gateway
+        aggregated = AggregatingRuntimeLineage(
+            gateway,
+            max_items=self.datahub_settings.window_max_items,
+            max_window_sec=self.datahub_settings.window_max_sec,
+        )
+        # Registered after the emitter's shutdown flush, so it runs first.
+        atexit.register(aggregated.close)
+        return aggregated
+
+    def _build_job_config_store(self) -> JobConfigBundleStore | None:
+        """Read job config from the compiled bundle when ``JOB_CONFIG_BUNDLE_PATH`` is set."""
+        if not self.datahub_settings.job_config_bundle_path:
+            return None
+        return JobConfigBundleStore(
+            self.datahub_settings.job_config_bundle_path,
+            refresh_interval_sec=self.datahub_settings.job_config_refresh_sec,
+        )
+
+    def _build_emitter(self, graph_client: DataHubGraphClient) -> McpEmitter:
+        """Emit inline in ``sync`` mode; otherwise through a background emitter flushed at shutdown.
+
+        With ``spool_dir`` set, MCPs DataHub cannot take are spooled to disk
+        and replayed in the background, and ``spill`` overflow goes to the
+        same spool.
+        """
+        sink: McpEmitter = graph_client
+        spool = None
+        if self.datahub_settings.spool_dir:
+            spool = McpSpool(
+                directory=self.datahub_settings.spool_dir,
+                segment_max_bytes=self.datahub_settings.spool_segment_bytes,
+                max_total_bytes=self.datahub_settings.spool_max_bytes,
+            )
+            sink = SpoolingMcpEmitter(
+                graph_client,
+                spool,
+                replay_interval_sec=self.datahub_settings.spool_replay_interval_sec,
+            )
+        if self.datahub_settings.emit_mode == "sync":
+            return sink
+        emitter = BufferedMcpEmitter(
+            sink,
+            max_queue_size=self.datahub_settings.emit_queue_size,
+            max_batch_mcps=self.datahub_settings.emit_batch_size,
+            flush_interval_sec=self.datahub_settings.emit_flush_interval_sec,
+            overflow_policy=self.datahub_settings.emit_overflow_policy,
+            shutdown_timeout_sec=self.datahub_settings.emit_shutdown_timeout_sec,
+            overflow_sink=spool,
+        )
+        install_shutdown_flush(emitter)
+        return emitter
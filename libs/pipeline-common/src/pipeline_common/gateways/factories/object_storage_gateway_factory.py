@@ -1,22 +1,62 @@
 """Object storage gateway factory for worker runtime."""
 
-from pipeline_common.gateways.object_storage import ObjectStorageGateway, S3Client
+from urllib.parse import urlparse
+
+from pipeline_common.gateways.object_storage import (
+    CachingObjectStorageGateway,
+    CompressionPolicy,
+    DiskReadCache,
+    LocalFileSystemClient,
+    ObjectStorageGateway,
+    S3Client,
+)
+from pipeline_common.gateways.object_storage.object_storage import ObjectStorageClient
 from pipeline_common.gateways.object_storage.settings import S3StorageSettings
 
 
+LOCAL_FILESYSTEM_SCHEME = LocalFileSystemClient.URI_SCHEME
+
+
 class ObjectStorageGatewayFactory:
-    """Create object storage gateway from S3 runtime settings."""
+    """Create object storage gateway from S3 runtime settings.
+
+    ``S3_ENDPOINT=local:///<root>`` selects ``LocalFileSystemClient`` rooted at
+    ``/<root>``; any other endpoint is treated as an S3-compatible HTTP URL.
+    ``OBJECT_CACHE_DIR`` wraps either client in the read-through disk cache and
+    ``OBJECT_STORAGE_COMPRESSION`` selects per-prefix write codecs.
+    """
 
     def __init__(self, *, s3_settings: S3StorageSettings) -> None:
         self.s3_settings = s3_settings
 
     def build(self) -> ObjectStorageGateway:
         """Create object storage gateway for one worker."""
-        return ObjectStorageGateway(
-            S3Client(
-                endpoint_url=self.s3_settings.s3_endpoint,
-                access_key=self.s3_settings.s3_access_key,
-                secret_key=self.s3_settings.s3_secret_key,
-                region_name=self.s3_settings.aws_region,
+        client = self._build_client()
+        compression = CompressionPolicy.from_spec(self.s3_settings.object_compression)
+        if self.s3_settings.object_cache_dir is None:
+            return ObjectStorageGateway(client, compression=compression)
+        return CachingObjectStorageGateway(
+            client,
+            cache=DiskReadCache(
+                directory=self.s3_settings.object_cache_dir,
+                max_bytes=self.s3_settings.object_cache_max_bytes,
+            ),
+            immutable_prefixes=self.s3_settings.object_cache_immutable_prefixes,
+            compression=compression,
+        )
+
+    def _build_client(self) -> ObjectStorageClient:
+        """Select the storage client from the endpoint URI scheme."""
+        parsed = urlparse(self.s3_settings.s3_endpoint)
+        if parsed.scheme == LOCAL_FILESYSTEM_SCHEME:
+            return LocalFileSystemClient(
+                root=f"{parsed.netloc}{parsed.path}",
+                max_concurrency=self.s3_settings.s3_max_pool_connections,
             )
+        return S3Client(
+            endpoint_url=self.s3_settings.s3_endpoint,
+            access_key=self.s3_settings.s3_access_key,
+            secret_key=self.s3_settings.s3_secret_key,
+            region_name=self.s3_settings.aws_region,
+            max_pool_connections=self.s3_settings.s3_max_pool_connections,
         )
@@ -1,13 +1,29 @@
 """Stage queue gateway factory for worker runtime."""
 
 from typing import Any
+from urllib.parse import urlparse
 
-from pipeline_common.gateways.queue import QueueGateway
+from pipeline_common.gateways.queue import (
+    AsyncQueueGateway,
+    InMemoryBroker,
+    InMemoryQueueBackend,
+    PikaQueueBackend,
+    QueueBackend,
+    QueueGateway,
+)
 from pipeline_common.gateways.queue.settings import QueueRuntimeSettings
 
 
+IN_MEMORY_BROKER_SCHEME = "memory"
+
+
 class QueueGatewayFactory:
-    """Create stage queue gateway from queue runtime settings and job config."""
+    """Create stage queue gateway from queue runtime settings and job config.
+
+    ``BROKER_URL=memory://<name>`` selects the in-process backend on the
+    shared ``InMemoryBroker`` called ``<name>``; any other URL is treated as
+    an AMQP URL for RabbitMQ.
+    """
 
     def __init__(self, *, queue_settings: QueueRuntimeSettings, queue_config: dict[str, Any]) -> None:
         self.queue_settings = queue_settings
@@ -16,6 +32,38 @@ class QueueGatewayFactory:
     def build(self) -> QueueGateway:
         """Create stage queue gateway for one worker."""
         return QueueGateway(
-            self.queue_settings.broker_url,
+            self._build_backend(),
             queue_config=self.queue_config,
         )
+
+    def _build_backend(self) -> QueueBackend:
+        """Select the broker backend from the broker URL scheme."""
+        broker_url = self.queue_settings.broker_url
+        parsed = urlparse(broker_url)
+        if parsed.scheme == IN_MEMORY_BROKER_SCHEME:
+            return InMemoryQueueBackend(InMemoryBroker.shared(parsed.netloc or "default"))
+        return PikaQueueBackend.from_queue_config(
+            broker_url,
+            self.queue_config,
+            heartbeat_seconds=self.queue_settings.heartbeat_seconds,
+        )
+
+
+class AsyncQueueGatewayFactory:
+    """Create asyncio stage queue gateway from queue runtime settings and job config.
+
+    The async gateway wraps the same ``QueueGateway`` (and backend selection)
+    as ``QueueGatewayFactory``; ``job.queue.max_in_flight`` defaults to
+    ``prefetch_count``.
+    """
+
+    def __init__(self, *, queue_settings: QueueRuntimeSettings, queue_config: dict[str, Any]) -> None:
+        self.queue_settings = queue_settings
+        self.queue_config = queue_config
+
+    def build(self) -> AsyncQueueGateway:
+        """Create async stage queue gateway for one worker."""
+        return AsyncQueueGateway(
+            QueueGatewayFactory(queue_settings=self.queue_settings, queue_config=self.queue_config).build(),
+            max_in_flight=int(self.queue_config.get("max_in_flight", self.queue_config.get("prefetch_count", 1))),
+        )
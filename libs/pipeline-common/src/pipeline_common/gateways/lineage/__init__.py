@@ -1,12 +1,32 @@
+from .aggregation import AggregatingRuntimeLineage
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
 from .contracts import DataHubDataJobKey, DatasetPlatform, ResolvedDataHubFlowConfig
+from .dataset_cache import DatasetCacheStats, DatasetPropertiesCache
+from .emitter import BufferedMcpEmitter, EmitterStats, McpEmitter
+from .job_config_bundle import JobConfigBundle, JobConfigBundleStore, JobConfigEntry
 from .lineage import (
     DataHubGraphClient,
     DataHubJobMetadataResolver,
     DataHubRuntimeLineage,
 )
 from .runtime_contracts import LineageRuntimeGateway
+from .spool import McpSpool, SpoolingMcpEmitter, SpoolStats
 
 __all__ = [
+    "AggregatingRuntimeLineage",
+    "BufferedMcpEmitter",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "DatasetCacheStats",
+    "DatasetPropertiesCache",
+    "EmitterStats",
+    "JobConfigBundle",
+    "JobConfigBundleStore",
+    "JobConfigEntry",
+    "McpEmitter",
+    "McpSpool",
+    "SpoolingMcpEmitter",
+    "SpoolStats",
     "DataHubGraphClient",
     "DataHubRuntimeLineage",
     "DataHubJobMetadataResolver",
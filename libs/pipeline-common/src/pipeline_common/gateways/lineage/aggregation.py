@@ -0,0 +1,182 @@
+"""Windowed runtime lineage: one DataProcessInstance per batch of work items.
+
+Layer:
+- Infrastructure adapter implementing ``LineageRuntimeGateway`` on top of
+  ``DataHubRuntimeLineage``.
+
+Role:
+- Keep the per-item ``start_run``/``add_*``/``complete_run`` calls workers
+  already make, but emit one DataProcessInstance per window instead of one per
+  item, so chunk-granularity stages (embed, index) do not send ten MCPs per
+  chunk.
+
+Design intent:
+- The first ``start_run`` of a window starts the underlying run (``STARTED``
+  event); later items join it. Input/output URNs are deduplicated across the
+  window by ``DataHubRuntimeLineage``.
+- A window closes after ``max_items`` items, or ``max_window_sec`` after it
+  opened (checked at item boundaries and by a timer while the worker idles),
+  or on ``flush``/``close``. Batch workers call ``flush`` after settling each
+  consumed batch, so a window never spans two batches. Closing emits one
+  terminal event whose custom properties carry ``items_total`` and
+  ``items_failed``.
+- ``fail_run`` records a per-item failure: it is counted, logged with the
+  window DPI URN, and the last error message is kept on the window. The
+  window's run result is ``FAILURE`` only when every item in it failed.
+
+Non-goals:
+- No per-item DataProcessInstance; the inputs of failed items stay on the
+  window's input edges.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from pipeline_common.gateways.lineage.contracts import DatasetPlatform, ResolvedDataHubFlowConfig
+from pipeline_common.gateways.lineage.urns import DataHubUrnFactory
+
+from .runtime_contracts import LineageRuntimeGateway, RunSpec
+
+logger = logging.getLogger(__name__)
+
+
+class AggregatingRuntimeLineage(LineageRuntimeGateway):
+    """Lineage gateway that folds per-item runs into one run per time/size window."""
+
+    def __init__(
+        self,
+        gateway: LineageRuntimeGateway,
+        *,
+        max_items: int = 500,
+        max_window_sec: float = 60.0,
+    ) -> None:
+        """Wrap ``gateway``; it must not be used directly while wrapped."""
+        if max_items <= 0 or max_window_sec <= 0:
+            raise ValueError("max_items and max_window_sec must be greater than zero")
+        self.gateway = gateway
+        self.max_items = max_items
+        self.max_window_sec = max_window_sec
+        self._lock = threading.RLock()
+        self._window: RunSpec | None = None
+        self._window_opened_at = 0.0
+        self._timer: threading.Timer | None = None
+        self._item_open = False
+        self._items_total = 0
+        self._items_failed = 0
+        self._last_error: str | None = None
+
+    @property
+    def resolved_job_config(self) -> ResolvedDataHubFlowConfig:
+        return self.gateway.resolved_job_config
+
+    def resolve_job_metadata(self) -> ResolvedDataHubFlowConfig:
+        return self.gateway.resolve_job_metadata()
+
+    def start_run(self) -> RunSpec:
+        """Start one item, opening a new window when none is open."""
+        with self._lock:
+            if self._window is None:
+                self._open_window()
+            self._item_open = True
+            return self._window
+
+    def add_input(self, name: str, platform: DatasetPlatform) -> str:
+        with self._lock:
+            self._require_item("adding input")
+            return self.gateway.add_input(name=name, platform=platform)
+
+    def add_output(self, name: str, platform: DatasetPlatform) -> str:
+        with self._lock:
+            self._require_item("adding output")
+            return self.gateway.add_output(name=name, platform=platform)
+
+    def complete_run(self) -> str:
+        """Count the current item as succeeded; return the window DPI URN."""
+        with self._lock:
+            self._require_item("completing run")
+            return self._finish_item(error_message=None)
+
+    def fail_run(self, error_message: str | None) -> str:
+        """Record the current item as failed; return the window DPI URN."""
+        with self._lock:
+            self._require_item("failing run")
+            dpi_urn = self._finish_item(error_message=error_message or "unknown error")
+            logger.warning("Lineage item failed in window %s: %s", dpi_urn, error_message)
+            return dpi_urn
+
+    def abort_run(self) -> None:
+        """Drop the current item from the counts; the window stays open."""
+        with self._lock:
+            self._item_open = False
+
+    def flush(self) -> None:
+        """Close the open window, if any, once the current item finished."""
+        with self._lock:
+            if self._window is not None and not self._item_open:
+                self._close_window()
+
+    def close(self) -> None:
+        """Close the open window regardless of an unfinished item (shutdown)."""
+        with self._lock:
+            self._item_open = False
+            if self._window is not None:
+                self._close_window()
+
+    def _require_item(self, action: str) -> None:
+        if not self._item_open or self._window is None:
+            raise ValueError(f"No active run context available for {action}.")
+
+    def _finish_item(self, *, error_message: str | None) -> str:
+        dpi_urn = DataHubUrnFactory.data_process_instance_urn(run_id=self._window.run_id)
+        self._item_open = False
+        self._items_total += 1
+        if error_message is not None:
+            self._items_failed += 1
+            self._last_error = error_message
+        if self._items_total >= self.max_items or self._window_age() >= self.max_window_sec:
+            self._close_window()
+        return dpi_urn
+
+    def _open_window(self) -> None:
+        self._window = self.gateway.start_run()
+        self._window_opened_at = time.monotonic()
+        self._items_total = 0
+        self._items_failed = 0
+        self._last_error = None
+        self._timer = threading.Timer(self.max_window_sec, self._close_due_window)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _close_due_window(self) -> None:
+        with self._lock:
+            if self._window is not None and not self._item_open and self._window_age() >= self.max_window_sec:
+                self._close_window()
+
+    def _close_window(self) -> None:
+        window = self._window
+        self._window = None
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if window is None:
+            return
+        if self._items_total == 0:
+            self.gateway.abort_run()
+            return
+        window.custom_properties.items_total = self._items_total
+        window.custom_properties.items_failed = self._items_failed
+        try:
+            if self._items_failed == self._items_total:
+                self.gateway.fail_run(error_message=self._last_error)
+            else:
+                window.custom_properties.error_message = self._last_error
+                self.gateway.complete_run()
+        except Exception:
+            logger.exception("Could not emit lineage window %s", window.run_id)
+            self.gateway.abort_run()
+
+    def _window_age(self) -> float:
+        return time.monotonic() - self._window_opened_at
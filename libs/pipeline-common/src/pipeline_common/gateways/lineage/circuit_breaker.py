@@ -0,0 +1,94 @@
+"""Circuit breaker for DataHub calls.
+
+Layer:
+- Infrastructure helper used by ``DataHubGraphClient``.
+
+Role:
+- Stop paying a DataHub timeout per call while DataHub is down: after
+  ``failure_threshold`` consecutive failures calls fail fast with
+  ``CircuitOpenError`` for ``reset_timeout_sec``, then one trial call decides
+  whether the circuit closes again.
+
+Non-goals:
+- No retries; callers decide what to do with a failed or rejected call.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, TypeVar
+
+TResult = TypeVar("TResult")
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling DataHub while the circuit is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open trial call."""
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 3,
+        reset_timeout_sec: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed circuit."""
+        if failure_threshold <= 0 or reset_timeout_sec <= 0:
+            raise ValueError("failure_threshold and reset_timeout_sec must be greater than zero")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_sec = reset_timeout_sec
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """``closed``, ``open`` or ``half_open`` (the reset timeout passed; the next call is a trial)."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._clock() - self._opened_at < self.reset_timeout_sec:
+                return "open"
+            return "half_open"
+
+    def call(self, fn: Callable[..., TResult], *args: object, **kwargs: object) -> TResult:
+        """Call ``fn`` unless the circuit is open; record its outcome.
+
+        Raises:
+            CircuitOpenError: When the circuit is open or a trial call is already running.
+        """
+        self._before_call()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self._record_failure()
+            raise
+        self._record_success()
+        return result
+
+    def _before_call(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._clock() - self._opened_at < self.reset_timeout_sec or self._trial_in_flight:
+                raise CircuitOpenError("DataHub circuit is open")
+            self._trial_in_flight = True
+
+    def _record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+
+    def _record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
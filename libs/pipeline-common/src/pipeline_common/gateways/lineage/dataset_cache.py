@@ -0,0 +1,187 @@
+"""Cache of dataset URNs whose ``datasetProperties`` DataHub already accepted.
+
+Layer:
+- Infrastructure helper used by ``DataHubRuntimeLineage``.
+
+Role:
+- Skip re-emitting ``datasetProperties`` for URNs DataHub already has,
+  across worker restarts and replicas, without an unbounded in-process set.
+
+Design intent:
+- A bounded in-memory LRU (``max_entries``) answers repeated URNs of one
+  process without I/O.
+- With ``path`` set, URNs are also stored in a SQLite file (WAL mode), so a
+  restarted worker, or another worker on the same volume, does not emit
+  them again. LRU misses are looked up there and promoted into the LRU.
+  The store keeps at most ``max_store_entries`` rows, trimming the oldest.
+- A URN is cached (and persisted) only by ``add``, which the gateway calls
+  once DataHub accepted the MCP. Between the emit and that confirmation the
+  URN is pending: ``contains`` still answers ``True`` so a busy worker does
+  not queue the same upsert again, but only for ``pending_ttl_sec``, after
+  which an unconfirmed (dropped or failed) emit is retried.
+- Store errors are logged and treated as misses; a broken cache costs
+  duplicate emits, never a failed run.
+
+Non-goals:
+- No invalidation: properties are only the dataset name, which never
+  changes for a URN.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_TRIM_EVERY_INSERTS = 1000
+
+
+@dataclass(frozen=True)
+class DatasetCacheStats:
+    """Point-in-time cache counters; ``avoided_emits`` counts skipped ``datasetProperties`` MCPs."""
+
+    avoided_emits: int
+    store_hits: int
+    misses: int
+    evictions: int
+    entries: int
+    pending: int
+
+
+class DatasetPropertiesCache:
+    """Bounded LRU of confirmed dataset URNs with an optional SQLite store."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 100_000,
+        path: str | None = None,
+        max_store_entries: int = 5_000_000,
+        pending_ttl_sec: float = 300.0,
+    ) -> None:
+        """Initialize the LRU and open the store when ``path`` is set."""
+        if max_entries <= 0 or max_store_entries <= 0:
+            raise ValueError("max_entries and max_store_entries must be greater than zero")
+        if pending_ttl_sec <= 0:
+            raise ValueError("pending_ttl_sec must be greater than zero")
+        self.max_entries = max_entries
+        self.max_store_entries = max_store_entries
+        self.pending_ttl_sec = pending_ttl_sec
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, None] = OrderedDict()
+        self._pending: OrderedDict[str, float] = OrderedDict()
+        self._avoided_emits = 0
+        self._store_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._inserts_since_trim = 0
+        self._store: sqlite3.Connection | None = self._open_store(path) if path else None
+
+    def contains(self, urn: str) -> bool:
+        """Return whether ``urn`` was confirmed or its emit is pending; a hit counts as an avoided emit."""
+        with self._lock:
+            if urn in self._entries:
+                self._entries.move_to_end(urn)
+                self._avoided_emits += 1
+                return True
+            pending_since = self._pending.get(urn)
+            if pending_since is not None and time.monotonic() - pending_since < self.pending_ttl_sec:
+                self._avoided_emits += 1
+                return True
+            if self._store_contains(urn):
+                self._remember(urn)
+                self._avoided_emits += 1
+                self._store_hits += 1
+                return True
+            self._misses += 1
+            return False
+
+    def mark_pending(self, urn: str) -> None:
+        """Record that a ``datasetProperties`` MCP for ``urn`` was handed to the emitter."""
+        with self._lock:
+            self._pending[urn] = time.monotonic()
+            self._pending.move_to_end(urn)
+            while len(self._pending) > self.max_entries:
+                self._pending.popitem(last=False)
+
+    def discard_pending(self, urn: str) -> None:
+        """Forget a pending emit that failed before it was queued."""
+        with self._lock:
+            self._pending.pop(urn, None)
+
+    def add(self, urn: str) -> None:
+        """Record ``urn`` as accepted by DataHub in the LRU and the store."""
+        with self._lock:
+            self._pending.pop(urn, None)
+            self._remember(urn)
+            self._store_add(urn)
+
+    def close(self) -> None:
+        """Close the store connection."""
+        with self._lock:
+            if self._store is not None:
+                self._store.close()
+                self._store = None
+
+    @property
+    def stats(self) -> DatasetCacheStats:
+        """Snapshot of cache counters."""
+        with self._lock:
+            return DatasetCacheStats(
+                avoided_emits=self._avoided_emits,
+                store_hits=self._store_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                pending=len(self._pending),
+            )
+
+    def _remember(self, urn: str) -> None:
+        self._entries[urn] = None
+        self._entries.move_to_end(urn)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    @staticmethod
+    def _open_store(path: str) -> sqlite3.Connection | None:
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("CREATE TABLE IF NOT EXISTS emitted_datasets (urn TEXT PRIMARY KEY)")
+            return connection
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("Dataset properties store %s unavailable; using memory only: %s", path, exc)
+            return None
+
+    def _store_contains(self, urn: str) -> bool:
+        if self._store is None:
+            return False
+        try:
+            return self._store.execute("SELECT 1 FROM emitted_datasets WHERE urn = ?", (urn,)).fetchone() is not None
+        except sqlite3.Error as exc:
+            logger.warning("Dataset properties store lookup failed: %s", exc)
+            return False
+
+    def _store_add(self, urn: str) -> None:
+        if self._store is None:
+            return
+        try:
+            self._store.execute("INSERT OR IGNORE INTO emitted_datasets (urn) VALUES (?)", (urn,))
+            self._inserts_since_trim += 1
+            if self._inserts_since_trim >= _TRIM_EVERY_INSERTS:
+                self._inserts_since_trim = 0
+                self._store.execute(
+                    "DELETE FROM emitted_datasets WHERE rowid <= (SELECT MAX(rowid) FROM emitted_datasets) - ?",
+                    (self.max_store_entries,),
+                )
+        except sqlite3.Error as exc:
+            logger.warning("Dataset properties store insert failed: %s", exc)
@@ -0,0 +1,311 @@
+"""Background MCP emission for runtime lineage.
+
+Layer:
+- Infrastructure helper between ``DataHubRuntimeLineage`` and ``DataHubGraphClient``.
+
+Role:
+- Take MCP emission off the worker hot path: ``emit_mcps`` only enqueues,
+  and one background thread sends queued MCPs to DataHub in batched REST
+  calls.
+
+Design intent:
+- One sender thread drains a FIFO queue, so the MCPs of one run still reach
+  DataHub in the order they were produced (STARTED before COMPLETE).
+- Queued MCP lists are coalesced into one ``emit_mcps`` call of up to
+  ``max_batch_mcps`` MCPs, or whatever is queued after ``flush_interval_sec``.
+- The queue is bounded. When it is full the overflow policy decides:
+  ``block`` waits up to ``block_timeout_sec`` and then drops, ``drop``
+  drops at once, and ``spill`` hands the queued backlog and then the new
+  MCPs to an overflow sink (the ``McpSpool``), oldest first. Spilling runs
+  on the sender thread once its in-flight batch settled, and later MCPs queue
+  up behind the overflow until it is spilled, so the spool never receives an
+  older batch after newer ones.
+- ``close`` flushes within ``shutdown_timeout_sec``; ``install_shutdown_flush``
+  runs it at interpreter exit and turns ``SIGTERM`` into a normal exit.
+
+Non-goals:
+- Send failures are logged and counted, never raised to the worker.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import signal
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+
+logger = logging.getLogger(__name__)
+
+LINEAGE_OVERFLOW_POLICIES = ("block", "drop", "spill")
+_STOP = object()
+_WAKE = object()
+
+
+class McpEmitter(Protocol):
+    """Port for anything that accepts ordered MCP lists."""
+
+    def emit_mcps(self, mcps: list[MetadataChangeProposalWrapper]) -> None:
+        """Emit MCPs in the provided order."""
+
+
+@dataclass(frozen=True)
+class EmitterStats:
+    """Point-in-time emitter counters, in MCPs."""
+
+    enqueued: int
+    emitted: int
+    failed: int
+    dropped: int
+    spilled: int
+    pending: int
+
+
+class BufferedMcpEmitter:
+    """Bounded-queue MCP emitter with a single background sender thread."""
+
+    def __init__(
+        self,
+        sink: McpEmitter,
+        *,
+        max_queue_size: int = 1000,
+        max_batch_mcps: int = 100,
+        flush_interval_sec: float = 1.0,
+        overflow_policy: str = "block",
+        block_timeout_sec: float = 1.0,
+        shutdown_timeout_sec: float = 10.0,
+        overflow_sink: McpEmitter | None = None,
+    ) -> None:
+        """Start the sender thread.
+
+        Args:
+            sink: Emitter that performs the REST calls, usually ``DataHubGraphClient``.
+            max_queue_size: Maximum queued ``emit_mcps`` calls.
+            max_batch_mcps: Maximum MCPs sent in one REST call.
+            flush_interval_sec: Longest wait for more MCPs before a partial batch is sent.
+            overflow_policy: ``block``, ``drop`` or ``spill`` when the queue is full.
+            block_timeout_sec: Longest ``block`` wait before the MCPs are dropped.
+            shutdown_timeout_sec: Longest ``close`` wait for queued MCPs to be sent.
+            overflow_sink: Receives overflowing MCPs under the ``spill`` policy.
+        """
+        if overflow_policy not in LINEAGE_OVERFLOW_POLICIES:
+            raise ValueError(f"overflow_policy must be one of {LINEAGE_OVERFLOW_POLICIES}, got {overflow_policy!r}")
+        if overflow_policy == "spill" and overflow_sink is None:
+            raise ValueError("overflow_policy 'spill' requires an overflow_sink")
+        if max_queue_size <= 0 or max_batch_mcps <= 0:
+            raise ValueError("max_queue_size and max_batch_mcps must be greater than zero")
+        self.sink = sink
+        self.overflow_sink = overflow_sink
+        self.max_batch_mcps = max_batch_mcps
+        self.flush_interval_sec = flush_interval_sec
+        self.overflow_policy = overflow_policy
+        self.block_timeout_sec = block_timeout_sec
+        self.shutdown_timeout_sec = shutdown_timeout_sec
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Condition()
+        self._pending = 0
+        self._enqueued = 0
+        self._emitted = 0
+        self._failed = 0
+        self._dropped = 0
+        self._spilled = 0
+        self._overflow_backlog: list[list[MetadataChangeProposalWrapper]] = []
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="lineage-mcp-emitter", daemon=True)
+        self._thread.start()
+
+    def emit_mcps(self, mcps: list[MetadataChangeProposalWrapper]) -> None:
+        """Queue MCPs for background emission; never raises for DataHub errors."""
+        if not mcps:
+            return
+        if self._closed:
+            raise RuntimeError("BufferedMcpEmitter is closed")
+        with self._lock:
+            self._pending += len(mcps)
+            if self._overflow_backlog:
+                # A spill is pending; stay behind it.
+                self._defer_to_spill(mcps)
+                return
+        try:
+            if self.overflow_policy == "block":
+                self._queue.put(list(mcps), timeout=self.block_timeout_sec)
+            else:
+                self._queue.put_nowait(list(mcps))
+        except queue.Full:
+            if self.overflow_sink is not None:
+                with self._lock:
+                    self._defer_to_spill(mcps)
+                return
+            self._settle(len(mcps))
+            self._drop(len(mcps))
+            return
+        with self._lock:
+            self._enqueued += len(mcps)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued MCP was sent or failed; return ``False`` on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while self._pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._lock.wait(remaining)
+        return True
+
+    def close(self) -> None:
+        """Flush within ``shutdown_timeout_sec`` and stop the sender thread."""
+        if self._closed:
+            return
+        self._closed = True
+        if not self.flush(self.shutdown_timeout_sec):
+            logger.warning("Lineage emitter closed with %s MCPs not sent", self.stats.pending)
+        self._queue.put(_STOP)
+        self._thread.join(timeout=self.shutdown_timeout_sec)
+
+    @property
+    def stats(self) -> EmitterStats:
+        """Snapshot of emitter counters."""
+        with self._lock:
+            return EmitterStats(
+                enqueued=self._enqueued,
+                emitted=self._emitted,
+                failed=self._failed,
+                dropped=self._dropped,
+                spilled=self._spilled,
+                pending=self._pending,
+            )
+
+    def _drop(self, count: int) -> None:
+        with self._lock:
+            self._dropped += count
+        logger.warning("Lineage emitter queue full; dropped %s MCPs", count)
+
+    def _defer_to_spill(self, mcps: list[MetadataChangeProposalWrapper]) -> None:
+        """Hold overflowing MCPs for the sender thread to spill; callers hold ``_lock``.
+
+        The held backlog is bounded like the queue; beyond it MCPs are dropped.
+        """
+        if len(self._overflow_backlog) >= self._queue.maxsize:
+            self._pending -= len(mcps)
+            self._dropped += len(mcps)
+            self._lock.notify_all()
+            logger.warning("Lineage spill backlog full; dropped %s MCPs", len(mcps))
+            return
+        self._overflow_backlog.append(list(mcps))
+        try:
+            self._queue.put_nowait(_WAKE)
+        except queue.Full:
+            pass  # The queue is not empty, so the sender is not blocked on it.
+
+    def _spill_overflow(self) -> bool:
+        """Sender thread: spill the queued MCPs, then the overflow backlog, oldest first.
+
+        Returns:
+            ``True`` when a stop marker was found in the queue.
+        """
+        with self._lock:
+            if not self._overflow_backlog:
+                return False
+        stop = False
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                stop = True
+                break
+            if item is _WAKE:
+                continue
+            with self._lock:
+                self._enqueued -= len(item)
+            self._spill(item)
+        with self._lock:
+            overflow, self._overflow_backlog = self._overflow_backlog, []
+        for mcps in overflow:
+            self._spill(mcps)
+        return stop
+
+    def _spill(self, mcps: list[MetadataChangeProposalWrapper]) -> None:
+        try:
+            self.overflow_sink.emit_mcps(mcps)
+        except Exception:
+            logger.exception("Could not spill %s lineage MCPs", len(mcps))
+            self._drop(len(mcps))
+        else:
+            with self._lock:
+                self._spilled += len(mcps)
+        self._settle(len(mcps))
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._spill_overflow()
+                return
+            if item is _WAKE:
+                if self._spill_overflow():
+                    return
+                continue
+            batch: list[MetadataChangeProposalWrapper] = list(item)
+            stop = self._fill_batch(batch)
+            self._send(batch)
+            if self._spill_overflow() or stop:
+                return
+
+    def _fill_batch(self, batch: list[MetadataChangeProposalWrapper]) -> bool:
+        """Add queued MCP lists to ``batch`` until it is full or the flush interval passes."""
+        deadline = time.monotonic() + self.flush_interval_sec
+        while len(batch) < self.max_batch_mcps:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                return False
+            if item is _STOP:
+                return True
+            if item is _WAKE:
+                return False
+            batch.extend(item)
+        return False
+
+    def _send(self, batch: list[MetadataChangeProposalWrapper]) -> None:
+        for start in range(0, len(batch), self.max_batch_mcps):
+            chunk = batch[start : start + self.max_batch_mcps]
+            try:
+                self.sink.emit_mcps(chunk)
+                failed = False
+            except Exception as exc:
+                logger.warning("Could not emit %s lineage MCPs: %s", len(chunk), exc)
+                failed = True
+            with self._lock:
+                if failed:
+                    self._failed += len(chunk)
+                else:
+                    self._emitted += len(chunk)
+            self._settle(len(chunk))
+
+    def _settle(self, count: int) -> None:
+        with self._lock:
+            self._pending -= count
+            self._lock.notify_all()
+
+
+def install_shutdown_flush(emitter: BufferedMcpEmitter) -> None:
+    """Close ``emitter`` at interpreter exit and make ``SIGTERM`` exit normally so that happens.
+
+    The ``SIGTERM`` handler is only installed from the main thread and only
+    when no other handler is set, so worker-defined handlers are kept.
+    """
+    atexit.register(emitter.close)
+    if threading.current_thread() is not threading.main_thread():
+        return
+    if signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
@@ -0,0 +1,264 @@
+"""Compiled job-config bundle: DataJob custom properties available offline.
+
+Layer:
+- Contract shared by ``gov_governance`` (compiles the bundle from
+  ``600_jobs`` definitions) and worker startup (reads it).
+
+Role:
+- Let ``DataHubJobMetadataResolver`` take job custom properties from a local
+  file instead of a ``DataJobInfo`` round-trip to DataHub, so worker cold
+  start does not depend on DataHub latency or availability.
+
+Design intent:
+- The bundle is one JSON document: ``format``, ``checksum``, ``compiled_at``
+  and one entry per job (``flow_platform``/``flow_id``/``job_id``, its
+  ``custom_properties`` and their checksum). The bundle checksum covers the
+  jobs only, so it doubles as the bundle version: compiling unchanged
+  definitions yields the same checksum.
+- ``JobConfigBundleStore`` loads the bundle once and, for each job it served,
+  re-reads ``DataJobInfo`` from DataHub every ``refresh_interval_sec`` in a
+  background thread. When DataHub's properties checksum differs, the entry
+  and the file are rewritten, so the next start uses the governed values.
+
+Non-goals:
+- A refresh does not reconfigure a running worker; job properties are
+  parsed once at startup, as with the live lookup.
+- A missing or corrupt bundle is logged and ignored; resolution falls back
+  to the live DataHub lookup.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Mapping, Protocol
+
+from datahub.metadata.schema_classes import DataJobInfoClass
+
+from pipeline_common.gateways.lineage.contracts import DataHubDataJobKey
+
+logger = logging.getLogger(__name__)
+
+JOB_CONFIG_BUNDLE_FORMAT = "job-config-bundle/1"
+
+
+class JobInfoReader(Protocol):
+    """Read-port for live DataJob metadata (``DataHubGraphClient``)."""
+
+    def get_datajob_info(self, job_urn: str) -> DataJobInfoClass | None:
+        """Fetch DataJob metadata for a single job URN."""
+
+
+def properties_checksum(custom_properties: Mapping[str, str]) -> str:
+    """Return the SHA-256 of ``custom_properties`` in canonical JSON form."""
+    canonical = json.dumps(dict(custom_properties), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class JobConfigEntry:
+    """Custom properties of one DataJob."""
+
+    flow_platform: str
+    flow_id: str
+    job_id: str
+    custom_properties: dict[str, str]
+
+    @property
+    def key(self) -> DataHubDataJobKey:
+        return DataHubDataJobKey(flow_id=self.flow_id, job_id=self.job_id, flow_platform=self.flow_platform)
+
+    @property
+    def checksum(self) -> str:
+        return properties_checksum(self.custom_properties)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "flow_platform": self.flow_platform,
+            "flow_id": self.flow_id,
+            "job_id": self.job_id,
+            "checksum": self.checksum,
+            "custom_properties": dict(sorted(self.custom_properties.items())),
+        }
+
+
+@dataclass(frozen=True)
+class JobConfigBundle:
+    """Versioned set of job configs; ``checksum`` identifies the version."""
+
+    jobs: dict[DataHubDataJobKey, JobConfigEntry]
+    compiled_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    @classmethod
+    def from_entries(cls, entries: list[JobConfigEntry]) -> "JobConfigBundle":
+        """Build a bundle, rejecting duplicate job keys."""
+        jobs: dict[DataHubDataJobKey, JobConfigEntry] = {}
+        for entry in entries:
+            if entry.key in jobs:
+                raise ValueError(f"Duplicate job in job config bundle: {entry.flow_id}/{entry.job_id}")
+            jobs[entry.key] = entry
+        return cls(jobs=jobs)
+
+    @property
+    def checksum(self) -> str:
+        return hashlib.sha256(json.dumps(self._job_dicts(), sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get(self, key: DataHubDataJobKey) -> JobConfigEntry | None:
+        return self.jobs.get(key)
+
+    def with_entry(self, entry: JobConfigEntry) -> "JobConfigBundle":
+        """Return a copy with ``entry`` added or replaced."""
+        return JobConfigBundle(jobs={**self.jobs, entry.key: entry})
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "format": JOB_CONFIG_BUNDLE_FORMAT,
+                "checksum": self.checksum,
+                "compiled_at": self.compiled_at,
+                "jobs": self._job_dicts(),
+            },
+            indent=2,
+            sort_keys=True,
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> "JobConfigBundle":
+        """Parse a bundle, validating format and checksums.
+
+        Raises:
+            ValueError: Unknown format or a checksum mismatch.
+        """
+        payload = json.loads(text)
+        if payload.get("format") != JOB_CONFIG_BUNDLE_FORMAT:
+            raise ValueError(f"Unsupported job config bundle format: {payload.get('format')!r}")
+        entries = []
+        for job in payload.get("jobs", []):
+            entry = JobConfigEntry(
+                flow_platform=str(job["flow_platform"]),
+                flow_id=str(job["flow_id"]),
+                job_id=str(job["job_id"]),
+                custom_properties={str(k): str(v) for k, v in job["custom_properties"].items()},
+            )
+            if entry.checksum != job.get("checksum"):
+                raise ValueError(f"Checksum mismatch for job {entry.flow_id}/{entry.job_id}")
+            entries.append(entry)
+        bundle = cls.from_entries(entries)
+        if bundle.checksum != payload.get("checksum"):
+            raise ValueError("Job config bundle checksum mismatch")
+        return JobConfigBundle(jobs=bundle.jobs, compiled_at=str(payload.get("compiled_at", "")))
+
+    def write(self, path: str | Path) -> None:
+        """Write the bundle atomically (temp file + rename)."""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix=".tmp-", dir=target.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(self.to_json())
+            os.replace(temp_name, target)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+    def _job_dicts(self) -> list[dict[str, Any]]:
+        entries = sorted(self.jobs.values(), key=lambda entry: (entry.flow_platform, entry.flow_id, entry.job_id))
+        return [entry.to_dict() for entry in entries]
+
+
+class JobConfigBundleStore:
+    """Serve job custom properties from a bundle file, refreshed from DataHub in the background."""
+
+    def __init__(self, path: str, *, refresh_interval_sec: float = 300.0) -> None:
+        """Load the bundle at ``path``; a missing or invalid file leaves the store empty."""
+        if refresh_interval_sec <= 0:
+            raise ValueError("refresh_interval_sec must be greater than zero")
+        self.path = Path(path)
+        self.refresh_interval_sec = refresh_interval_sec
+        self._lock = threading.Lock()
+        self._bundle = self._load()
+        self._watched: dict[DataHubDataJobKey, str] = {}
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    @property
+    def bundle(self) -> JobConfigBundle | None:
+        with self._lock:
+            return self._bundle
+
+    def custom_properties(self, key: DataHubDataJobKey) -> dict[str, str] | None:
+        """Return bundled custom properties for ``key``, or ``None`` when not bundled."""
+        with self._lock:
+            entry = self._bundle.get(key) if self._bundle is not None else None
+        return dict(entry.custom_properties) if entry is not None else None
+
+    def watch(self, key: DataHubDataJobKey, job_urn: str, reader: JobInfoReader) -> None:
+        """Refresh ``key`` from DataHub every ``refresh_interval_sec`` in a daemon thread."""
+        with self._lock:
+            self._watched[key] = job_urn
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, args=(reader,), name="job-config-refresh", daemon=True)
+        self._thread.start()
+
+    def refresh(self, key: DataHubDataJobKey, job_urn: str, reader: JobInfoReader) -> bool:
+        """Compare DataHub's properties for ``key`` with the bundle; rewrite the bundle on change.
+
+        Returns:
+            ``True`` when the bundle was updated.
+        """
+        job_info = reader.get_datajob_info(job_urn)
+        if job_info is None or not isinstance(job_info.customProperties, dict):
+            return False
+        live = {str(k): str(v) for k, v in job_info.customProperties.items()}
+        with self._lock:
+            current = self._bundle.get(key) if self._bundle is not None else None
+            if current is not None and current.checksum == properties_checksum(live):
+                return False
+            entry = JobConfigEntry(
+                flow_platform=key.flow_platform,
+                flow_id=key.flow_id,
+                job_id=key.job_id,
+                custom_properties=live,
+            )
+            bundle = (self._bundle or JobConfigBundle(jobs={})).with_entry(entry)
+            self._bundle = bundle
+        logger.warning("Job config for %s/%s changed in DataHub; updating %s", key.flow_id, key.job_id, self.path)
+        try:
+            bundle.write(self.path)
+        except OSError as exc:
+            logger.warning("Could not rewrite job config bundle %s: %s", self.path, exc)
+        return True
+
+    def close(self) -> None:
+        """Stop the refresh thread."""
+        self._stopped.set()
+
+    def _run(self, reader: JobInfoReader) -> None:
+        while not self._stopped.wait(self.refresh_interval_sec):
+            with self._lock:
+                watched = dict(self._watched)
+            for key, job_urn in watched.items():
+                try:
+                    self.refresh(key, job_urn, reader)
+                except Exception:
+                    logger.exception("Job config refresh failed for %s/%s", key.flow_id, key.job_id)
+
+    def _load(self) -> JobConfigBundle | None:
+        try:
+            bundle = JobConfigBundle.from_json(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            logger.info("No job config bundle at %s; resolving job config from DataHub", self.path)
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Ignoring invalid job config bundle %s: %s", self.path, exc)
+            return None
+        logger.info("Loaded job config bundle %s (checksum %s)", self.path, bundle.checksum[:12])
+        return bundle
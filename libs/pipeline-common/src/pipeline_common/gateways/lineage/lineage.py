@@ -2,13 +2,16 @@
 
 This module provides runtime-only DataHub lineage primitives used by workers
 to emit DataProcessInstance events and resolve stage runtime config from
-DataHub metadata.
+DataHub metadata. MCPs go through an ``McpEmitter``: the graph client itself
+(inline), a ``BufferedMcpEmitter`` that sends them from a background thread,
+or a ``SpoolingMcpEmitter`` that keeps them on disk while DataHub is down.
 """
 
 import logging
+import threading
 import time
 import uuid
-from typing import Protocol
+from typing import Callable, Protocol
 
 import requests
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
@@ -31,7 +34,11 @@ from datahub.metadata.schema_classes import (
     RunResultTypeClass,
 )
 
+from pipeline_common.gateways.lineage.circuit_breaker import CircuitBreaker
 from pipeline_common.gateways.lineage.contracts import DataHubDataJobKey, DatasetPlatform, ResolvedDataHubFlowConfig
+from pipeline_common.gateways.lineage.dataset_cache import DatasetPropertiesCache
+from pipeline_common.gateways.lineage.emitter import McpEmitter
+from pipeline_common.gateways.lineage.job_config_bundle import JobConfigBundleStore
 from pipeline_common.gateways.lineage.urns import DataHubUrnFactory
 
 from .runtime_contracts import (
@@ -187,19 +194,41 @@ class DataProcessInstanceMcpFactory:
         ]
 
 
+DeliveryListener = Callable[[list[MetadataChangeProposalWrapper]], None]
+
+
 class DataHubGraphClient:
     """Handle aspect reads and MCP writes via DataHub graph client."""
 
-    def __init__(self, connection_settings: DataHubRuntimeConnectionSettings) -> None:
-        """Initialize graph client from runtime connection settings."""
-        self.graph = DataHubGraph(
-            DatahubClientConfig(
-                server=connection_settings.server,
-                token=connection_settings.token,
-                timeout_sec=connection_settings.timeout_sec,
-                retry_max_times=connection_settings.retry_max_times,
-            )
+    def __init__(
+        self,
+        connection_settings: DataHubRuntimeConnectionSettings,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        """Initialize graph client from runtime connection settings.
+
+        Args:
+            connection_settings: DataHub endpoint and retry settings.
+            breaker: Optional circuit breaker guarding ``emit_mcps``.
+        """
+        self.breaker = breaker
+        self._graph_config = DatahubClientConfig(
+            server=connection_settings.server,
+            token=connection_settings.token,
+            timeout_sec=connection_settings.timeout_sec,
+            retry_max_times=connection_settings.retry_max_times,
         )
+        self._graph: DataHubGraph | None = None
+        self._graph_lock = threading.Lock()
+        self._delivery_listeners: list[DeliveryListener] = []
+
+    @property
+    def graph(self) -> DataHubGraph:
+        """Graph session, connected on first use so startup does not wait on DataHub."""
+        with self._graph_lock:
+            if self._graph is None:
+                self._graph = DataHubGraph(self._graph_config)
+            return self._graph
 
     def get_datajob_info(self, job_urn: str) -> DataJobInfoClass | None:
         """Fetch the `DataJobInfo` aspect for a DataJob URN.
@@ -219,14 +248,42 @@ class DataHubGraphClient:
             return None
 
     def emit_mcps(self, mcps: list[MetadataChangeProposalWrapper]) -> None:
-        """Emit MCPs to DataHub Graph in the provided order.
+        """Emit MCPs to DataHub Graph in the provided order with batched REST ingestion.
+
+        The graph session stays open between calls so consecutive batches
+        reuse the HTTP connection; ``close`` releases it. With a breaker,
+        calls fail fast with ``CircuitOpenError`` while DataHub is down.
 
         Args:
             mcps: Ordered metadata change proposals to emit.
         """
-        with self.graph:
-            for mcp in mcps:
-                self.graph.emit(mcp)
+        if self.breaker is None:
+            self._emit_mcps(mcps)
+            return
+        self.breaker.call(self._emit_mcps, mcps)
+
+    def add_delivery_listener(self, listener: DeliveryListener) -> None:
+        """Call ``listener`` with every MCP list DataHub accepted.
+
+        Every emission path (inline, ``BufferedMcpEmitter``, spool replay)
+        ends in ``emit_mcps``, so this is the one place delivery is known.
+        """
+        self._delivery_listeners.append(listener)
+
+    def close(self) -> None:
+        """Close the graph session, if one was opened."""
+        with self._graph_lock:
+            if self._graph is not None:
+                self._graph.close()
+                self._graph = None
+
+    def _emit_mcps(self, mcps: list[MetadataChangeProposalWrapper]) -> None:
+        self.graph.emit_mcps(mcps)
+        for listener in self._delivery_listeners:
+            try:
+                listener(mcps)
+            except Exception:
+                logger.exception("Lineage delivery listener failed")
 
 
 class DataHubJobMetadataReader(Protocol):
@@ -237,12 +294,24 @@ class DataHubJobMetadataReader(Protocol):
 
 
 class DataHubJobMetadataResolver:
-    """Retrieve static DataJob details specified by governance definitions."""
+    """Retrieve static DataJob details specified by governance definitions.
+
+    With a ``JobConfigBundleStore`` holding the job, custom properties come
+    from the local bundle and DataHub is only consulted by the store's
+    background refresh; otherwise they are read live from DataHub.
+    """
 
-    def __init__(self, metadata_reader: DataHubJobMetadataReader, env: str, data_job_key: DataHubDataJobKey) -> None:
+    def __init__(
+        self,
+        metadata_reader: DataHubJobMetadataReader,
+        env: str,
+        data_job_key: DataHubDataJobKey,
+        job_config_store: JobConfigBundleStore | None = None,
+    ) -> None:
         self.metadata_reader = metadata_reader
         self.env = env
         self.data_job_key = data_job_key
+        self.job_config_store = job_config_store
 
     def resolve(self) -> ResolvedDataHubFlowConfig:
         input_job_urn = self._build_input_job_urn()
@@ -258,8 +327,14 @@ class DataHubJobMetadataResolver:
         )
 
     def _resolve_datajob_custom_properties(self, input_job_urn: str) -> dict[str, str]:
+        if self.job_config_store is not None:
+            bundled = self.job_config_store.custom_properties(self.data_job_key)
+            if bundled is not None:
+                self.job_config_store.watch(self.data_job_key, input_job_urn, self.metadata_reader)
+                return bundled
         job_info = self.metadata_reader.get_datajob_info(input_job_urn)
         if job_info is None or not isinstance(job_info.customProperties, dict):
+            logger.warning("No custom properties resolved for %s; job config is empty", input_job_urn)
             return {}
         custom_properties: dict[str, str] = {str(k): str(v) for k, v in job_info.customProperties.items()}
         return custom_properties
@@ -280,14 +355,22 @@ class DataHubRuntimeLineage(LineageRuntimeGateway):
         self,
         client_config: DataHubLineageRuntimeConfig,
         graph_client: DataHubGraphClient | None = None,
+        emitter: McpEmitter | None = None,
+        dataset_cache: DatasetPropertiesCache | None = None,
+        job_config_store: JobConfigBundleStore | None = None,
     ) -> None:
         self.graph_client = graph_client or DataHubGraphClient(connection_settings=client_config.connection_settings)
+        self.emitter: McpEmitter = emitter or self.graph_client
         self._client_config = client_config
         self._resolved_job_config: ResolvedDataHubFlowConfig | None = None
         self._datajob_urn: str | None = None
         self._job_version: str = "unknown"
         self._active_context: ActiveRunContext | None = None
-        self._dataset_properties_emitted: set[str] = set()
+        self._active_inputs: set[str] = set()
+        self._active_outputs: set[str] = set()
+        self.dataset_cache = dataset_cache or DatasetPropertiesCache()
+        self.graph_client.add_delivery_listener(self._record_delivered_dataset_properties)
+        self.job_config_store = job_config_store
 
     @property
     def resolved_job_config(self) -> ResolvedDataHubFlowConfig:
@@ -299,6 +382,7 @@ class DataHubRuntimeLineage(LineageRuntimeGateway):
             metadata_reader=self.graph_client,
             env=env,
             data_job_key=self._client_config.data_job_key,
+            job_config_store=self.job_config_store,
         )
         resolved_job_config = resolver.resolve()
         self._resolved_job_config = resolved_job_config
@@ -355,7 +439,10 @@ class DataHubRuntimeLineage(LineageRuntimeGateway):
         if self._active_context is None:
             raise ValueError("No active run context available for adding input.")
         dataset = self._dataset_urn(platform=platform, name=name)
+        if dataset in self._active_inputs:
+            return dataset
         self._ensure_dataset_properties(dataset_urn=dataset, dataset_name=name)
+        self._active_inputs.add(dataset)
         self._active_context.run.inputs.append(dataset)
         return dataset
 
@@ -363,12 +450,15 @@ class DataHubRuntimeLineage(LineageRuntimeGateway):
         if self._active_context is None:
             raise ValueError("No active run context available for adding output.")
         dataset = self._dataset_urn(platform=platform, name=name)
+        if dataset in self._active_outputs:
+            return dataset
         self._ensure_dataset_properties(dataset_urn=dataset, dataset_name=name)
+        self._active_outputs.add(dataset)
         self._active_context.run.outputs.append(dataset)
         return dataset
 
     def _ensure_dataset_properties(self, *, dataset_urn: str, dataset_name: str) -> None:
-        if dataset_urn in self._dataset_properties_emitted:
+        if self.dataset_cache.contains(dataset_urn):
             return
 
         mcp = MetadataChangeProposalWrapper(
@@ -380,12 +470,21 @@ class DataHubRuntimeLineage(LineageRuntimeGateway):
             ),
             changeType=ChangeTypeClass.UPSERT,
         )
+        # Cached for good only once DataHub accepted it (see _record_delivered_dataset_properties);
+        # the emitter may still drop, fail or spool the MCP after this call returns.
+        self.dataset_cache.mark_pending(dataset_urn)
         try:
-            self.graph_client.emit_mcps(mcps=[mcp])
-            self._dataset_properties_emitted.add(dataset_urn)
+            self.emitter.emit_mcps(mcps=[mcp])
         except Exception as exc:
+            self.dataset_cache.discard_pending(dataset_urn)
             logger.warning("Could not emit datasetProperties for %s: %s", dataset_urn, exc)
 
+    def _record_delivered_dataset_properties(self, mcps: list[MetadataChangeProposalWrapper]) -> None:
+        """Delivery listener: cache dataset URNs whose ``datasetProperties`` DataHub accepted."""
+        for mcp in mcps:
+            if mcp.aspectName == "datasetProperties" and mcp.entityUrn:
+                self.dataset_cache.add(mcp.entityUrn)
+
     def _generate_run_id(self) -> str:
         return f"{int(time.time() * 1000)}-{self._ensure_job_metadata_resolved().job_id}-{uuid.uuid4()}"
 
@@ -413,6 +512,9 @@ class DataHubRuntimeLineage(LineageRuntimeGateway):
     def abort_run(self) -> None:
         self._clear_active_run()
 
+    def flush(self) -> None:
+        """Runs are emitted as they complete; nothing is held back."""
+
     def _resolve_job_version(self) -> str:
         if value := self._ensure_job_metadata_resolved().custom_properties.get("job.version"):
             return str(value)
@@ -434,7 +536,7 @@ class DataHubRuntimeLineage(LineageRuntimeGateway):
             status=status,
             run_result_type=run_result_type,
         ).build()
-        self.graph_client.emit_mcps(mcps=mcps)
+        self.emitter.emit_mcps(mcps=mcps)
         return dpi_urn
 
     def _now_ms(self) -> int:
@@ -442,3 +544,5 @@ class DataHubRuntimeLineage(LineageRuntimeGateway):
 
     def _clear_active_run(self) -> None:
         self._active_context = None
+        self._active_inputs.clear()
+        self._active_outputs.clear()
@@ -9,11 +9,17 @@ from pipeline_common.gateways.lineage.contracts import DatasetPlatform, Resolved
 class CustomProperties:
     job_version: str
     error_message: str | None = None
+    items_total: int | None = None
+    items_failed: int | None = None
 
     def dump(self) -> dict[str, str]:
         data = {"job_version": self.job_version}
         if self.error_message:
             data["error_message"] = self.error_message
+        if self.items_total is not None:
+            data["items_total"] = str(self.items_total)
+        if self.items_failed is not None:
+            data["items_failed"] = str(self.items_failed)
         return data
 
 
@@ -77,3 +83,6 @@ class LineageRuntimeGateway(Protocol):
 
     def abort_run(self) -> None:
         """Clear active run state without emitting terminal status."""
+
+    def flush(self) -> None:
+        """Emit any run the gateway is still aggregating; a no-op for per-item runs."""
@@ -1,16 +1,51 @@
 from dataclasses import dataclass
 
+from pipeline_common.gateways.lineage.emitter import LINEAGE_OVERFLOW_POLICIES
 from pipeline_common.helpers.config import _optional_env, _required_int
 
+LINEAGE_EMIT_MODES = ("async", "sync")
+LINEAGE_RUN_MODES = ("per_item", "aggregated")
+
 
 @dataclass(frozen=True)
 class DataHubSettings:
-    """DataHub bootstrap settings for flow/job template upserts."""
+    """DataHub bootstrap settings for flow/job template upserts.
+
+    ``emit_mode="async"`` sends runtime lineage MCPs from a background
+    ``BufferedMcpEmitter``; ``sync`` emits them inline on the worker thread.
+    A non-empty ``spool_dir`` keeps MCPs in an on-disk ``McpSpool`` while the
+    DataHub circuit breaker is open and replays them once it closes.
+    ``run_mode="aggregated"`` emits one DataProcessInstance per window of
+    ``window_max_items`` items or ``window_max_sec`` seconds. A non-empty
+    ``dataset_cache_path`` persists already-emitted dataset URNs in SQLite.
+    A non-empty ``job_config_bundle_path`` resolves job custom properties from
+    a compiled bundle, refreshed from DataHub every ``job_config_refresh_sec``.
+    """
 
     server: str
     token: str | None
     timeout_sec: float
     retry_max_times: int
+    emit_mode: str = "async"
+    emit_queue_size: int = 1000
+    emit_batch_size: int = 100
+    emit_flush_interval_sec: float = 1.0
+    emit_overflow_policy: str = "block"
+    emit_shutdown_timeout_sec: float = 10.0
+    spool_dir: str = ""
+    spool_segment_bytes: int = 8 * 1024 * 1024
+    spool_max_bytes: int = 512 * 1024 * 1024
+    spool_replay_interval_sec: float = 5.0
+    breaker_failure_threshold: int = 3
+    breaker_reset_sec: float = 30.0
+    run_mode: str = "per_item"
+    window_max_items: int = 500
+    window_max_sec: float = 60.0
+    dataset_cache_entries: int = 100_000
+    dataset_cache_path: str = ""
+    dataset_cache_store_entries: int = 5_000_000
+    job_config_bundle_path: str = ""
+    job_config_refresh_sec: float = 300.0
 
     @classmethod
     def from_env(cls) -> "DataHubSettings":
@@ -19,9 +54,41 @@ class DataHubSettings:
         server = _optional_env("DATAHUB_GMS_SERVER", "")
         if not server:
             server = _optional_env("DATAHUB_GMS_URL", "http://localhost:8081")
+        emit_mode = _optional_env("DATAHUB_EMIT_MODE", "async").lower()
+        if emit_mode not in LINEAGE_EMIT_MODES:
+            raise ValueError(f"DATAHUB_EMIT_MODE must be one of {LINEAGE_EMIT_MODES}")
+        emit_overflow_policy = _optional_env("DATAHUB_EMIT_OVERFLOW_POLICY", "block").lower()
+        if emit_overflow_policy not in LINEAGE_OVERFLOW_POLICIES:
+            raise ValueError(f"DATAHUB_EMIT_OVERFLOW_POLICY must be one of {LINEAGE_OVERFLOW_POLICIES}")
+        run_mode = _optional_env("DATAHUB_LINEAGE_MODE", "per_item").lower()
+        if run_mode not in LINEAGE_RUN_MODES:
+            raise ValueError(f"DATAHUB_LINEAGE_MODE must be one of {LINEAGE_RUN_MODES}")
+        spool_dir = _optional_env("DATAHUB_SPOOL_DIR", "")
+        if emit_overflow_policy == "spill" and not spool_dir:
+            raise ValueError("DATAHUB_EMIT_OVERFLOW_POLICY=spill requires DATAHUB_SPOOL_DIR")
         return cls(
             server=server,
             token=token or None,
             timeout_sec=float(_optional_env("DATAHUB_TIMEOUT_SEC", "3")),
             retry_max_times=_required_int("DATAHUB_RETRY_MAX_TIMES", 1),
+            emit_mode=emit_mode,
+            emit_queue_size=_required_int("DATAHUB_EMIT_QUEUE_SIZE", 1000),
+            emit_batch_size=_required_int("DATAHUB_EMIT_BATCH_SIZE", 100),
+            emit_flush_interval_sec=float(_optional_env("DATAHUB_EMIT_FLUSH_INTERVAL_SEC", "1")),
+            emit_overflow_policy=emit_overflow_policy,
+            emit_shutdown_timeout_sec=float(_optional_env("DATAHUB_EMIT_SHUTDOWN_TIMEOUT_SEC", "10")),
+            spool_dir=spool_dir,
+            spool_segment_bytes=_required_int("DATAHUB_SPOOL_SEGMENT_BYTES", 8 * 1024 * 1024),
+            spool_max_bytes=_required_int("DATAHUB_SPOOL_MAX_BYTES", 512 * 1024 * 1024),
+            spool_replay_interval_sec=float(_optional_env("DATAHUB_SPOOL_REPLAY_INTERVAL_SEC", "5")),
+            breaker_failure_threshold=_required_int("DATAHUB_BREAKER_FAILURE_THRESHOLD", 3),
+            breaker_reset_sec=float(_optional_env("DATAHUB_BREAKER_RESET_SEC", "30")),
+            run_mode=run_mode,
+            window_max_items=_required_int("DATAHUB_LINEAGE_WINDOW_ITEMS", 500),
+            window_max_sec=float(_optional_env("DATAHUB_LINEAGE_WINDOW_SEC", "60")),
+            dataset_cache_entries=_required_int("DATAHUB_DATASET_CACHE_ENTRIES", 100_000),
+            dataset_cache_path=_optional_env("DATAHUB_DATASET_CACHE_PATH", ""),
+            dataset_cache_store_entries=_required_int("DATAHUB_DATASET_CACHE_STORE_ENTRIES", 5_000_000),
+            job_config_bundle_path=_optional_env("JOB_CONFIG_BUNDLE_PATH", ""),
+            job_config_refresh_sec=float(_optional_env("JOB_CONFIG_BUNDLE_REFRESH_SEC", "300")),
         )
@@ -0,0 +1,282 @@
+"""Durable write-ahead spool for lineage MCPs.
+
+Layer:
+- Infrastructure helper between ``DataHubRuntimeLineage`` and ``DataHubGraphClient``.
+
+Role:
+- Keep lineage MCPs on local disk while DataHub is slow or down, and replay
+  them once it recovers, so worker messages never fail because of lineage.
+
+Design intent:
+- ``McpSpool`` appends one JSON line per ``emit_mcps`` call to numbered
+  segment files under ``directory``; a segment is sealed (fsynced) once it
+  reaches ``segment_max_bytes`` or on ``close``, and deleted once fully
+  replayed. Segments left by a previous process are replayed after a
+  restart.
+- Replay reads forward from a byte offset through one open handle, so each
+  replayed line costs one line of I/O whatever the segment size; the active
+  segment is replayed while it is still being appended to.
+- The spool is bounded by ``max_total_bytes``; when it would grow past the
+  cap the oldest sealed segments are dropped (and counted), so an outage
+  cannot fill the disk.
+- ``SpoolingMcpEmitter`` sends live MCPs straight to DataHub only while the
+  spool is empty; once anything is spooled, later MCPs are spooled behind
+  it, so replay preserves emission order. A background thread replays the
+  spool every ``replay_interval_sec`` and stops at the first failure, which
+  with the ``DataHubGraphClient`` circuit breaker costs no network call
+  while DataHub is down.
+
+Non-goals:
+- At-least-once, not exactly-once: MCPs of a batch that failed mid-replay
+  are sent again after a restart; DataHub upserts are idempotent.
+- Appends are flushed, not fsynced: a worker crash loses nothing, a host
+  crash can lose the tail of the unsealed segment.
+- One process per spool directory; give each worker its own
+  ``DATAHUB_SPOOL_DIR``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+
+from pipeline_common.gateways.lineage.emitter import McpEmitter
+
+logger = logging.getLogger(__name__)
+
+_SEGMENT_SUFFIX = ".jsonl"
+
+
+@dataclass(frozen=True)
+class SpoolStats:
+    """Point-in-time spool counters; ``appended``/``replayed``/``dropped`` count MCPs."""
+
+    segments: int
+    bytes_used: int
+    appended: int
+    replayed: int
+    dropped: int
+
+
+class McpSpool:
+    """Append-only, segment-rotated MCP spool on local disk."""
+
+    def __init__(self, *, directory: str, segment_max_bytes: int, max_total_bytes: int) -> None:
+        """Open the spool and pick up segments left by a previous process."""
+        if segment_max_bytes <= 0 or max_total_bytes < segment_max_bytes:
+            raise ValueError("segment_max_bytes must be positive and not larger than max_total_bytes")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+        self.max_total_bytes = max_total_bytes
+        self._lock = threading.Lock()
+        self._segments: list[Path] = sorted(self.directory.glob(f"*{_SEGMENT_SUFFIX}"))
+        self._bytes_used = sum(path.stat().st_size for path in self._segments)
+        self._next_sequence = int(self._segments[-1].stem) + 1 if self._segments else 0
+        self._active: Path | None = None
+        self._active_handle: BinaryIO | None = None
+        self._reader: BinaryIO | None = None
+        self._reader_segment: Path | None = None
+        self._reader_offset = 0
+        self._appended = 0
+        self._replayed = 0
+        self._dropped = 0
+
+    @property
+    def has_pending(self) -> bool:
+        """Whether any spooled MCPs wait for replay."""
+        with self._lock:
+            return bool(self._segments)
+
+    @property
+    def stats(self) -> SpoolStats:
+        """Snapshot of spool size and counters."""
+        with self._lock:
+            return SpoolStats(
+                segments=len(self._segments),
+                bytes_used=self._bytes_used,
+                appended=self._appended,
+                replayed=self._replayed,
+                dropped=self._dropped,
+            )
+
+    def emit_mcps(self, mcps: list[MetadataChangeProposalWrapper]) -> None:
+        """Append one MCP list as a single line, rotating and enforcing the size cap."""
+        if not mcps:
+            return
+        line = (json.dumps([mcp.to_obj() for mcp in mcps], separators=(",", ":")) + "\n").encode("utf-8")
+        with self._lock:
+            if self._active_handle is None or self._active_handle.tell() + len(line) > self.segment_max_bytes:
+                self._open_segment()
+            self._enforce_cap(len(line))
+            self._active_handle.write(line)
+            self._active_handle.flush()
+            self._bytes_used += len(line)
+            self._appended += len(mcps)
+
+    def replay(self, sink: McpEmitter, *, max_batches: int | None = None) -> int:
+        """Send spooled MCP lists to ``sink`` oldest first; stop at the first failure.
+
+        Args:
+            sink: Emitter receiving the replayed MCP lists, one call per spooled line.
+            max_batches: Stop after this many lines so callers can interleave other work.
+
+        Returns:
+            Number of MCPs replayed.
+        """
+        replayed = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            with self._lock:
+                if not self._segments:
+                    return replayed
+                segment = self._segments[0]
+                try:
+                    line = self._read_line(segment)
+                except FileNotFoundError:
+                    self._remove_segment(segment)
+                    continue
+                if not line:
+                    if segment == self._active:
+                        # Caught up: the next append starts a new segment.
+                        self._seal_segment(fsync=False)
+                    self._remove_segment(segment)
+                    continue
+            mcps = self._decode(line, segment)
+            if mcps:
+                try:
+                    sink.emit_mcps(mcps)
+                except Exception as exc:
+                    logger.info("Lineage spool replay paused: %s", exc)
+                    return replayed
+                replayed += len(mcps)
+            with self._lock:
+                if self._reader_segment == segment:
+                    self._reader_offset += len(line)
+                self._replayed += len(mcps)
+            batches += 1
+        return replayed
+
+    def close(self) -> None:
+        """Seal the active segment so everything appended so far is on disk."""
+        with self._lock:
+            self._close_reader()
+            self._seal_segment()
+
+    def _open_segment(self) -> None:
+        self._seal_segment()
+        self._active = self.directory / f"{self._next_sequence:020d}{_SEGMENT_SUFFIX}"
+        self._active_handle = self._active.open("ab")
+        self._next_sequence += 1
+        self._segments.append(self._active)
+
+    def _seal_segment(self, *, fsync: bool = True) -> None:
+        if self._active_handle is not None:
+            self._active_handle.flush()
+            if fsync:
+                os.fsync(self._active_handle.fileno())
+            self._active_handle.close()
+        self._active = None
+        self._active_handle = None
+
+    def _read_line(self, segment: Path) -> bytes:
+        """Return the next unreplayed line of ``segment`` without consuming it; ``b""`` at its end.
+
+        Callers hold ``_lock``, so a line being appended is never read half-written.
+        """
+        if self._reader_segment != segment:
+            self._close_reader()
+            self._reader = segment.open("rb")
+            self._reader_segment = segment
+            self._reader_offset = 0
+        self._reader.seek(self._reader_offset)
+        return self._reader.readline()
+
+    def _close_reader(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+        self._reader = None
+        self._reader_segment = None
+        self._reader_offset = 0
+
+    def _enforce_cap(self, incoming: int) -> None:
+        while self._bytes_used + incoming > self.max_total_bytes and self._segments[0] != self._active:
+            oldest = self._segments.pop(0)
+            size = oldest.stat().st_size
+            with oldest.open("rb") as handle:
+                if oldest == self._reader_segment:
+                    handle.seek(self._reader_offset)
+                    self._close_reader()
+                dropped = sum(len(self._decode(line, oldest)) for line in handle)
+            oldest.unlink(missing_ok=True)
+            self._bytes_used -= size
+            self._dropped += dropped
+            logger.warning("Lineage spool over %s bytes; dropped %s MCPs from %s", self.max_total_bytes, dropped, oldest.name)
+
+    def _remove_segment(self, segment: Path) -> None:
+        if segment == self._reader_segment:
+            self._close_reader()
+        if segment in self._segments:
+            self._segments.remove(segment)
+            try:
+                self._bytes_used -= segment.stat().st_size
+            except FileNotFoundError:
+                pass
+        segment.unlink(missing_ok=True)
+
+    @staticmethod
+    def _decode(line: bytes, segment: Path) -> list[MetadataChangeProposalWrapper]:
+        try:
+            return [MetadataChangeProposalWrapper.from_obj(obj) for obj in json.loads(line)]
+        except ValueError:
+            logger.warning("Skipping unreadable line in lineage spool segment %s", segment.name)
+            return []
+
+
+class SpoolingMcpEmitter:
+    """Emit MCPs to DataHub, spooling them while it is unavailable and replaying them in the background."""
+
+    def __init__(self, sink: McpEmitter, spool: McpSpool, *, replay_interval_sec: float = 5.0) -> None:
+        """Start the background replay thread."""
+        self.sink = sink
+        self.spool = spool
+        self.replay_interval_sec = replay_interval_sec
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="lineage-spool-replayer", daemon=True)
+        self._thread.start()
+
+    def emit_mcps(self, mcps: list[MetadataChangeProposalWrapper]) -> None:
+        """Send ``mcps`` directly when nothing is spooled; otherwise, or on failure, spool them."""
+        with self._lock:
+            if not self.spool.has_pending:
+                try:
+                    self.sink.emit_mcps(mcps)
+                    return
+                except Exception as exc:
+                    logger.warning("DataHub unavailable; spooling %s lineage MCPs: %s", len(mcps), exc)
+            self.spool.emit_mcps(mcps)
+
+    def replay_once(self, *, max_batches: int = 1) -> int:
+        """Replay up to ``max_batches`` spooled MCP lists; the lock keeps live emission ordered behind them."""
+        with self._lock:
+            return self.spool.replay(self.sink, max_batches=max_batches)
+
+    def close(self) -> None:
+        """Stop the replay thread and seal the spool; spooled MCPs stay on disk for the next process."""
+        self._stopped.set()
+        self._thread.join(timeout=self.replay_interval_sec)
+        self.spool.close()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.replay_interval_sec):
+            while self.spool.has_pending and not self._stopped.is_set():
+                if not self.replay_once():
+                    break
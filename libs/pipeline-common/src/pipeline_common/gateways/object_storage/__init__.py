@@ -1,4 +1,30 @@
+from pipeline_common.gateways.object_storage.compression import CompressionPolicy
+from pipeline_common.gateways.object_storage.local_filesystem import LocalFileSystemClient
 from pipeline_common.gateways.object_storage.manifest_writer import ManifestWriter
-from pipeline_common.gateways.object_storage.object_storage import ObjectStorageGateway, S3Client
+from pipeline_common.gateways.object_storage.object_storage import (
+    SHA256_METADATA_KEY,
+    ObjectResult,
+    ObjectStat,
+    ObjectStorageGateway,
+    ObjectWrite,
+    S3Client,
+)
+from pipeline_common.gateways.object_storage.read_cache import CacheStats, CachingObjectStorageGateway, DiskReadCache
+from pipeline_common.gateways.object_storage.streams import ObjectReadStream, ObjectWriteStream
 
-__all__ = ["ManifestWriter", "ObjectStorageGateway", "S3Client"]
+__all__ = [
+    "SHA256_METADATA_KEY",
+    "CacheStats",
+    "CachingObjectStorageGateway",
+    "CompressionPolicy",
+    "DiskReadCache",
+    "LocalFileSystemClient",
+    "ManifestWriter",
+    "ObjectReadStream",
+    "ObjectResult",
+    "ObjectStat",
+    "ObjectStorageGateway",
+    "ObjectWrite",
+    "ObjectWriteStream",
+    "S3Client",
+]
@@ -0,0 +1,151 @@
+"""Storage codecs for transparent object compression.
+
+Layer:
+- Infrastructure helper used by ``ObjectStorageGateway``.
+
+Role:
+- Compress ``write_object`` payloads per key prefix and record the codec in
+  the object's ``Content-Encoding``, so ``read_object`` decodes by what the
+  object says rather than by configuration.
+
+Design intent:
+- ``gzip`` is always available; ``zstd`` is an optional faster codec used
+  only when the ``zstandard`` package is importable and a prefix opts in.
+- Objects without a ``Content-Encoding`` (written before compression
+  existed, or under uncompressed prefixes) are returned as stored, so
+  readers can be rolled out before writers start compressing.
+- The ``sha256`` metadata always describes the decoded payload, so content
+  hashes do not depend on the codec in use.
+
+Non-goals:
+- Streams (``open_read``/``open_write``) and byte ranges move stored bytes
+  as-is; do not compress prefixes that are read by range.
+"""
+
+from __future__ import annotations
+
+import gzip
+import zlib
+from typing import ClassVar, Protocol
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+class StorageCodec(Protocol):
+    """Port for object body encodings."""
+
+    NAME: ClassVar[str]
+    CONTENT_ENCODING: ClassVar[str]
+
+    def compress(self, payload: bytes) -> bytes:
+        """Encode one object body."""
+
+    def decompress(self, body: bytes) -> bytes:
+        """Decode one object body."""
+
+
+class GzipStorageCodec:
+    """Standard-library gzip codec (``Content-Encoding: gzip``)."""
+
+    NAME: ClassVar[str] = "gzip"
+    CONTENT_ENCODING: ClassVar[str] = "gzip"
+
+    def __init__(self, level: int = 6) -> None:
+        self.level = level
+
+    def compress(self, payload: bytes) -> bytes:
+        """Gzip one body; ``mtime=0`` keeps output deterministic for identical payloads."""
+        return gzip.compress(payload, compresslevel=self.level, mtime=0)
+
+    def decompress(self, body: bytes) -> bytes:
+        """Gunzip one body."""
+        return zlib.decompress(body, wbits=16 + zlib.MAX_WBITS)
+
+
+class ZstdStorageCodec:
+    """Zstandard codec (``Content-Encoding: zstd``); requires the optional ``zstandard`` package."""
+
+    NAME: ClassVar[str] = "zstd"
+    CONTENT_ENCODING: ClassVar[str] = "zstd"
+
+    def __init__(self, level: int = 3) -> None:
+        if zstandard is None:
+            raise ValueError("zstd storage codec requires the 'zstandard' package")
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def compress(self, payload: bytes) -> bytes:
+        """Compress one body as a single frame that records its content size."""
+        return self._compressor.compress(payload)
+
+    def decompress(self, body: bytes) -> bytes:
+        """Decompress one single-frame body."""
+        return self._decompressor.decompress(body)
+
+
+STORAGE_CODECS: dict[str, type[GzipStorageCodec] | type[ZstdStorageCodec]] = {
+    GzipStorageCodec.NAME: GzipStorageCodec,
+    ZstdStorageCodec.NAME: ZstdStorageCodec,
+}
+
+
+def build_storage_codec(name: str) -> StorageCodec:
+    """Build a codec by name (``gzip`` or ``zstd``)."""
+    try:
+        return STORAGE_CODECS[name]()
+    except KeyError:
+        raise ValueError(f"Unsupported storage codec: {name!r}; expected one of {sorted(STORAGE_CODECS)}") from None
+
+
+def key_has_prefix(key: str, prefix: str) -> bool:
+    """Return whether ``key`` starts with ``prefix``, directly or after its leading environment segment."""
+    _, separator, scoped_key = key.partition("/")
+    return key.startswith(prefix) or (bool(separator) and scoped_key.startswith(prefix))
+
+
+class CompressionPolicy:
+    """Per-prefix codec selection for writes and ``Content-Encoding`` dispatch for reads.
+
+    ``rules`` map a key prefix to a codec name. A prefix matches a key's
+    leading folder after any environment prefix (``dev/05_embeddings/...``
+    matches ``05_embeddings/``); the longest matching prefix wins.
+    """
+
+    def __init__(self, rules: tuple[tuple[str, str], ...] = ()) -> None:
+        """Build every configured codec up front, so a missing optional package fails at startup."""
+        self.rules = tuple(rules)
+        self._codecs: dict[str, StorageCodec] = {name: build_storage_codec(name) for _, name in self.rules}
+        self._by_length = sorted(self.rules, key=lambda rule: len(rule[0]), reverse=True)
+
+    @classmethod
+    def from_spec(cls, spec: str) -> "CompressionPolicy":
+        """Parse ``"05_embeddings/=zstd,07_metadata/=gzip"``; an empty spec disables compression."""
+        rules: list[tuple[str, str]] = []
+        for item in spec.split(","):
+            if not item.strip():
+                continue
+            prefix, separator, name = item.partition("=")
+            if not separator or not prefix.strip() or not name.strip():
+                raise ValueError(f"Invalid compression rule {item.strip()!r}; expected '<prefix>=<codec>'")
+            rules.append((prefix.strip(), name.strip().lower()))
+        return cls(rules=tuple(rules))
+
+    def codec_for_key(self, key: str) -> StorageCodec | None:
+        """Return the codec for newly written ``key`` or ``None`` to store it uncompressed."""
+        for prefix, name in self._by_length:
+            if key_has_prefix(key, prefix):
+                return self._codecs[name]
+        return None
+
+    def decode(self, body: bytes, content_encoding: str | None) -> bytes:
+        """Decode ``body`` according to its stored ``Content-Encoding``."""
+        if not content_encoding or content_encoding == "identity":
+            return body
+        codec = self._codecs.get(content_encoding)
+        if codec is None:
+            codec = build_storage_codec(content_encoding)
+            self._codecs[content_encoding] = codec
+        return codec.decompress(body)
@@ -0,0 +1,456 @@
+"""Filesystem-backed object storage client.
+
+Layer:
+- Infrastructure adapter implementing ``ObjectStorageClient``.
+
+Role:
+- Map ``bucket/key`` onto ``<root>/<bucket>/<key>`` so single-node
+  deployments and benchmarks run without an S3 endpoint.
+
+Design intent:
+- Writes land in a temporary file next to the target and are published
+  with ``os.replace``, so readers never observe a partial object. The
+  metadata sidecar is written before the body is published, so a reader
+  that finds the body also finds its ``Content-Encoding``.
+- Streams over objects at or above ``mmap_threshold_bytes`` read through
+  ``mmap``: ranged reads slice the mapping instead of seeking and copying
+  through a read buffer. Whole-object reads use one plain ``read``.
+- Listing walks the prefix's deepest existing directory with
+  ``os.scandir`` and yields keys lazily in S3 (lexicographic) order.
+- Object metadata (content type, ``sha256``, object tags) lives in JSON
+  sidecars under ``<root>/.meta/``, outside every bucket, so listings never
+  see it.
+- ``write_bytes_if_absent`` first takes an ``O_EXCL`` claim file for the
+  key under ``<root>/.claims/``, so exactly one concurrent creator wins;
+  only the winner publishes the sidecar and hard-links the body into place,
+  like a conditional PUT.
+
+Non-goals:
+- No cross-process locking beyond atomic rename; last writer wins, as on S3.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mimetypes
+import mmap
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any, ClassVar, Iterator
+
+from pipeline_common.gateways.object_storage.object_storage import ObjectStat, _canonical_sha256
+
+_META_DIR = ".meta"
+_UPLOADS_DIR = ".uploads"
+_CLAIMS_DIR = ".claims"
+_CLAIM_TTL_SECONDS = 60.0
+_TEMP_PREFIX = ".tmp-"
+
+
+class _MappedBody:
+    """``ReadableBody`` over a memory-mapped file region."""
+
+    def __init__(self, path: Path, start: int, end: int) -> None:
+        self._file = path.open("rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._position = start
+        self._end = end
+
+    def read(self, amt: int | None = None) -> bytes:
+        stop = self._end if amt is None else min(self._end, self._position + amt)
+        chunk = self._map[self._position:stop]
+        self._position = stop
+        return chunk
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+
+class _FileBody:
+    """``ReadableBody`` over a regular file region."""
+
+    def __init__(self, path: Path, start: int, end: int) -> None:
+        self._file = path.open("rb")
+        self._file.seek(start)
+        self._remaining = end - start
+
+    def read(self, amt: int | None = None) -> bytes:
+        size = self._remaining if amt is None else min(amt, self._remaining)
+        chunk = self._file.read(size)
+        self._remaining -= len(chunk)
+        return chunk
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class LocalFileSystemClient:
+    """``ObjectStorageClient`` over a local directory tree.
+
+    Layer:
+    - Infrastructure adapter implementation.
+
+    Dependencies:
+    - Local filesystem only.
+
+    Design intent:
+    - Behave like ``S3Client`` at the protocol boundary (missing deletes are
+      no-ops, listings are sorted, writes are all-or-nothing).
+
+    Non-goals:
+    - Does not emulate S3 permissions, versioning or lifecycle rules.
+    """
+
+    URI_SCHEME: ClassVar[str] = "local"
+
+    def __init__(self, *, root: str, max_concurrency: int = 32, mmap_threshold_bytes: int = 1024 * 1024) -> None:
+        """Initialize the client rooted at ``root`` (created when missing)."""
+        self.root = Path(root).resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_concurrency = max_concurrency
+        self.mmap_threshold_bytes = mmap_threshold_bytes
+
+    def bucket_exists(self, bucket: str) -> bool:
+        """Execute bucket exists."""
+        return self._bucket_path(bucket).is_dir()
+
+    def create_bucket(self, bucket: str) -> None:
+        """Execute create bucket."""
+        self._bucket_path(bucket).mkdir(parents=True, exist_ok=True)
+
+    def object_exists(self, bucket: str, key: str) -> bool:
+        """Execute object exists; folder marker keys (ending in ``/``) map to directories."""
+        path = self._object_path(bucket, key)
+        return path.is_dir() if key.endswith("/") else path.is_file()
+
+    def list_keys(self, bucket: str, prefix: str) -> list[str]:
+        """List object keys under ``prefix`` in lexicographic order."""
+        return list(self.iter_keys(bucket, prefix))
+
+    def iter_keys(self, bucket: str, prefix: str, *, start_after: str | None = None) -> Iterator[str]:
+        """Yield keys under ``prefix`` sorting after ``start_after``, one directory at a time.
+
+        Directory entries are visited sorted by ``name`` (files) or ``name/``
+        (directories), which yields keys in the same order as an S3 listing
+        while holding only one directory's entries per level in memory.
+        """
+        bucket_path = self._bucket_path(bucket)
+        start_dir = prefix.rpartition("/")[0]
+        start_path = self._object_path(bucket, start_dir) if start_dir else bucket_path
+        if not start_path.is_dir():
+            return
+        for key in self._walk_keys(bucket_path, start_path):
+            if key.startswith(prefix) and (start_after is None or key > start_after):
+                yield key
+
+    def _walk_keys(self, bucket_path: Path, directory: Path) -> Iterator[str]:
+        with os.scandir(directory) as scanned:
+            entries = sorted(
+                (entry.name + "/" if entry.is_dir(follow_symlinks=False) else entry.name, entry.path)
+                for entry in scanned
+                if not entry.name.startswith(_TEMP_PREFIX)
+            )
+        for sort_name, path in entries:
+            if sort_name.endswith("/"):
+                yield from self._walk_keys(bucket_path, Path(path))
+            else:
+                yield Path(path).relative_to(bucket_path).as_posix()
+
+    def read_bytes(self, bucket: str, key: str) -> bytes:
+        """Execute read bytes."""
+        return self._object_path(bucket, key).read_bytes()
+
+    def read_bytes_with_encoding(self, bucket: str, key: str) -> tuple[bytes, str | None]:
+        """Read the ``Content-Encoding`` recorded in the sidecar, then the stored body.
+
+        Writers publish the sidecar before the body, so reading in the
+        opposite order never pairs a body with an older sidecar.
+        """
+        sidecar = self._read_metadata(bucket, key)
+        payload = self.read_bytes(bucket, key)
+        if not sidecar:
+            # The object was created after the sidecar lookup; its sidecar is in place by now.
+            sidecar = self._read_metadata(bucket, key)
+        return payload, sidecar.get("content_encoding")
+
+    def write_bytes(
+        self,
+        bucket: str,
+        key: str,
+        payload: bytes,
+        content_type: str,
+        metadata: dict[str, str] | None = None,
+        content_encoding: str | None = None,
+    ) -> None:
+        """Write atomically, sidecar first; folder marker keys (ending in ``/``) create directories."""
+        path = self._object_path(bucket, key)
+        if key.endswith("/"):
+            path.mkdir(parents=True, exist_ok=True)
+            return
+        self._write_metadata(
+            bucket,
+            key,
+            content_type=content_type,
+            metadata=metadata,
+            content_encoding=content_encoding,
+        )
+        self._atomic_write(path, payload)
+
+    def write_bytes_if_absent(
+        self,
+        bucket: str,
+        key: str,
+        payload: bytes,
+        content_type: str,
+        metadata: dict[str, str] | None = None,
+        content_encoding: str | None = None,
+    ) -> bool:
+        """Create the object only when the key does not exist yet.
+
+        Concurrent creators race for an ``O_EXCL`` claim on the key; the loser
+        returns ``False`` without touching anything, so an existing or
+        in-flight object keeps its metadata. The winner re-checks the key,
+        publishes the sidecar and then links the body into place.
+        """
+        path = self._object_path(bucket, key)
+        claim = self._claim_path(bucket, key)
+        if not self._take_claim(claim):
+            return False
+        try:
+            if path.exists():
+                return False
+            self._write_metadata(
+                bucket,
+                key,
+                content_type=content_type,
+                metadata=metadata,
+                content_encoding=content_encoding,
+            )
+            return self._atomic_create(path, payload)
+        finally:
+            claim.unlink(missing_ok=True)
+
+    def stat_object(self, bucket: str, key: str) -> ObjectStat:
+        """Return object metadata from ``os.stat`` and the metadata sidecar."""
+        stat = self._object_path(bucket, key).stat()
+        sidecar = self._read_metadata(bucket, key)
+        metadata = dict(sidecar.get("metadata", {}))
+        return ObjectStat(
+            size=stat.st_size,
+            content_type=sidecar.get("content_type") or mimetypes.guess_type(key)[0],
+            etag=f"{stat.st_mtime_ns:x}-{stat.st_size:x}",
+            sha256=_canonical_sha256(metadata, None) or _canonical_sha256(dict(sidecar.get("tags", {})), None),
+            metadata=metadata,
+            content_encoding=sidecar.get("content_encoding"),
+        )
+
+    def open_stream(self, bucket: str, key: str, *, byte_range: tuple[int, int | None] | None = None) -> Any:
+        """Open an object region for streaming; large objects are memory-mapped."""
+        path = self._object_path(bucket, key)
+        size = path.stat().st_size
+        start, end = 0, size
+        if byte_range is not None:
+            start = min(byte_range[0], size)
+            end = size if byte_range[1] is None else min(byte_range[1] + 1, size)
+        if size and size >= self.mmap_threshold_bytes:
+            return _MappedBody(path, start, end)
+        return _FileBody(path, start, end)
+
+    def create_multipart_upload(self, bucket: str, key: str, *, content_type: str) -> str:
+        """Start a multipart upload in a staging directory."""
+        upload_id = uuid.uuid4().hex
+        upload_path = self._upload_path(upload_id)
+        upload_path.mkdir(parents=True)
+        (upload_path / "content_type").write_text(content_type)
+        return upload_id
+
+    def upload_part(self, bucket: str, key: str, upload_id: str, part_number: int, payload: bytes) -> str:
+        """Stage one part and return its MD5 ETag, as S3 does."""
+        (self._upload_path(upload_id) / f"{part_number:05d}").write_bytes(payload)
+        return hashlib.md5(payload).hexdigest()
+
+    def complete_multipart_upload(self, bucket: str, key: str, upload_id: str, parts: list[tuple[int, str]]) -> None:
+        """Concatenate staged parts into the object atomically."""
+        upload_path = self._upload_path(upload_id)
+        target = self._object_path(bucket, key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=target.parent)
+        try:
+            with os.fdopen(fd, "wb") as destination:
+                for part_number, _ in sorted(parts):
+                    with (upload_path / f"{part_number:05d}").open("rb") as part:
+                        shutil.copyfileobj(part, destination)
+            self._write_metadata(bucket, key, content_type=(upload_path / "content_type").read_text(), metadata=None)
+            os.replace(temp_name, target)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        shutil.rmtree(upload_path, ignore_errors=True)
+
+    def abort_multipart_upload(self, bucket: str, key: str, upload_id: str) -> None:
+        """Discard a staged multipart upload."""
+        shutil.rmtree(self._upload_path(upload_id), ignore_errors=True)
+
+    def put_object_tags(self, bucket: str, key: str, tags: dict[str, str]) -> None:
+        """Replace the tags recorded in the object's sidecar."""
+        self._object_path(bucket, key).stat()
+        sidecar = self._read_metadata(bucket, key)
+        self._write_metadata(
+            bucket,
+            key,
+            content_type=sidecar.get("content_type"),
+            metadata=sidecar.get("metadata"),
+            content_encoding=sidecar.get("content_encoding"),
+            tags=tags,
+        )
+
+    def copy_object(
+        self,
+        bucket: str,
+        source_key: str,
+        destination_key: str,
+        *,
+        metadata: dict[str, str] | None = None,
+        content_type: str | None = None,
+    ) -> None:
+        """Copy atomically; ``metadata`` replaces the source metadata when given."""
+        source_sidecar = self._read_metadata(bucket, source_key)
+        source = self._object_path(bucket, source_key)
+        target = self._object_path(bucket, destination_key)
+
+        def write_destination_metadata() -> None:
+            self._write_metadata(
+                bucket,
+                destination_key,
+                content_type=content_type or source_sidecar.get("content_type"),
+                metadata=source_sidecar.get("metadata") if metadata is None else metadata,
+                content_encoding=source_sidecar.get("content_encoding"),
+                tags=source_sidecar.get("tags"),
+            )
+
+        if source == target:
+            write_destination_metadata()
+            return
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=target.parent)
+        os.close(fd)
+        try:
+            shutil.copyfile(source, temp_name)
+            write_destination_metadata()
+            os.replace(temp_name, target)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+    def delete_object(self, bucket: str, key: str) -> None:
+        """Execute delete object; deleting a missing key is a no-op, as on S3."""
+        self._object_path(bucket, key).unlink(missing_ok=True)
+        self._metadata_path(bucket, key).unlink(missing_ok=True)
+
+    def delete_objects(self, bucket: str, keys: list[str]) -> dict[str, str]:
+        """Delete each key and return an error message per failed key."""
+        errors: dict[str, str] = {}
+        for key in keys:
+            try:
+                self.delete_object(bucket, key)
+            except (OSError, ValueError) as exc:
+                errors[key] = str(exc)
+        return errors
+
+    def _bucket_path(self, bucket: str) -> Path:
+        if not bucket or bucket.startswith(".") or "/" in bucket:
+            raise ValueError(f"Invalid bucket name: {bucket!r}")
+        return self.root / bucket
+
+    def _object_path(self, bucket: str, key: str) -> Path:
+        bucket_path = self._bucket_path(bucket)
+        path = (bucket_path / key).resolve()
+        if path != bucket_path.resolve() and bucket_path.resolve() not in path.parents:
+            raise ValueError(f"Object key escapes its bucket: {key!r}")
+        return path
+
+    def _metadata_path(self, bucket: str, key: str) -> Path:
+        self._object_path(bucket, key)
+        return self.root / _META_DIR / bucket / f"{key}.json"
+
+    def _claim_path(self, bucket: str, key: str) -> Path:
+        self._object_path(bucket, key)
+        return self.root / _CLAIMS_DIR / bucket / key
+
+    def _upload_path(self, upload_id: str) -> Path:
+        return self.root / _UPLOADS_DIR / upload_id
+
+    def _read_metadata(self, bucket: str, key: str) -> dict[str, Any]:
+        try:
+            return json.loads(self._metadata_path(bucket, key).read_text())
+        except FileNotFoundError:
+            return {}
+
+    def _write_metadata(
+        self,
+        bucket: str,
+        key: str,
+        *,
+        content_type: str | None,
+        metadata: dict[str, str] | None,
+        content_encoding: str | None = None,
+        tags: dict[str, str] | None = None,
+    ) -> None:
+        sidecar = {
+            "content_type": content_type,
+            "content_encoding": content_encoding,
+            "metadata": dict(metadata or {}),
+            "tags": dict(tags or {}),
+        }
+        self._atomic_write(self._metadata_path(bucket, key), json.dumps(sidecar).encode("utf-8"))
+
+    @staticmethod
+    def _take_claim(claim: Path) -> bool:
+        """Create ``claim`` exclusively; a claim older than ``_CLAIM_TTL_SECONDS`` was left by a crashed writer."""
+        claim.parent.mkdir(parents=True, exist_ok=True)
+        for _ in range(2):
+            try:
+                os.close(os.open(claim, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return True
+            except FileExistsError:
+                try:
+                    if time.time() - claim.stat().st_mtime < _CLAIM_TTL_SECONDS:
+                        return False
+                except FileNotFoundError:
+                    # The other creator just finished; the key exists now.
+                    return False
+                claim.unlink(missing_ok=True)
+        return False
+
+    @staticmethod
+    def _atomic_create(path: Path, payload: bytes) -> bool:
+        """Write a temp file and hard-link it into place; linking onto an existing path fails atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.link(temp_name, path)
+            return True
+        except FileExistsError:
+            return False
+        finally:
+            Path(temp_name).unlink(missing_ok=True)
+
+    @staticmethod
+    def _atomic_write(path: Path, payload: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(temp_name, path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
@@ -10,14 +10,46 @@ Role:
 
 Design intent:
 - Keep storage driver details out of worker business logic.
+- Bulk reads/writes fan out over a thread pool sized to the client's
+  connection pool, so many small objects cost round-trip latency once per
+  wave instead of once per object.
+- Large objects stream through ``open_read``/``open_write`` so memory stays
+  bounded by the chunk/part size instead of the object size.
+- Every write through this gateway persists the canonical SHA-256 of the
+  payload in the ``sha256`` object metadata (or, for multipart writes, the
+  ``sha256`` object tag), so readers can learn a content hash from
+  ``stat_object`` without downloading the body.
+- An optional ``CompressionPolicy`` compresses ``write_object`` payloads per
+  key prefix and ``read_object`` decodes by the stored ``Content-Encoding``.
+- ``write_if_absent`` makes create-once writes a single conditional request
+  (``If-None-Match: *``) instead of HEAD-then-PUT, so concurrent writers of
+  the same deterministic key cannot both write it.
 
 Non-goals:
 - This module does not implement domain validation for payload schemas.
 """
 
-from typing import Any, ClassVar, Protocol
+import base64
+import binascii
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Protocol, TypeVar
 
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from pipeline_common.gateways.object_storage.compression import CompressionPolicy
+from pipeline_common.gateways.object_storage.streams import (
+    DEFAULT_READ_CHUNK_SIZE,
+    DEFAULT_WRITE_PART_SIZE,
+    SHA256_METADATA_KEY,
+    ObjectReadStream,
+    ObjectWriteStream,
+    ReadableBody,
+)
+from pipeline_common.provenance import sha256_hex
 
 FOLDERS = (
     "01_incoming/",
@@ -31,6 +63,55 @@ FOLDERS = (
     "09_tmp/",
 )
 
+TItem = TypeVar("TItem")
+
+DELETE_BATCH_SIZE = 1000
+
+_SHA256_HEX = re.compile(r"^[0-9a-f]{64}$")
+
+
+@dataclass(frozen=True)
+class ObjectStat:
+    """Object metadata read without downloading the body.
+
+    ``sha256`` is the canonical content checksum (lowercase hex) or ``None``
+    when the object carries no trustworthy one; ``etag`` is informational
+    only and never a content hash (multipart ETags are not digests).
+    """
+
+    size: int
+    content_type: str | None = None
+    etag: str | None = None
+    sha256: str | None = None
+    metadata: dict[str, str] = field(default_factory=dict)
+    content_encoding: str | None = None
+
+
+@dataclass(frozen=True)
+class ObjectWrite:
+    """One object to write in a bulk ``write_many`` call."""
+
+    uri: str
+    payload: bytes
+    content_type: str = "application/octet-stream"
+
+
+@dataclass(frozen=True)
+class ObjectResult:
+    """Per-object outcome of a bulk read or write.
+
+    ``payload`` holds the object bytes for successful reads; ``error`` holds
+    the exception raised for that object, leaving the rest of the batch intact.
+    """
+
+    uri: str
+    payload: bytes | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
 
 class ObjectStorageGateway:
     """Facade over an object-storage client implementation.
@@ -47,9 +128,10 @@ class ObjectStorageGateway:
     Non-goals:
     - No retry/backoff policy abstraction beyond client call behavior.
     """
-    def __init__(self, client: "ObjectStorageClient") -> None:
+    def __init__(self, client: "ObjectStorageClient", *, compression: CompressionPolicy | None = None) -> None:
         """Initialize instance state and dependencies."""
         self.client = client
+        self.compression = compression or CompressionPolicy()
 
     def bucket_exists(self, bucket: str) -> bool:
         """Execute bucket exists."""
@@ -71,14 +153,24 @@ class ObjectStorageGateway:
         """Execute list keys."""
         return self.client.list_keys(bucket, prefix)
 
+    def iter_keys(self, bucket: str, prefix: str, *, start_after: str | None = None) -> Iterator[str]:
+        """Yield keys under ``prefix`` in lexicographic order, one listing page at a time.
+
+        Args:
+            start_after: Only keys sorting strictly after this key are listed,
+                so an interrupted walk resumes from its last processed key.
+        """
+        return self.client.iter_keys(bucket, prefix, start_after=start_after)
+
     def build_uri(self, bucket: str, key: str) -> str:
         """Build a storage URI from bucket and key parts."""
         return f"{self.client.URI_SCHEME}://{bucket}/{key}"
 
     def read_object(self, uri: str) -> bytes:
-        """Execute read object from an ``s3a://`` URI."""
+        """Execute read object from an ``s3a://`` URI, decoding any ``Content-Encoding``."""
         bucket, key = self._split_source_uri(uri)
-        return self.client.read_bytes(bucket, key)
+        body, content_encoding = self.client.read_bytes_with_encoding(bucket, key)
+        return self.compression.decode(body, content_encoding)
 
     def write_object(
         self,
@@ -86,23 +178,200 @@ class ObjectStorageGateway:
         payload: bytes,
         content_type: str = "application/octet-stream",
     ) -> None:
-        """Execute write object."""
+        """Write an object, compressed when its prefix has a codec, with the payload SHA-256 in metadata."""
+        bucket, key = self._split_source_uri(uri)
+        codec = self.compression.codec_for_key(key)
+        self.client.write_bytes(
+            bucket,
+            key,
+            codec.compress(payload) if codec else payload,
+            content_type=content_type,
+            metadata={SHA256_METADATA_KEY: sha256_hex(payload)},
+            content_encoding=codec.CONTENT_ENCODING if codec else None,
+        )
+
+    def write_if_absent(
+        self,
+        uri: str,
+        payload: bytes,
+        content_type: str = "application/octet-stream",
+    ) -> bool:
+        """Write like ``write_object`` unless the key exists; return ``False`` when it already existed."""
+        bucket, key = self._split_source_uri(uri)
+        codec = self.compression.codec_for_key(key)
+        return self.client.write_bytes_if_absent(
+            bucket,
+            key,
+            codec.compress(payload) if codec else payload,
+            content_type=content_type,
+            metadata={SHA256_METADATA_KEY: sha256_hex(payload)},
+            content_encoding=codec.CONTENT_ENCODING if codec else None,
+        )
+
+    def existing_keys(self, bucket: str, prefix: str) -> set[str]:
+        """Return every key under ``prefix`` with one listing, for batch existence checks."""
+        return set(self.client.iter_keys(bucket, prefix))
+
+    def stat_object(self, uri: str) -> ObjectStat:
+        """Return size, content type, ETag and checksum metadata without reading the body."""
+        bucket, key = self._split_source_uri(uri)
+        return self.client.stat_object(bucket, key)
+
+    def open_read(
+        self,
+        uri: str,
+        *,
+        byte_range: tuple[int, int | None] | None = None,
+        chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+    ) -> ObjectReadStream:
+        """Open a chunked read stream over an object.
+
+        Args:
+            uri: Storage URI to read.
+            byte_range: Inclusive ``(start, end)`` byte offsets; ``end=None`` reads to the end.
+            chunk_size: Bytes per chunk yielded when iterating the stream.
+        """
         bucket, key = self._split_source_uri(uri)
-        self.client.write_bytes(bucket, key, payload, content_type=content_type)
+        return ObjectReadStream(self.client.open_stream(bucket, key, byte_range=byte_range), chunk_size=chunk_size)
 
-    def copy_object(self, source_uri: str, destination_uri: str) -> None:
-        """Execute copy using storage URIs."""
+    def read_range(self, uri: str, byte_range: tuple[int, int]) -> bytes:
+        """Read one inclusive ``(start, end)`` byte range of the stored object bytes."""
+        with self.open_read(uri, byte_range=byte_range) as stream:
+            return stream.read()
+
+    def open_write(
+        self,
+        uri: str,
+        content_type: str = "application/octet-stream",
+        *,
+        part_size: int = DEFAULT_WRITE_PART_SIZE,
+    ) -> ObjectWriteStream:
+        """Open a multipart write stream; the object appears when the stream closes without error."""
+        bucket, key = self._split_source_uri(uri)
+        return ObjectWriteStream(self.client, bucket=bucket, key=key, content_type=content_type, part_size=part_size)
+
+    def read_many(self, uris: Iterable[str], *, max_concurrency: int | None = None) -> dict[str, ObjectResult]:
+        """Read objects concurrently; one failed read does not fail the others.
+
+        Args:
+            uris: Storage URIs to read; duplicates are read once.
+            max_concurrency: Worker threads; defaults to the client's ``max_concurrency``.
+
+        Returns:
+            One ``ObjectResult`` per URI, keyed by URI.
+        """
+        return self._run_many(
+            list(dict.fromkeys(uris)),
+            lambda uri: ObjectResult(uri=uri, payload=self.read_object(uri)),
+            uri_of=lambda uri: uri,
+            max_concurrency=max_concurrency,
+        )
+
+    def write_many(
+        self,
+        writes: Iterable[ObjectWrite],
+        *,
+        max_concurrency: int | None = None,
+    ) -> dict[str, ObjectResult]:
+        """Write objects concurrently; one failed write does not fail the others.
+
+        Args:
+            writes: Objects to write; a later write to the same URI wins.
+            max_concurrency: Worker threads; defaults to the client's ``max_concurrency``.
+
+        Returns:
+            One ``ObjectResult`` (without payload) per URI, keyed by URI.
+        """
+        by_uri = {write.uri: write for write in writes}
+
+        def _write(write: ObjectWrite) -> ObjectResult:
+            self.write_object(uri=write.uri, payload=write.payload, content_type=write.content_type)
+            return ObjectResult(uri=write.uri)
+
+        return self._run_many(
+            list(by_uri.values()),
+            _write,
+            uri_of=lambda write: write.uri,
+            max_concurrency=max_concurrency,
+        )
+
+    def copy_object(
+        self,
+        source_uri: str,
+        destination_uri: str,
+        *,
+        metadata: dict[str, str] | None = None,
+        content_type: str | None = None,
+    ) -> None:
+        """Execute copy using storage URIs.
+
+        Args:
+            metadata: Replaces the copied object's metadata when given (for
+                example to stamp a ``sha256`` computed for a legacy source).
+            content_type: Content type kept on the copy when ``metadata`` is replaced.
+        """
         bucket, source_key = self._split_source_uri(source_uri)
         destination_bucket, destination_key = self._split_source_uri(destination_uri)
         if bucket != destination_bucket:
             raise ValueError("copy_object requires source and destination to be in the same bucket")
-        self.client.copy_object(bucket, source_key, destination_key)
+        self.client.copy_object(bucket, source_key, destination_key, metadata=metadata, content_type=content_type)
 
     def delete_object(self, uri: str) -> None:
         """Execute delete using a storage URI."""
         bucket, key = self._split_source_uri(uri)
         self.client.delete_object(bucket, key)
 
+    def delete_many(self, uris: Iterable[str]) -> dict[str, ObjectResult]:
+        """Delete objects with batched ``delete_objects`` calls of up to ``DELETE_BATCH_SIZE`` keys.
+
+        Returns:
+            One ``ObjectResult`` (without payload) per URI, keyed by URI; a
+            failed batch call fails every URI in that batch.
+        """
+        keys_by_bucket: dict[str, dict[str, str]] = {}
+        for uri in dict.fromkeys(uris):
+            bucket, key = self._split_source_uri(uri)
+            keys_by_bucket.setdefault(bucket, {})[key] = uri
+        results: dict[str, ObjectResult] = {}
+        for bucket, uri_by_key in keys_by_bucket.items():
+            keys = list(uri_by_key)
+            for start in range(0, len(keys), DELETE_BATCH_SIZE):
+                batch = keys[start : start + DELETE_BATCH_SIZE]
+                try:
+                    errors: dict[str, Exception] = {
+                        key: RuntimeError(message) for key, message in self.client.delete_objects(bucket, batch).items()
+                    }
+                except Exception as exc:
+                    errors = {key: exc for key in batch}
+                for key in batch:
+                    uri = uri_by_key[key]
+                    results[uri] = ObjectResult(uri=uri, error=errors.get(key))
+        return results
+
+    def _run_many(
+        self,
+        items: list[TItem],
+        operation: Callable[[TItem], ObjectResult],
+        *,
+        uri_of: Callable[[TItem], str],
+        max_concurrency: int | None,
+    ) -> dict[str, ObjectResult]:
+        """Apply ``operation`` to items on a thread pool and capture per-item errors."""
+
+        def _capture(item: TItem) -> ObjectResult:
+            try:
+                return operation(item)
+            except Exception as exc:
+                return ObjectResult(uri=uri_of(item), error=exc)
+
+        workers = min(max_concurrency or self.client.max_concurrency, len(items))
+        if workers <= 1:
+            results = [_capture(item) for item in items]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="object-storage") as executor:
+                results = list(executor.map(_capture, items))
+        return {result.uri: result for result in results}
+
     def _split_source_uri(self, source_uri: str) -> tuple[str, str]:
         uri_without_scheme = source_uri.split("://", 1)[-1]
         bucket, key = uri_without_scheme.split("/", 1)
@@ -113,6 +382,8 @@ class ObjectStorageClient(Protocol):
     """Port contract implemented by concrete object-storage clients."""
 
     URI_SCHEME: ClassVar[str]
+    max_concurrency: int
+    """Number of calls the client can serve concurrently from different threads."""
 
     def bucket_exists(self, bucket: str) -> bool:
         """Execute bucket exists."""
@@ -130,22 +401,90 @@ class ObjectStorageClient(Protocol):
         """Execute list keys."""
         ...
 
+    def iter_keys(self, bucket: str, prefix: str, *, start_after: str | None = None) -> Iterator[str]:
+        """Lazily list keys under ``prefix`` sorting after ``start_after``, fetching pages on demand."""
+        ...
+
     def read_bytes(self, bucket: str, key: str) -> bytes:
         """Execute read bytes."""
         ...
 
-    def write_bytes(self, bucket: str, key: str, payload: bytes, content_type: str) -> None:
-        """Execute write bytes."""
+    def read_bytes_with_encoding(self, bucket: str, key: str) -> tuple[bytes, str | None]:
+        """Read the stored body and its ``Content-Encoding`` (``None`` when unset)."""
         ...
 
-    def copy_object(self, bucket: str, source_key: str, destination_key: str) -> None:
-        """Execute copy object."""
+    def write_bytes(
+        self,
+        bucket: str,
+        key: str,
+        payload: bytes,
+        content_type: str,
+        metadata: dict[str, str] | None = None,
+        content_encoding: str | None = None,
+    ) -> None:
+        """Execute write bytes, storing ``metadata`` as user object metadata."""
+        ...
+
+    def write_bytes_if_absent(
+        self,
+        bucket: str,
+        key: str,
+        payload: bytes,
+        content_type: str,
+        metadata: dict[str, str] | None = None,
+        content_encoding: str | None = None,
+    ) -> bool:
+        """Create the object only if ``key`` does not exist; return ``False`` when it already existed."""
+        ...
+
+    def stat_object(self, bucket: str, key: str) -> ObjectStat:
+        """Return object metadata without reading the body."""
+        ...
+
+    def open_stream(self, bucket: str, key: str, *, byte_range: tuple[int, int | None] | None = None) -> ReadableBody:
+        """Open the object body (optionally an inclusive byte range) without reading it."""
+        ...
+
+    def create_multipart_upload(self, bucket: str, key: str, *, content_type: str) -> str:
+        """Start a multipart upload and return its upload id."""
+        ...
+
+    def upload_part(self, bucket: str, key: str, upload_id: str, part_number: int, payload: bytes) -> str:
+        """Upload one part and return its ETag."""
+        ...
+
+    def complete_multipart_upload(self, bucket: str, key: str, upload_id: str, parts: list[tuple[int, str]]) -> None:
+        """Assemble uploaded ``(part_number, etag)`` parts into the final object."""
+        ...
+
+    def abort_multipart_upload(self, bucket: str, key: str, upload_id: str) -> None:
+        """Discard a multipart upload and its parts."""
+        ...
+
+    def put_object_tags(self, bucket: str, key: str, tags: dict[str, str]) -> None:
+        """Replace the tag set of an existing object."""
+        ...
+
+    def copy_object(
+        self,
+        bucket: str,
+        source_key: str,
+        destination_key: str,
+        *,
+        metadata: dict[str, str] | None = None,
+        content_type: str | None = None,
+    ) -> None:
+        """Execute copy object; ``metadata`` replaces the source metadata when given."""
         ...
 
     def delete_object(self, bucket: str, key: str) -> None:
         """Execute delete object."""
         ...
 
+    def delete_objects(self, bucket: str, keys: list[str]) -> dict[str, str]:
+        """Delete up to ``DELETE_BATCH_SIZE`` keys in one call and return an error message per failed key."""
+        ...
+
 
 class S3Client:
     """Concrete S3-compatible client adapter backed by boto3.
@@ -158,6 +497,8 @@ class S3Client:
 
     Design intent:
     - Implement ``ObjectStorageClient`` using a widely available S3 API.
+    - Share one boto3 client across threads (boto3 clients are thread-safe)
+      with an HTTP pool of ``max_pool_connections`` connections.
 
     Non-goals:
     - This class does not expose boto3 objects to worker code.
@@ -165,14 +506,25 @@ class S3Client:
 
     URI_SCHEME: ClassVar[str] = "s3a"
 
-    def __init__(self, *, endpoint_url: str, access_key: str, secret_key: str, region_name: str) -> None:
+    def __init__(
+        self,
+        *,
+        endpoint_url: str,
+        access_key: str,
+        secret_key: str,
+        region_name: str,
+        max_pool_connections: int = 10,
+    ) -> None:
         """Initialize instance state and dependencies."""
+        self.max_concurrency = max_pool_connections
+        self._conditional_writes_supported = True
         self.client = boto3.client(
             "s3",
             endpoint_url=endpoint_url,
             aws_access_key_id=access_key,
             aws_secret_access_key=secret_key,
             region_name=region_name,
+            config=Config(max_pool_connections=max_pool_connections),
         )
 
     def bucket_exists(self, bucket: str) -> bool:
@@ -197,44 +549,218 @@ class S3Client:
 
     def list_keys(self, bucket: str, prefix: str) -> list[str]:
         """Execute list keys."""
-        keys: list[str] = []
+        return list(self.iter_keys(bucket, prefix))
+
+    def iter_keys(self, bucket: str, prefix: str, *, start_after: str | None = None) -> Iterator[str]:
+        """Yield keys page by page from ``ListObjectsV2``; the next page is requested only when needed."""
         continuation_token: str | None = None
         while True:
             params: dict[str, Any] = {"Bucket": bucket, "Prefix": prefix}
             if continuation_token:
                 params["ContinuationToken"] = continuation_token
+            elif start_after:
+                params["StartAfter"] = start_after
             response = self.client.list_objects_v2(**params)
             for item in response.get("Contents", []):
                 key = item.get("Key")
                 if isinstance(key, str):
-                    keys.append(key)
+                    yield key
             if not response.get("IsTruncated"):
-                break
+                return
             continuation_token = response.get("NextContinuationToken")
-        return keys
 
     def read_bytes(self, bucket: str, key: str) -> bytes:
         """Execute read bytes."""
+        return self.read_bytes_with_encoding(bucket, key)[0]
+
+    def read_bytes_with_encoding(self, bucket: str, key: str) -> tuple[bytes, str | None]:
+        """Read the stored body; boto3 does not decode ``Content-Encoding`` itself."""
         response = self.client.get_object(Bucket=bucket, Key=key)
-        return response["Body"].read()
+        return response["Body"].read(), response.get("ContentEncoding") or None
 
-    def write_bytes(self, bucket: str, key: str, payload: bytes, content_type: str) -> None:
+    def write_bytes(
+        self,
+        bucket: str,
+        key: str,
+        payload: bytes,
+        content_type: str,
+        metadata: dict[str, str] | None = None,
+        content_encoding: str | None = None,
+    ) -> None:
         """Execute write bytes."""
-        self.client.put_object(
+        self.client.put_object(**self._put_params(bucket, key, payload, content_type, metadata, content_encoding))
+
+    def write_bytes_if_absent(
+        self,
+        bucket: str,
+        key: str,
+        payload: bytes,
+        content_type: str,
+        metadata: dict[str, str] | None = None,
+        content_encoding: str | None = None,
+    ) -> bool:
+        """Conditional PUT with ``If-None-Match: *``; a ``412`` means the object already existed.
+
+        Endpoints that reject conditional writes with ``NotImplemented`` fall
+        back to HEAD-then-PUT for the rest of the client's life; that fallback
+        is not race-free.
+        """
+        params = self._put_params(bucket, key, payload, content_type, metadata, content_encoding)
+        if self._conditional_writes_supported:
+            try:
+                self.client.put_object(**params, IfNoneMatch="*")
+                return True
+            except ClientError as exc:
+                error_code = str(exc.response.get("Error", {}).get("Code", ""))
+                if error_code in {"PreconditionFailed", "412"}:
+                    return False
+                if error_code not in {"NotImplemented", "501"}:
+                    raise
+                self._conditional_writes_supported = False
+        if self.object_exists(bucket, key):
+            return False
+        self.client.put_object(**params)
+        return True
+
+    @staticmethod
+    def _put_params(
+        bucket: str,
+        key: str,
+        payload: bytes,
+        content_type: str,
+        metadata: dict[str, str] | None,
+        content_encoding: str | None,
+    ) -> dict[str, Any]:
+        params: dict[str, Any] = {
+            "Bucket": bucket,
+            "Key": key,
+            "Body": payload,
+            "ContentType": content_type,
+            "Metadata": metadata or {},
+        }
+        if content_encoding:
+            params["ContentEncoding"] = content_encoding
+        return params
+
+    def stat_object(self, bucket: str, key: str) -> ObjectStat:
+        """Read object metadata with ``head_object``; the body is not transferred."""
+        response = self.client.head_object(Bucket=bucket, Key=key, ChecksumMode="ENABLED")
+        metadata = {str(name).lower(): str(value) for name, value in (response.get("Metadata") or {}).items()}
+        etag = str(response.get("ETag") or "").strip('"') or None
+        return ObjectStat(
+            size=int(response.get("ContentLength", 0)),
+            content_type=response.get("ContentType"),
+            etag=etag,
+            sha256=_canonical_sha256(metadata, response.get("ChecksumSHA256")) or self._tagged_sha256(bucket, key),
+            metadata=metadata,
+            content_encoding=response.get("ContentEncoding") or None,
+        )
+
+    def _tagged_sha256(self, bucket: str, key: str) -> str | None:
+        """Read the ``sha256`` tag stamped on multipart writes; ``None`` when absent or not readable."""
+        try:
+            tag_set = self.client.get_object_tagging(Bucket=bucket, Key=key).get("TagSet", [])
+        except ClientError:
+            return None
+        return _canonical_sha256({str(tag["Key"]).lower(): str(tag["Value"]) for tag in tag_set}, None)
+
+    def open_stream(self, bucket: str, key: str, *, byte_range: tuple[int, int | None] | None = None) -> ReadableBody:
+        """Return the botocore streaming body of an object, optionally limited to a byte range."""
+        params: dict[str, Any] = {"Bucket": bucket, "Key": key}
+        if byte_range is not None:
+            start, end = byte_range
+            params["Range"] = f"bytes={start}-{'' if end is None else end}"
+        return self.client.get_object(**params)["Body"]
+
+    def create_multipart_upload(self, bucket: str, key: str, *, content_type: str) -> str:
+        """Start a multipart upload."""
+        response = self.client.create_multipart_upload(Bucket=bucket, Key=key, ContentType=content_type)
+        return str(response["UploadId"])
+
+    def upload_part(self, bucket: str, key: str, upload_id: str, part_number: int, payload: bytes) -> str:
+        """Upload one multipart part."""
+        response = self.client.upload_part(
             Bucket=bucket,
             Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
             Body=payload,
-            ContentType=content_type,
         )
+        return str(response["ETag"])
 
-    def copy_object(self, bucket: str, source_key: str, destination_key: str) -> None:
-        """Execute copy object."""
-        self.client.copy_object(
+    def complete_multipart_upload(self, bucket: str, key: str, upload_id: str, parts: list[tuple[int, str]]) -> None:
+        """Complete a multipart upload."""
+        self.client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": [{"PartNumber": number, "ETag": etag} for number, etag in parts]},
+        )
+
+    def abort_multipart_upload(self, bucket: str, key: str, upload_id: str) -> None:
+        """Abort a multipart upload."""
+        self.client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+
+    def put_object_tags(self, bucket: str, key: str, tags: dict[str, str]) -> None:
+        """Replace the object's tag set with ``PutObjectTagging``; the body is not rewritten."""
+        self.client.put_object_tagging(
             Bucket=bucket,
-            CopySource={"Bucket": bucket, "Key": source_key},
-            Key=destination_key,
+            Key=key,
+            Tagging={"TagSet": [{"Key": name, "Value": value} for name, value in tags.items()]},
         )
 
+    def copy_object(
+        self,
+        bucket: str,
+        source_key: str,
+        destination_key: str,
+        *,
+        metadata: dict[str, str] | None = None,
+        content_type: str | None = None,
+    ) -> None:
+        """Execute copy object."""
+        params: dict[str, Any] = {
+            "Bucket": bucket,
+            "CopySource": {"Bucket": bucket, "Key": source_key},
+            "Key": destination_key,
+        }
+        if metadata is not None:
+            params["Metadata"] = metadata
+            params["MetadataDirective"] = "REPLACE"
+            if content_type:
+                params["ContentType"] = content_type
+        self.client.copy_object(**params)
+
     def delete_object(self, bucket: str, key: str) -> None:
         """Execute delete object."""
         self.client.delete_object(Bucket=bucket, Key=key)
+
+    def delete_objects(self, bucket: str, keys: list[str]) -> dict[str, str]:
+        """Delete keys with one ``DeleteObjects`` request (quiet mode reports only failures)."""
+        response = self.client.delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+        return {
+            str(error["Key"]): f"{error.get('Code', 'Error')}: {error.get('Message', '')}"
+            for error in response.get("Errors", [])
+        }
+
+
+def _canonical_sha256(metadata: dict[str, str], checksum_sha256: str | None) -> str | None:
+    """Resolve the canonical SHA-256 hex digest from object metadata.
+
+    Prefers the ``sha256`` user metadata written by this gateway, then a
+    full-object S3 ``ChecksumSHA256``. Composite multipart checksums
+    (``<digest>-<parts>``) and ETags are not content hashes and are ignored.
+    """
+    persisted = metadata.get(SHA256_METADATA_KEY, "").lower()
+    if _SHA256_HEX.match(persisted):
+        return persisted
+    if not checksum_sha256 or "-" in checksum_sha256:
+        return None
+    try:
+        digest = base64.b64decode(checksum_sha256, validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    return digest.hex() if len(digest) == 32 else None
@@ -0,0 +1,276 @@
+"""Read-through local disk cache for object-storage reads.
+
+Layer:
+- Infrastructure decorator around ``ObjectStorageGateway``.
+
+Role:
+- Serve repeated ``read_object`` calls for the same artifact (chunk input,
+  replay and reindex flows) from local disk instead of a full S3 GET.
+
+Design intent:
+- Entries are keyed by URI plus ETag, so a rewritten object never serves
+  stale bytes. Keys under immutable prefixes (content-addressed stage
+  outputs) are keyed by URI alone and hit without any request; other keys
+  cost one ``stat_object`` (HEAD) per read to learn the current ETag.
+- The cache is bounded by total bytes and evicts least recently used
+  entries; entry files are named by digest, so the index is rebuilt from
+  the cache directory (ordered by mtime) after a restart.
+- Writes, copies and deletes through the gateway invalidate the URI-only
+  entry they overwrite.
+- Entries hold decoded payloads, so hits also skip decompression.
+
+Non-goals:
+- No sharing between processes beyond reusing the directory after restart;
+  give each worker process its own ``OBJECT_CACHE_DIR``.
+- Streams (``open_read``) bypass the cache; they exist for objects too
+  large to hold.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+from pipeline_common.gateways.object_storage.compression import CompressionPolicy, key_has_prefix
+from pipeline_common.gateways.object_storage.object_storage import ObjectResult, ObjectStorageGateway
+from pipeline_common.gateways.object_storage.streams import DEFAULT_WRITE_PART_SIZE, ObjectWriteStream
+
+if TYPE_CHECKING:
+    from pipeline_common.gateways.object_storage.object_storage import ObjectStorageClient
+
+DEFAULT_IMMUTABLE_PREFIXES = ("04_chunks/", "05_embeddings/")
+_TEMP_PREFIX = ".tmp-"
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time cache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes_used: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class DiskReadCache:
+    """Byte-bounded LRU of object payloads stored as files under ``directory``."""
+
+    def __init__(self, *, directory: str, max_bytes: int) -> None:
+        """Initialize the cache and index entries left by a previous process."""
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be greater than zero")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._bytes_used = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._load_index()
+        self._evict_over_budget()
+
+    def get(self, uri: str, etag: str | None = None) -> bytes | None:
+        """Return the cached payload for ``uri`` at ``etag`` or ``None`` on a miss."""
+        name = self._entry_name(uri, etag)
+        with self._lock:
+            if name not in self._entries:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(name)
+        try:
+            payload = (self.directory / name).read_bytes()
+            os.utime(self.directory / name)
+        except FileNotFoundError:
+            with self._lock:
+                self._forget(name)
+                self._misses += 1
+            return None
+        with self._lock:
+            self._hits += 1
+        return payload
+
+    def put(self, uri: str, etag: str | None, payload: bytes) -> None:
+        """Store ``payload`` and evict least recently used entries over budget."""
+        if len(payload) > self.max_bytes:
+            return
+        name = self._entry_name(uri, etag)
+        fd, temp_name = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(temp_name, self.directory / name)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self._forget(name)
+            self._entries[name] = len(payload)
+            self._bytes_used += len(payload)
+            self._evict_over_budget()
+
+    def invalidate(self, uri: str, etag: str | None = None) -> None:
+        """Drop the entry for ``uri`` at ``etag`` if cached."""
+        name = self._entry_name(uri, etag)
+        with self._lock:
+            if name in self._entries:
+                self._forget(name)
+                (self.directory / name).unlink(missing_ok=True)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of hit/miss/eviction counters and current usage."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes_used=self._bytes_used,
+            )
+
+    def _forget(self, name: str) -> None:
+        size = self._entries.pop(name, None)
+        if size is not None:
+            self._bytes_used -= size
+
+    def _evict_over_budget(self) -> None:
+        while self._bytes_used > self.max_bytes and self._entries:
+            name, size = self._entries.popitem(last=False)
+            self._bytes_used -= size
+            self._evictions += 1
+            (self.directory / name).unlink(missing_ok=True)
+
+    def _load_index(self) -> None:
+        found: list[tuple[int, str, int]] = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if entry.name.startswith(_TEMP_PREFIX):
+                    Path(entry.path).unlink(missing_ok=True)
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+                found.append((stat.st_mtime_ns, entry.name, stat.st_size))
+        for _, name, size in sorted(found):
+            self._entries[name] = size
+            self._bytes_used += size
+
+    @staticmethod
+    def _entry_name(uri: str, etag: str | None) -> str:
+        return hashlib.sha256(f"{uri}\n{etag or ''}".encode("utf-8")).hexdigest()
+
+
+class CachingObjectStorageGateway(ObjectStorageGateway):
+    """``ObjectStorageGateway`` whose ``read_object`` reads through a ``DiskReadCache``.
+
+    Design intent:
+    - Drop-in replacement: workers keep calling ``read_object``/``read_many``.
+    - ``immutable_prefixes`` match a key's leading folder after any
+      environment prefix (``dev/04_chunks/...`` matches ``04_chunks/``).
+    """
+
+    def __init__(
+        self,
+        client: "ObjectStorageClient",
+        *,
+        cache: DiskReadCache,
+        immutable_prefixes: Iterable[str] = DEFAULT_IMMUTABLE_PREFIXES,
+        compression: CompressionPolicy | None = None,
+    ) -> None:
+        """Initialize the facade and its read cache."""
+        super().__init__(client, compression=compression)
+        self.cache = cache
+        self.immutable_prefixes = tuple(immutable_prefixes)
+
+    def read_object(self, uri: str) -> bytes:
+        """Read through the cache; only immutable keys skip the ETag check."""
+        if self._is_immutable(uri):
+            payload = self.cache.get(uri)
+            if payload is None:
+                payload = super().read_object(uri)
+                self.cache.put(uri, None, payload)
+            return payload
+        etag = self.stat_object(uri).etag
+        if etag is None:
+            return super().read_object(uri)
+        payload = self.cache.get(uri, etag)
+        if payload is None:
+            payload = super().read_object(uri)
+            self.cache.put(uri, etag, payload)
+        return payload
+
+    def write_object(
+        self,
+        uri: str,
+        payload: bytes,
+        content_type: str = "application/octet-stream",
+    ) -> None:
+        """Write the object and drop any URI-keyed entry it replaces."""
+        super().write_object(uri, payload, content_type)
+        self.cache.invalidate(uri)
+
+    def write_if_absent(
+        self,
+        uri: str,
+        payload: bytes,
+        content_type: str = "application/octet-stream",
+    ) -> bool:
+        """Create the object if absent and drop any URI-keyed entry when it was written."""
+        wrote = super().write_if_absent(uri, payload, content_type)
+        if wrote:
+            self.cache.invalidate(uri)
+        return wrote
+
+    def open_write(
+        self,
+        uri: str,
+        content_type: str = "application/octet-stream",
+        *,
+        part_size: int = DEFAULT_WRITE_PART_SIZE,
+    ) -> ObjectWriteStream:
+        """Open a write stream and drop any URI-keyed entry it will replace."""
+        self.cache.invalidate(uri)
+        return super().open_write(uri, content_type, part_size=part_size)
+
+    def copy_object(
+        self,
+        source_uri: str,
+        destination_uri: str,
+        *,
+        metadata: dict[str, str] | None = None,
+        content_type: str | None = None,
+    ) -> None:
+        """Copy the object and drop any URI-keyed entry at the destination."""
+        super().copy_object(source_uri, destination_uri, metadata=metadata, content_type=content_type)
+        self.cache.invalidate(destination_uri)
+
+    def delete_object(self, uri: str) -> None:
+        """Delete the object and its URI-keyed entry."""
+        super().delete_object(uri)
+        self.cache.invalidate(uri)
+
+    def delete_many(self, uris: Iterable[str]) -> dict[str, ObjectResult]:
+        """Delete objects in batches and drop the URI-keyed entries of those deleted."""
+        results = super().delete_many(uris)
+        for uri, result in results.items():
+            if result.ok:
+                self.cache.invalidate(uri)
+        return results
+
+    def _is_immutable(self, uri: str) -> bool:
+        _, key = self._split_source_uri(uri)
+        return any(key_has_prefix(key, prefix) for prefix in self.immutable_prefixes)
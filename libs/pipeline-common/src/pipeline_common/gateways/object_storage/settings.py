@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
-from pipeline_common.helpers.config import _optional_env, _required_env
+from pipeline_common.gateways.object_storage.read_cache import DEFAULT_IMMUTABLE_PREFIXES
+from pipeline_common.helpers.config import _optional_env, _required_env, _required_int
 
 
 @dataclass(frozen=True)
@@ -11,13 +12,38 @@ class S3StorageSettings:
     s3_access_key: str
     s3_secret_key: str
     aws_region: str
+    s3_max_pool_connections: int
+    object_cache_dir: str | None = None
+    object_cache_max_bytes: int = 1024 * 1024 * 1024
+    object_cache_immutable_prefixes: tuple[str, ...] = DEFAULT_IMMUTABLE_PREFIXES
+    object_compression: str = ""
 
     @classmethod
     def from_env(cls) -> "S3StorageSettings":
-        """Execute from env."""
+        """Execute from env; credentials are optional for ``local://`` filesystem endpoints.
+
+        ``OBJECT_CACHE_DIR`` enables the read-through disk cache (disabled when unset).
+        ``OBJECT_STORAGE_COMPRESSION`` (``"<prefix>=<codec>,..."``) compresses writes per prefix.
+        """
+        s3_endpoint = _required_env("S3_ENDPOINT")
+        if s3_endpoint.startswith("local://"):
+            access_key = _optional_env("S3_ACCESS_KEY", "")
+            secret_key = _optional_env("S3_SECRET_KEY", "")
+        else:
+            access_key = _required_env("S3_ACCESS_KEY")
+            secret_key = _required_env("S3_SECRET_KEY")
         return cls(
-            s3_endpoint=_required_env("S3_ENDPOINT"),
-            s3_access_key=_required_env("S3_ACCESS_KEY"),
-            s3_secret_key=_required_env("S3_SECRET_KEY"),
+            s3_endpoint=s3_endpoint,
+            s3_access_key=access_key,
+            s3_secret_key=secret_key,
             aws_region=_optional_env("AWS_REGION", "us-east-1"),
+            s3_max_pool_connections=_required_int("S3_MAX_POOL_CONNECTIONS", 32),
+            object_cache_dir=_optional_env("OBJECT_CACHE_DIR", "") or None,
+            object_cache_max_bytes=_required_int("OBJECT_CACHE_MAX_BYTES", 1024 * 1024 * 1024),
+            object_cache_immutable_prefixes=tuple(
+                prefix.strip()
+                for prefix in _optional_env("OBJECT_CACHE_IMMUTABLE_PREFIXES", ",".join(DEFAULT_IMMUTABLE_PREFIXES)).split(",")
+                if prefix.strip()
+            ),
+            object_compression=_optional_env("OBJECT_STORAGE_COMPRESSION", ""),
         )
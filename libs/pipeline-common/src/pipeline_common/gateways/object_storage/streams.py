@@ -0,0 +1,200 @@
+"""Streaming object reads and multipart object writes.
+
+Layer:
+- Infrastructure helper used by ``ObjectStorageGateway``.
+
+Role:
+- Move large objects through bounded memory: reads hand out fixed-size
+  chunks, writes upload fixed-size parts as soon as they fill.
+
+Design intent:
+- Peak memory per stream is one chunk (reads) or one part (writes),
+  independent of object size.
+- Writes smaller than one part fall back to a single ``write_bytes`` call,
+  so small objects do not pay the three multipart round trips.
+- A write stream left through an exception aborts its multipart upload,
+  so no half-written object becomes visible.
+- Write streams hash what they upload and persist the SHA-256 in the
+  ``sha256`` object metadata, like ``ObjectStorageGateway.write_object``.
+  Multipart metadata is fixed when the upload starts, before the digest is
+  known, so multipart objects carry it in a ``sha256`` object tag instead:
+  one small request, with no server-side copy and no 5 GB copy limit.
+
+Non-goals:
+- Does not retry individual parts; a failed stream is retried whole.
+"""
+
+from __future__ import annotations
+
+import logging
+from types import TracebackType
+from typing import TYPE_CHECKING, Iterator, Protocol
+
+from pipeline_common.provenance import StreamingSha256
+
+if TYPE_CHECKING:
+    from pipeline_common.gateways.object_storage.object_storage import ObjectStorageClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_READ_CHUNK_SIZE = 1024 * 1024
+DEFAULT_WRITE_PART_SIZE = 8 * 1024 * 1024
+MIN_WRITE_PART_SIZE = 5 * 1024 * 1024
+SHA256_METADATA_KEY = "sha256"
+
+
+class ReadableBody(Protocol):
+    """Raw response body returned by ``ObjectStorageClient.open_stream``."""
+
+    def read(self, amt: int | None = None) -> bytes:
+        """Read up to ``amt`` bytes, or the rest of the body when ``amt`` is ``None``."""
+        ...
+
+    def close(self) -> None:
+        """Release the underlying connection."""
+        ...
+
+
+class ObjectReadStream:
+    """Chunked reader over one object (or byte range); iterate it for ``chunk_size`` chunks."""
+
+    def __init__(self, body: ReadableBody, *, chunk_size: int = DEFAULT_READ_CHUNK_SIZE) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be greater than zero")
+        self._body = body
+        self.chunk_size = chunk_size
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes; a negative size reads the rest of the stream."""
+        return self._body.read(None if size < 0 else size)
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self._body.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self) -> None:
+        self._body.close()
+
+    def __enter__(self) -> "ObjectReadStream":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class ObjectWriteStream:
+    """Multipart writer: ``write`` buffers at most one part, ``close`` commits the object."""
+
+    def __init__(
+        self,
+        client: "ObjectStorageClient",
+        *,
+        bucket: str,
+        key: str,
+        content_type: str,
+        part_size: int = DEFAULT_WRITE_PART_SIZE,
+    ) -> None:
+        if part_size < MIN_WRITE_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_WRITE_PART_SIZE} bytes")
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._content_type = content_type
+        self.part_size = part_size
+        self._buffer = bytearray()
+        self._upload_id: str | None = None
+        self._parts: list[tuple[int, str]] = []
+        self._closed = False
+        self._hasher = StreamingSha256()
+        self.bytes_written = 0
+
+    def write(self, data: bytes) -> int:
+        """Buffer ``data`` and upload every full part."""
+        if self._closed:
+            raise ValueError("write to a closed object stream")
+        self._buffer.extend(self._hasher.update(data))
+        self.bytes_written += len(data)
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[: self.part_size]))
+            del self._buffer[: self.part_size]
+        return len(data)
+
+    def close(self) -> None:
+        """Upload the final part and complete the upload (or write small objects in one call).
+
+        A failure before the upload completed aborts it, so its parts do not
+        linger in the bucket.
+        """
+        if self._closed:
+            return
+        metadata = {SHA256_METADATA_KEY: self._hasher.hexdigest()}
+        if self._upload_id is None:
+            self._client.write_bytes(
+                self._bucket,
+                self._key,
+                bytes(self._buffer),
+                content_type=self._content_type,
+                metadata=metadata,
+            )
+            self._closed = True
+        else:
+            try:
+                if self._buffer:
+                    self._upload_part(bytes(self._buffer))
+                self._client.complete_multipart_upload(self._bucket, self._key, self._upload_id, self._parts)
+            except BaseException:
+                self.abort()
+                raise
+            self._closed = True
+            try:
+                self._client.put_object_tags(self._bucket, self._key, metadata)
+            except Exception as exc:
+                logger.warning("Could not tag %s/%s with its sha256; readers will hash it: %s", self._bucket, self._key, exc)
+        self._buffer.clear()
+
+    @property
+    def sha256(self) -> str:
+        """SHA-256 hex digest of everything written so far."""
+        return self._hasher.hexdigest()
+
+    def abort(self) -> None:
+        """Discard everything written so far."""
+        if self._closed:
+            return
+        self._closed = True
+        self._buffer.clear()
+        if self._upload_id is not None:
+            self._client.abort_multipart_upload(self._bucket, self._key, self._upload_id)
+
+    def _upload_part(self, payload: bytes) -> None:
+        if self._upload_id is None:
+            self._upload_id = self._client.create_multipart_upload(
+                self._bucket,
+                self._key,
+                content_type=self._content_type,
+            )
+        part_number = len(self._parts) + 1
+        etag = self._client.upload_part(self._bucket, self._key, self._upload_id, part_number, payload)
+        self._parts.append((part_number, etag))
+
+    def __enter__(self) -> "ObjectWriteStream":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
@@ -1,5 +1,40 @@
+from pipeline_common.gateways.queue.async_queue import AsyncConsumedMessage, AsyncQueueGateway
+from pipeline_common.gateways.queue.backend import QueueBackend, QueueDelivery
+from pipeline_common.gateways.queue.backpressure import BackpressurePolicy, ProduceBackpressure
+from pipeline_common.gateways.queue.codec import (
+    EnvelopeCodec,
+    EnvelopeCodecRegistry,
+    JsonEnvelopeCodec,
+    MsgpackEnvelopeCodec,
+)
 from pipeline_common.gateways.queue.envelope import Envelope
-from pipeline_common.gateways.queue.queue import ConsumedMessage, QueueGateway
+from pipeline_common.gateways.queue.lanes import QueueLanes
+from pipeline_common.gateways.queue.in_memory_backend import InMemoryBroker, InMemoryQueueBackend
+from pipeline_common.gateways.queue.pika_backend import PikaQueueBackend, QueueDeliveryMode
+from pipeline_common.gateways.queue.retry import RETRY_ATTEMPT_HEADER, RetryPolicy
+from pipeline_common.gateways.queue.queue import ConsumedBatch, ConsumedMessage, QueueGateway
 
 
-__all__ = ["Envelope", "QueueGateway", "ConsumedMessage"]
+__all__ = [
+    "Envelope",
+    "EnvelopeCodec",
+    "EnvelopeCodecRegistry",
+    "JsonEnvelopeCodec",
+    "MsgpackEnvelopeCodec",
+    "QueueGateway",
+    "ConsumedMessage",
+    "ConsumedBatch",
+    "QueueDeliveryMode",
+    "RetryPolicy",
+    "BackpressurePolicy",
+    "ProduceBackpressure",
+    "QueueLanes",
+    "RETRY_ATTEMPT_HEADER",
+    "QueueBackend",
+    "QueueDelivery",
+    "PikaQueueBackend",
+    "InMemoryBroker",
+    "InMemoryQueueBackend",
+    "AsyncQueueGateway",
+    "AsyncConsumedMessage",
+]
@@ -0,0 +1,159 @@
+"""Asyncio stage queue infrastructure adapter.
+
+Layer:
+- Infrastructure adapter used by asyncio worker services.
+
+Role:
+- Hand stage messages to an asyncio event loop with awaitable
+  ack/nack/retry controls, so one process can keep up to ``max_in_flight``
+  messages in progress at once.
+
+Design intent:
+- Wrap a ``QueueGateway`` instead of talking to a broker client directly,
+  so the async path runs on any ``QueueBackend`` (RabbitMQ or ``memory://``)
+  and shares lanes, backpressure, delayed retries, the ``x-retry-attempt``
+  header and poison-message dead-lettering with the blocking path.
+- Run every gateway call on one dedicated I/O thread: backends are not
+  required to be thread-safe, and the event loop never blocks on the broker.
+  Consumes wait at most ``IO_SLICE_SECONDS`` per call so settlements and
+  publishes from running handlers are not starved.
+
+Non-goals:
+- Does not provide exactly-once guarantees.
+- Does not run handlers; scheduling lives in ``AsyncWorkerService``.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, TypeVar
+
+from pipeline_common.gateways.queue.queue import ConsumedMessage, QueueGateway
+
+IO_SLICE_SECONDS = 0.1
+
+TResult = TypeVar("TResult")
+
+
+@dataclass
+class AsyncConsumedMessage:
+    """A consumed queue message with awaitable ack/nack/retry controls."""
+
+    message: ConsumedMessage
+    _queue: "AsyncQueueGateway" = field(repr=False)
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        """Decoded message payload."""
+        return self.message.payload
+
+    @property
+    def delivery_tag(self) -> int:
+        """Backend delivery tag of this message."""
+        return self.message.delivery_tag
+
+    @property
+    def lane(self) -> str | None:
+        """Priority lane the message was consumed from, if lanes are configured."""
+        return self.message.lane
+
+    @property
+    def attempt(self) -> int:
+        """1-based processing attempt of this delivery under the retry policy."""
+        return self.message.attempt
+
+    async def ack(self) -> None:
+        """Acknowledge the message once."""
+        await self._queue._call(self.message.ack)
+
+    async def nack(self, *, requeue: bool = True) -> None:
+        """Negatively acknowledge the message once."""
+        await self._queue._call(self.message.nack, requeue=requeue)
+
+    async def retry(self, *, error: str, dlq_payload: dict[str, Any] | None = None) -> None:
+        """Park the message in its next delay queue, or dead-letter it once attempts are exhausted."""
+        await self._queue._call(self.message.retry, error=error, dlq_payload=dlq_payload)
+
+
+class AsyncQueueGateway:
+    """Asyncio runtime facade over a ``QueueGateway``.
+
+    Layer:
+    - Infrastructure adapter facade.
+
+    Dependencies:
+    - A ``QueueGateway`` and the ``QueueBackend`` it owns.
+
+    Design intent:
+    - ``get`` awaits the next message without blocking the loop; pushes take
+      the lane of the message being handled explicitly, because concurrent
+      handlers cannot share ``QueueGateway.lane_scope``.
+
+    Non-goals:
+    - Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        gateway: QueueGateway,
+        *,
+        max_in_flight: int,
+        poll_interval_seconds: float = 1.0,
+    ) -> None:
+        """Initialize instance state; ``gateway`` is owned and closed by this facade."""
+        if max_in_flight <= 0:
+            raise ValueError("queue max_in_flight must be greater than zero")
+        self.gateway = gateway
+        self.max_in_flight = max_in_flight
+        self.poll_interval_seconds = poll_interval_seconds
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="queue-io")
+
+    async def get(self) -> AsyncConsumedMessage:
+        """Await the next message, pausing while the produce queue is over its high-water mark.
+
+        Undecodable deliveries are dead-lettered by ``QueueGateway`` and never returned.
+        """
+        backpressure = self.gateway.backpressure
+        while True:
+            if backpressure is not None and not await self._call(backpressure.has_capacity):
+                await asyncio.sleep(backpressure.policy.check_interval_seconds)
+                continue
+            message = await self._call(self.gateway.pop_message, timeout_seconds=IO_SLICE_SECONDS)
+            if message is not None:
+                return AsyncConsumedMessage(message=message, _queue=self)
+            if not self.gateway.backend.waits_for_deliveries:
+                await asyncio.sleep(self.poll_interval_seconds)
+
+    async def push(self, payload: dict[str, Any], *, lane: "str | AsyncConsumedMessage | None" = None) -> None:
+        """Publish one payload to the produce queue, in ``lane`` unless the payload names its own."""
+        await self._call(self._in_lane, lane, self.gateway.push, payload)
+
+    async def push_many(
+        self,
+        payloads: Iterable[dict[str, Any]],
+        *,
+        lane: "str | AsyncConsumedMessage | None" = None,
+    ) -> int:
+        """Publish payloads in broker-committed batches; see ``QueueGateway.push_many``."""
+        return await self._call(self._in_lane, lane, self.gateway.push_many, list(payloads))
+
+    async def push_dlq(self, payload: dict[str, Any]) -> None:
+        """Publish one payload to the DLQ."""
+        await self._call(self.gateway.push_dlq, payload)
+
+    async def close(self) -> None:
+        """Close the gateway and stop the I/O thread."""
+        try:
+            await self._call(self.gateway.close)
+        finally:
+            self._io.shutdown(wait=False)
+
+    async def _call(self, fn: Callable[..., TResult], *args: Any, **kwargs: Any) -> TResult:
+        """Run one gateway call on the I/O thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._io, functools.partial(fn, *args, **kwargs))
+
+    def _in_lane(self, lane: "str | AsyncConsumedMessage | None", fn: Callable[..., TResult], *args: Any) -> TResult:
+        """Run ``fn`` inside the gateway lane scope; only called on the I/O thread."""
+        with self.gateway.lane_scope(lane.message if isinstance(lane, AsyncConsumedMessage) else lane):
+            return fn(*args)
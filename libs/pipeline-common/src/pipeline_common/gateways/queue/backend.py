@@ -0,0 +1,79 @@
+"""Queue broker backend port.
+
+Layer:
+- Infrastructure port consumed by ``QueueGateway``.
+
+Role:
+- Define the broker operations the stage queue facade needs, independent of
+  the broker client library.
+
+Design intent:
+- Keep AMQP/pika mechanics behind one narrow protocol so an in-process
+  backend can stand in for RabbitMQ in benchmarks, tests and local runs.
+- Follow AMQP vocabulary (delivery tags, requeue, queue arguments) so broker
+  implementations map onto it one to one.
+
+Non-goals:
+- Does not define message schemas or payload encoding.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+
+@dataclass(frozen=True)
+class QueueDelivery:
+    """One raw broker delivery awaiting settlement."""
+
+    delivery_tag: int
+    body: bytes
+    content_type: str | None = None
+    headers: dict[str, Any] = field(default_factory=dict)
+
+
+class QueueBackend(Protocol):
+    """Port for broker operations used by ``QueueGateway``.
+
+    Delivery tags are scoped to one backend instance, like AMQP tags are
+    scoped to one channel.
+    """
+
+    waits_for_deliveries: bool
+    """True when ``get`` blocks on deliveries, so callers need no poll sleep."""
+
+    def declare(self, queue_name: str, arguments: dict[str, Any] | None = None) -> None:
+        """Declare a durable queue once; ``arguments`` carries AMQP ``x-*`` queue arguments."""
+
+    def publish(
+        self,
+        queue_name: str,
+        body: bytes,
+        *,
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+    ) -> None:
+        """Publish one persistent message body to a queue, tagged with ``content_type`` and ``headers``."""
+
+    def publish_batch(self, queue_name: str, bodies: list[bytes], *, content_type: str | None = None) -> None:
+        """Publish bodies so that either all of them are enqueued or none are."""
+
+    def get(self, queue_name: str, timeout_seconds: float) -> QueueDelivery | None:
+        """Return the next delivery, or ``None`` when ``timeout_seconds`` expires.
+
+        A ``timeout_seconds`` of zero checks the queue once without blocking.
+        """
+
+    def ack(self, delivery_tag: int, *, multiple: bool = False) -> None:
+        """Acknowledge one delivery, or every unacked delivery up to it when ``multiple``."""
+
+    def nack(self, delivery_tag: int, *, requeue: bool) -> None:
+        """Reject one delivery, requeueing it or routing it to its dead-letter queue."""
+
+    def queue_depth(self, queue_name: str) -> int:
+        """Return the number of ready (not yet delivered) messages in a queue."""
+
+    def idle(self, seconds: float) -> None:
+        """Wait ``seconds`` while keeping the broker connection serviced (heartbeats)."""
+
+    def close(self) -> None:
+        """Release broker resources held by this backend."""
@@ -0,0 +1,103 @@
+"""Consumer backpressure driven by downstream queue depth.
+
+Layer:
+- Infrastructure helper used by ``QueueGateway``.
+
+Role:
+- Pause consumption while the stage's ``produce`` queue is above a
+  high-water mark and resume once it drains below a low-water mark.
+
+Design intent:
+- Hysteresis between the two marks avoids flapping around one threshold.
+- Depth is sampled at most once per ``check_interval_seconds`` while
+  running, so the passive declare does not add a round trip per message.
+
+Non-goals:
+- Does not limit publishes inside one handler; a message that fans out
+  into many downstream messages is always finished once started.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BackpressurePolicy:
+    """High/low water marks for the downstream ``produce`` queue."""
+
+    high_water_mark: int
+    low_water_mark: int
+    check_interval_seconds: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.low_water_mark < 0 or self.high_water_mark <= self.low_water_mark:
+            raise ValueError("queue backpressure requires 0 <= low_water_mark < high_water_mark")
+        if self.check_interval_seconds <= 0:
+            raise ValueError("queue backpressure check_interval_seconds must be greater than zero")
+
+    @classmethod
+    def from_config(cls, backpressure_config: dict[str, Any] | None) -> "BackpressurePolicy | None":
+        """Build a policy from ``job.queue.backpressure``; ``None`` when no high-water mark is set."""
+        config = backpressure_config or {}
+        if "high_water_mark" not in config:
+            return None
+        high_water_mark = int(config["high_water_mark"])
+        return cls(
+            high_water_mark=high_water_mark,
+            low_water_mark=int(config.get("low_water_mark", high_water_mark // 2)),
+            check_interval_seconds=float(config.get("check_interval_seconds", 1.0)),
+        )
+
+
+class ProduceBackpressure:
+    """Stateful gate applying a ``BackpressurePolicy`` before each consume."""
+
+    def __init__(
+        self,
+        policy: BackpressurePolicy,
+        *,
+        queue_name: str,
+        queue_depth: Callable[[], int],
+        idle: Callable[[float], None],
+    ) -> None:
+        self.policy = policy
+        self._queue_name = queue_name
+        self._queue_depth = queue_depth
+        self._idle = idle
+        self._paused = False
+        self._last_check = float("-inf")
+        self.pause_count = 0
+        self.paused_seconds = 0.0
+
+    def wait_for_capacity(self) -> None:
+        """Block (while servicing broker I/O) until the produce queue has capacity."""
+        paused_at: float | None = None
+        while self._should_pause():
+            if paused_at is None:
+                paused_at = time.monotonic()
+            self._idle(self.policy.check_interval_seconds)
+        if paused_at is not None:
+            self.paused_seconds += time.monotonic() - paused_at
+
+    def has_capacity(self) -> bool:
+        """Apply the policy once without blocking, for callers that wait on their own event loop."""
+        return not self._should_pause()
+
+    def _should_pause(self) -> bool:
+        now = time.monotonic()
+        if not self._paused and now - self._last_check < self.policy.check_interval_seconds:
+            return False
+        self._last_check = now
+        depth = self._queue_depth()
+        if self._paused and depth <= self.policy.low_water_mark:
+            self._paused = False
+            logger.info("Resuming consumption: '%s' depth %s <= low-water mark", self._queue_name, depth)
+        elif not self._paused and depth >= self.policy.high_water_mark:
+            self._paused = True
+            self.pause_count += 1
+            logger.info("Pausing consumption: '%s' depth %s >= high-water mark", self._queue_name, depth)
+        return self._paused
@@ -0,0 +1,119 @@
+"""Wire codecs for stage queue payloads.
+
+Layer:
+- Infrastructure helper used by ``QueueGateway``.
+
+Role:
+- Encode/decode queue payload dicts and tag each message with the AMQP
+  ``content_type`` property, so consumers pick the decoder per message.
+
+Design intent:
+- Compact JSON is the default and always available.
+- ``msgpack`` is an optional binary fast path: it is used only when the
+  package is importable and the job opts in via ``job.queue.codec``.
+- Messages without a content type (published before codecs existed) are
+  decoded as JSON, so producers and consumers can be rolled out in any order.
+
+Non-goals:
+- Does not define payload schemas; codecs see plain dicts.
+"""
+
+import json
+import logging
+from typing import Any, ClassVar, Protocol
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+
+class EnvelopeCodec(Protocol):
+    """Port for payload wire encodings."""
+
+    NAME: ClassVar[str]
+    CONTENT_TYPE: ClassVar[str]
+
+    def encode(self, payload: dict[str, Any]) -> bytes:
+        """Serialize one payload."""
+
+    def decode(self, body: bytes) -> dict[str, Any]:
+        """Deserialize one payload."""
+
+
+class JsonEnvelopeCodec:
+    """Compact UTF-8 JSON codec; also decodes legacy untagged messages."""
+
+    NAME: ClassVar[str] = "json"
+    CONTENT_TYPE: ClassVar[str] = JSON_CONTENT_TYPE
+
+    def __init__(self) -> None:
+        self._encoder = json.JSONEncoder(separators=(",", ":"))
+
+    def encode(self, payload: dict[str, Any]) -> bytes:
+        """Serialize one payload without whitespace or key sorting."""
+        return self._encoder.encode(payload).encode("utf-8")
+
+    def decode(self, body: bytes) -> dict[str, Any]:
+        """Deserialize one JSON payload."""
+        return json.loads(body)
+
+
+class MsgpackEnvelopeCodec:
+    """Binary msgpack codec; requires the optional ``msgpack`` package."""
+
+    NAME: ClassVar[str] = "msgpack"
+    CONTENT_TYPE: ClassVar[str] = MSGPACK_CONTENT_TYPE
+
+    def __init__(self) -> None:
+        if msgpack is None:
+            raise ValueError("msgpack codec requires the 'msgpack' package")
+        self._packer = msgpack.Packer(use_bin_type=True)
+
+    def encode(self, payload: dict[str, Any]) -> bytes:
+        """Serialize one payload."""
+        return self._packer.pack(payload)
+
+    def decode(self, body: bytes) -> dict[str, Any]:
+        """Deserialize one payload."""
+        return msgpack.unpackb(body, raw=False)
+
+
+class EnvelopeCodecRegistry:
+    """Resolve the publish codec by name and decoders by content type."""
+
+    def __init__(self, codec_name: str = JsonEnvelopeCodec.NAME) -> None:
+        self._json = JsonEnvelopeCodec()
+        self._decoders: dict[str, EnvelopeCodec] = {JSON_CONTENT_TYPE: self._json}
+        if msgpack is not None:
+            self._decoders[MSGPACK_CONTENT_TYPE] = MsgpackEnvelopeCodec()
+        self.publish_codec = self._resolve_publish_codec(codec_name)
+
+    def encode(self, payload: dict[str, Any]) -> tuple[bytes, str]:
+        """Encode with the publish codec; return body and its content type."""
+        return self.publish_codec.encode(payload), self.publish_codec.CONTENT_TYPE
+
+    def decode(self, body: bytes, content_type: str | None) -> dict[str, Any]:
+        """Decode by content type; untagged messages are treated as legacy JSON."""
+        if not content_type:
+            return self._json.decode(body)
+        decoder = self._decoders.get(content_type)
+        if decoder is None:
+            raise ValueError(f"Unsupported queue message content type: {content_type}")
+        return decoder.decode(body)
+
+    def _resolve_publish_codec(self, codec_name: str) -> EnvelopeCodec:
+        name = codec_name.lower()
+        if name == JsonEnvelopeCodec.NAME:
+            return self._json
+        if name == MsgpackEnvelopeCodec.NAME:
+            if msgpack is None:
+                logger.warning("job.queue.codec=msgpack but msgpack is not installed; publishing JSON")
+                return self._json
+            return self._decoders[MSGPACK_CONTENT_TYPE]
+        raise ValueError(f"Unsupported queue codec: {codec_name}")
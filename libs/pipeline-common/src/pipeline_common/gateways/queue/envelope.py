@@ -20,6 +20,11 @@ class Envelope:
             out["meta"] = self.meta
         return out
 
+    @property
+    def lane(self) -> str | None:
+        """Priority lane carried in ``meta``, if any."""
+        return (self.meta or {}).get("lane")
+
     @classmethod
     def from_dict(cls, raw: Mapping[str, Any]) -> "Envelope":
         return cls(
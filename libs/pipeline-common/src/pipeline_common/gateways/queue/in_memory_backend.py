@@ -0,0 +1,240 @@
+"""In-process queue backend for broker-free runs.
+
+Layer:
+- Infrastructure adapter implementing ``QueueBackend``.
+
+Role:
+- Stand in for RabbitMQ so workers can be benchmarked and regression-tested
+  on a laptop or in CI without containers.
+
+Design intent:
+- Model the AMQP behaviors workers rely on: FIFO ordering per queue,
+  per-channel delivery tags, ack (single and cumulative), nack with requeue
+  at the head of the queue, dead-letter routing via ``x-dead-letter-*``
+  arguments, per-queue ``x-message-ttl`` and ready-message depth.
+- Share queues between gateways through one ``InMemoryBroker`` while each
+  ``InMemoryQueueBackend`` plays the role of a channel.
+
+Non-goals:
+- Nothing is persisted; messages live as long as the process.
+- No exchanges other than the default direct exchange.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
+from itertools import count
+from typing import Any, ClassVar
+
+from pipeline_common.gateways.queue.backend import QueueDelivery
+
+
+@dataclass
+class _StoredMessage:
+    body: bytes
+    content_type: str | None = None
+    headers: dict[str, Any] = field(default_factory=dict)
+    expires_at: float | None = None
+
+
+@dataclass
+class _InMemoryQueue:
+    arguments: dict[str, Any]
+    ready: deque[_StoredMessage] = field(default_factory=deque)
+
+
+class InMemoryBroker:
+    """Process-local set of named queues shared by ``InMemoryQueueBackend`` channels."""
+
+    _shared: ClassVar[dict[str, "InMemoryBroker"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self) -> None:
+        self._queues: dict[str, _InMemoryQueue] = {}
+        self._condition = threading.Condition()
+
+    @classmethod
+    def shared(cls, name: str = "default") -> "InMemoryBroker":
+        """Return the process-wide broker registered under ``name``."""
+        with cls._shared_lock:
+            if name not in cls._shared:
+                cls._shared[name] = cls()
+            return cls._shared[name]
+
+    def declare(self, queue_name: str, arguments: dict[str, Any] | None = None) -> None:
+        """Create the queue on first declare; later declares keep the original arguments."""
+        with self._condition:
+            self._queue(queue_name, arguments)
+
+    def enqueue(self, queue_name: str, messages: list[_StoredMessage]) -> None:
+        """Append messages to the tail of a queue atomically, stamping queue TTL."""
+        with self._condition:
+            queue = self._queue(queue_name)
+            ttl_ms = queue.arguments.get("x-message-ttl")
+            expires_at = time.monotonic() + float(ttl_ms) / 1000 if ttl_ms is not None else None
+            queue.ready.extend(replace(message, expires_at=expires_at) for message in messages)
+            self._condition.notify_all()
+
+    def requeue(self, queue_name: str, message: _StoredMessage) -> None:
+        """Put a rejected message back at the head of its queue."""
+        with self._condition:
+            self._queue(queue_name).ready.appendleft(message)
+            self._condition.notify_all()
+
+    def dead_letter(self, queue_name: str, message: _StoredMessage) -> None:
+        """Route a rejected or expired message to the queue's dead-letter target, if any."""
+        with self._condition:
+            target = self._dead_letter_target(queue_name)
+            if target is not None:
+                self.enqueue(target, [message])
+
+    def dequeue(self, queue_name: str, timeout_seconds: float) -> _StoredMessage | None:
+        """Pop the head message, waiting up to ``timeout_seconds`` for one to arrive."""
+        deadline = time.monotonic() + timeout_seconds
+        with self._condition:
+            while True:
+                next_expiry = self._expire_all()
+                queue = self._queue(queue_name)
+                if queue.ready:
+                    return queue.ready.popleft()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                if next_expiry is not None:
+                    # Expiring messages may dead-letter into this queue.
+                    remaining = min(remaining, max(next_expiry - time.monotonic(), 0.0))
+                self._condition.wait(timeout=remaining)
+
+    def depth(self, queue_name: str) -> int:
+        """Return the number of ready messages in a queue."""
+        with self._condition:
+            self._expire_all()
+            return len(self._queue(queue_name).ready)
+
+    def _queue(self, queue_name: str, arguments: dict[str, Any] | None = None) -> _InMemoryQueue:
+        if queue_name not in self._queues:
+            self._queues[queue_name] = _InMemoryQueue(arguments=dict(arguments or {}))
+        return self._queues[queue_name]
+
+    def _dead_letter_target(self, queue_name: str) -> str | None:
+        arguments = self._queue(queue_name).arguments
+        if "x-dead-letter-exchange" not in arguments:
+            return None
+        return str(arguments.get("x-dead-letter-routing-key", queue_name))
+
+    def _expire_all(self) -> float | None:
+        """Dead-letter expired head messages in every queue, as RabbitMQ does.
+
+        Returns:
+            The earliest pending expiry, so waiters can wake up for it.
+        """
+        now = time.monotonic()
+        next_expiry: float | None = None
+        for queue_name, queue in list(self._queues.items()):
+            while queue.ready and queue.ready[0].expires_at is not None and queue.ready[0].expires_at <= now:
+                self.dead_letter(queue_name, queue.ready.popleft())
+            if queue.ready and queue.ready[0].expires_at is not None:
+                head_expiry = queue.ready[0].expires_at
+                next_expiry = head_expiry if next_expiry is None else min(next_expiry, head_expiry)
+        return next_expiry
+
+
+class InMemoryQueueBackend:
+    """``QueueBackend`` channel over an ``InMemoryBroker``.
+
+    Layer:
+    - Infrastructure adapter.
+
+    Dependencies:
+    - ``InMemoryBroker`` shared with other backends in the same process.
+
+    Design intent:
+    - Track unacked deliveries per backend so cumulative acks only cover
+      this channel's deliveries; unsettled deliveries are requeued on close.
+
+    Non-goals:
+    - No prefetch limit; ``get`` hands out one delivery per call.
+    """
+
+    waits_for_deliveries = True
+
+    def __init__(self, broker: InMemoryBroker | None = None) -> None:
+        """Initialize instance state; defaults to the process-wide shared broker."""
+        self.broker = broker or InMemoryBroker.shared()
+        self._delivery_tags = count(1)
+        self._unacked: dict[int, tuple[str, _StoredMessage]] = {}
+        self._lock = threading.Lock()
+
+    def declare(self, queue_name: str, arguments: dict[str, Any] | None = None) -> None:
+        """Declare a queue on the shared broker."""
+        self.broker.declare(queue_name, arguments)
+
+    def publish(
+        self,
+        queue_name: str,
+        body: bytes,
+        *,
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+    ) -> None:
+        """Enqueue one message body."""
+        self.broker.enqueue(
+            queue_name,
+            [_StoredMessage(body=body, content_type=content_type, headers=dict(headers or {}))],
+        )
+
+    def publish_batch(self, queue_name: str, bodies: list[bytes], *, content_type: str | None = None) -> None:
+        """Enqueue a batch of message bodies atomically."""
+        self.broker.enqueue(queue_name, [_StoredMessage(body=body, content_type=content_type) for body in bodies])
+
+    def get(self, queue_name: str, timeout_seconds: float) -> QueueDelivery | None:
+        """Deliver the head message of a queue, waiting up to ``timeout_seconds``."""
+        message = self.broker.dequeue(queue_name, timeout_seconds)
+        if message is None:
+            return None
+        with self._lock:
+            delivery_tag = next(self._delivery_tags)
+            self._unacked[delivery_tag] = (queue_name, message)
+        return QueueDelivery(
+            delivery_tag=delivery_tag,
+            body=message.body,
+            content_type=message.content_type,
+            headers=dict(message.headers),
+        )
+
+    def ack(self, delivery_tag: int, *, multiple: bool = False) -> None:
+        """Forget one delivery, or every unacked delivery up to it when ``multiple``."""
+        with self._lock:
+            tags = [tag for tag in self._unacked if tag <= delivery_tag] if multiple else [delivery_tag]
+            for tag in tags:
+                if self._unacked.pop(tag, None) is None:
+                    raise ValueError(f"unknown delivery tag {tag}")
+
+    def nack(self, delivery_tag: int, *, requeue: bool) -> None:
+        """Requeue one delivery at the head of its queue, or dead-letter it."""
+        with self._lock:
+            delivery = self._unacked.pop(delivery_tag, None)
+        if delivery is None:
+            raise ValueError(f"unknown delivery tag {delivery_tag}")
+        queue_name, message = delivery
+        if requeue:
+            self.broker.requeue(queue_name, replace(message, expires_at=None))
+        else:
+            self.broker.dead_letter(queue_name, message)
+
+    def queue_depth(self, queue_name: str) -> int:
+        """Return the number of ready messages in a queue."""
+        return self.broker.depth(queue_name)
+
+    def idle(self, seconds: float) -> None:
+        """Sleep; there is no connection to service."""
+        time.sleep(seconds)
+
+    def close(self) -> None:
+        """Requeue unsettled deliveries, as a broker does when a channel closes."""
+        with self._lock:
+            unacked = sorted(self._unacked.items(), reverse=True)
+            self._unacked.clear()
+        for _tag, (queue_name, message) in unacked:
+            self.broker.requeue(queue_name, replace(message, expires_at=None))
@@ -0,0 +1,100 @@
+"""Priority lanes for stage queues.
+
+Layer:
+- Infrastructure helper used by ``QueueGateway``.
+
+Role:
+- Map one logical stage queue onto one physical queue per lane and decide
+  which lane a consumer serves next.
+
+Design intent:
+- Weighted multi-queue consumption instead of RabbitMQ priority queues:
+  it needs no queue redeclaration (existing queues keep their arguments),
+  keeps per-lane depth observable, and never starves a lane.
+- The default lane keeps the unsuffixed queue name, so enabling lanes does
+  not strand messages already queued under the legacy name.
+- Lane order follows smooth weighted round-robin: with weights 8:1 and both
+  lanes backlogged, eight of nine pops serve the heavier lane, spread evenly.
+
+Non-goals:
+- Does not preempt a message that is already being processed.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+LANE_META_KEY = "lane"
+
+
+@dataclass(frozen=True)
+class QueueLanes:
+    """Configured lanes, their consumption weights and the default lane."""
+
+    weights: dict[str, int]
+    default_lane: str
+
+    def __post_init__(self) -> None:
+        if not self.weights:
+            raise ValueError("queue lanes must define at least one lane")
+        if any(weight <= 0 for weight in self.weights.values()):
+            raise ValueError("queue lane weights must be greater than zero")
+        if self.default_lane not in self.weights:
+            raise ValueError(f"queue default_lane '{self.default_lane}' is not a configured lane")
+
+    @classmethod
+    def from_config(cls, queue_config: dict[str, Any]) -> "QueueLanes | None":
+        """Build lanes from ``job.queue.lanes.<lane>.weight`` and ``job.queue.default_lane``."""
+        lanes_config = queue_config.get("lanes")
+        if not lanes_config:
+            return None
+        if not isinstance(lanes_config, dict):
+            raise ValueError("job.queue.lanes must be a dictionary.")
+        weights = {
+            str(lane): int((lane_config or {}).get("weight", 1)) if isinstance(lane_config, dict) else 1
+            for lane, lane_config in lanes_config.items()
+        }
+        default_lane = str(queue_config.get("default_lane", min(weights, key=weights.__getitem__)))
+        return cls(weights=weights, default_lane=default_lane)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Configured lane names."""
+        return tuple(self.weights)
+
+    def resolve(self, lane: str | None) -> str:
+        """Return ``lane`` if configured, otherwise the default lane."""
+        if lane in self.weights:
+            return lane
+        return self.default_lane
+
+    def queue_name(self, base_queue: str, lane: str | None) -> str:
+        """Physical queue for ``lane``; the default lane keeps the base queue name."""
+        resolved = self.resolve(lane)
+        if resolved == self.default_lane:
+            return base_queue
+        return f"{base_queue}.{resolved}"
+
+    def queue_names(self, base_queue: str) -> dict[str, str]:
+        """Physical queue per lane for one base queue."""
+        return {lane: self.queue_name(base_queue, lane) for lane in self.weights}
+
+
+@dataclass
+class WeightedLaneScheduler:
+    """Smooth weighted round-robin over lanes."""
+
+    lanes: QueueLanes
+    _current: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def next_order(self) -> list[str]:
+        """Return lanes in the order to try for the next pop: the scheduled lane first."""
+        total = sum(self.lanes.weights.values())
+        for lane, weight in self.lanes.weights.items():
+            self._current[lane] = self._current.get(lane, 0) + weight
+        chosen = max(self.lanes.weights, key=lambda lane: self._current[lane])
+        self._current[chosen] -= total
+        fallback = sorted(
+            (lane for lane in self.lanes.weights if lane != chosen),
+            key=lambda lane: -self.lanes.weights[lane],
+        )
+        return [chosen, *fallback]
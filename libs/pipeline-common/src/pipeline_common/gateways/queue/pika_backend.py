@@ -0,0 +1,489 @@
+"""RabbitMQ queue backend built on pika.
+
+Layer:
+- Infrastructure adapter implementing ``QueueBackend``.
+
+Role:
+- Own the AMQP connection, channels, consume subscription and reconnect
+  policy used by ``QueueGateway`` in deployed workers.
+
+Design intent:
+- Keep every pika call in this module so ``QueueGateway`` stays broker-agnostic.
+- Keep AMQP heartbeats flowing while a long handler runs: a pump thread
+  services the connection whenever the worker thread is not using it.
+  ``BlockingConnection`` is not thread-safe, so every connection access is
+  serialized through one lock.
+
+Non-goals:
+- Does not provide exactly-once guarantees.
+"""
+
+import functools
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, TypeVar
+
+import pika
+from pika.exceptions import AMQPError
+
+from pipeline_common.gateways.queue.backend import QueueDelivery
+
+logger = logging.getLogger(__name__)
+
+TResult = TypeVar("TResult")
+
+
+def _serialized(method: Callable[..., TResult]) -> Callable[..., TResult]:
+    """Run a backend operation under the connection lock and record worker activity."""
+
+    @functools.wraps(method)
+    def wrapper(self: "PikaQueueBackend", *args: Any, **kwargs: Any) -> TResult:
+        with self._io_lock:
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._mark_activity()
+
+    return wrapper
+
+
+@dataclass
+class HeartbeatStats:
+    """What the heartbeat pump kept alive while the worker was busy in a handler.
+
+    A handler gap longer than the heartbeat timeout would have let the broker
+    drop the connection and redeliver every unacked message, so each counted
+    gap is a prevented redelivery of ``unacked_deliveries_protected`` messages.
+    """
+
+    handler_gaps_protected: int = 0
+    unacked_deliveries_protected: int = 0
+    longest_gap_seconds: float = 0.0
+
+
+class QueueDeliveryMode(str, Enum):
+    """How the gateway receives messages from the consume queue.
+
+    ``POLL`` issues one ``basic_get`` per attempt; ``PUSH`` registers a
+    ``basic_consume`` subscription per consumed queue and lets the broker
+    push up to ``prefetch_count`` unacked deliveries per subscription to the
+    worker as they arrive.
+    """
+
+    POLL = "poll"
+    PUSH = "push"
+
+
+class PikaQueueBackend:
+    """``QueueBackend`` over a pika ``BlockingConnection``.
+
+    Layer:
+    - Infrastructure adapter.
+
+    Dependencies:
+    - pika/AMQP broker.
+
+    Design intent:
+    - Reconnect once and retry on AMQP failures, matching the historical
+      ``QueueGateway`` behavior.
+
+    Non-goals:
+    - Does not abstract broker topology beyond direct queue names.
+    """
+
+    def __init__(
+        self,
+        broker_url: str,
+        *,
+        delivery_mode: QueueDeliveryMode = QueueDeliveryMode.POLL,
+        prefetch_count: int = 1,
+        heartbeat_seconds: int | None = None,
+    ) -> None:
+        """Initialize instance state, open the broker connection and start the heartbeat pump."""
+        if prefetch_count <= 0:
+            raise ValueError("queue prefetch_count must be greater than zero")
+        self._broker_url = broker_url
+        self.delivery_mode = delivery_mode
+        self.prefetch_count = prefetch_count
+        self.heartbeat_seconds = heartbeat_seconds
+        self.heartbeat_stats = HeartbeatStats()
+        self.waits_for_deliveries = delivery_mode is QueueDeliveryMode.PUSH
+        self._connection = None
+        self._channel = None
+        self._publish_channel = None
+        self._declared_queues: dict[str, dict[str, Any] | None] = {}
+        self._active_queues: set[str] = set()
+        self._consumer_tags: dict[str, str] = {}
+        self._pushed_deliveries: dict[str, deque[QueueDelivery]] = {}
+        self._unacked_tags: set[int] = set()
+        self._io_lock = threading.RLock()
+        self._last_activity = time.monotonic()
+        self._gap_counted = False
+        self._pump_stop = threading.Event()
+        self._pump_thread: threading.Thread | None = None
+        self._connect()
+        if heartbeat_seconds:
+            self._start_heartbeat_pump()
+
+    @classmethod
+    def from_queue_config(
+        cls,
+        broker_url: str,
+        queue_config: dict[str, Any],
+        *,
+        heartbeat_seconds: int | None = None,
+    ) -> "PikaQueueBackend":
+        """Build a backend from ``job.queue`` delivery settings."""
+        return cls(
+            broker_url,
+            delivery_mode=QueueDeliveryMode(
+                str(queue_config.get("delivery_mode", QueueDeliveryMode.POLL.value)).lower()
+            ),
+            prefetch_count=int(queue_config.get("prefetch_count", 1)),
+            heartbeat_seconds=heartbeat_seconds,
+        )
+
+    @_serialized
+    def declare(self, queue_name: str, arguments: dict[str, Any] | None = None) -> None:
+        """Declare a durable queue once per connection."""
+        self._declared_queues.setdefault(queue_name, arguments)
+        self._retry_operation(lambda: self._declare_once(queue_name), op_name=f"declare:{queue_name}")
+
+    @_serialized
+    def publish(
+        self,
+        queue_name: str,
+        body: bytes,
+        *,
+        content_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+    ) -> None:
+        """Publish one persistent message on the current channel."""
+        self._retry_operation(
+            lambda: self._publish_once(queue_name=queue_name, body=body, content_type=content_type, headers=headers),
+            op_name=f"publish:{queue_name}",
+        )
+
+    @_serialized
+    def publish_batch(self, queue_name: str, bodies: list[bytes], *, content_type: str | None = None) -> None:
+        """Publish one batch; an uncommitted batch is discarded by the broker and retried whole."""
+        self._retry_operation(
+            lambda: self._publish_batch_once(queue_name=queue_name, bodies=bodies, content_type=content_type),
+            op_name=f"publish_batch:{queue_name}:{len(bodies)}",
+        )
+
+    @_serialized
+    def get(self, queue_name: str, timeout_seconds: float) -> QueueDelivery | None:
+        """Return the next delivery according to the configured delivery mode."""
+        if self.delivery_mode is QueueDeliveryMode.PUSH:
+            delivery = self._get_pushed(queue_name, timeout_seconds=timeout_seconds)
+        else:
+            delivery = self._get_polled(queue_name, timeout_seconds=timeout_seconds)
+        if delivery is not None:
+            self._unacked_tags.add(delivery.delivery_tag)
+        return delivery
+
+    @_serialized
+    def ack(self, delivery_tag: int, *, multiple: bool = False) -> None:
+        """Acknowledge one consumed message, or every unacked tag up to it when ``multiple``."""
+        self._retry_operation(
+            lambda: self._ack_once(delivery_tag, multiple=multiple),
+            op_name=f"ack:{delivery_tag}:multiple={multiple}",
+        )
+        if multiple:
+            self._unacked_tags = {tag for tag in self._unacked_tags if tag > delivery_tag}
+        else:
+            self._unacked_tags.discard(delivery_tag)
+
+    @_serialized
+    def nack(self, delivery_tag: int, *, requeue: bool) -> None:
+        """Negative-ack one consumed message."""
+        self._retry_operation(
+            lambda: self._nack_once(delivery_tag, requeue=requeue),
+            op_name=f"nack:{delivery_tag}:requeue={requeue}",
+        )
+        self._unacked_tags.discard(delivery_tag)
+
+    @_serialized
+    def queue_depth(self, queue_name: str) -> int:
+        """Return ready message count via a passive declare."""
+        depth = 0
+
+        def _passive_declare() -> None:
+            nonlocal depth
+            self._ensure_channel()
+            frame = self._channel.queue_declare(queue=queue_name, passive=True)
+            depth = int(frame.method.message_count)
+
+        self._retry_operation(_passive_declare, op_name=f"queue_depth:{queue_name}")
+        return depth
+
+    @_serialized
+    def idle(self, seconds: float) -> None:
+        """Sleep on the connection so heartbeats and pushed deliveries keep being processed."""
+        try:
+            self._ensure_channel()
+            self._connection.sleep(seconds)
+        except (AMQPError, OSError, RuntimeError):
+            logger.exception("Queue idle failed; reconnecting")
+            self._reconnect()
+
+    def close(self) -> None:
+        """Stop the heartbeat pump and close open channel/connection handles safely."""
+        self._pump_stop.set()
+        if self._pump_thread is not None:
+            self._pump_thread.join(timeout=5)
+        if self.heartbeat_seconds:
+            logger.info("Queue heartbeat pump stats: %s", self.heartbeat_stats)
+        with self._io_lock:
+            self._close()
+
+    def _start_heartbeat_pump(self) -> None:
+        """Start the daemon thread that services the connection during long handlers."""
+        self._pump_thread = threading.Thread(
+            target=self._pump_heartbeats,
+            name="queue-heartbeat-pump",
+            daemon=True,
+        )
+        self._pump_thread.start()
+
+    def _pump_heartbeats(self) -> None:
+        """Service connection I/O whenever the worker thread is not using the connection."""
+        interval = max(self.heartbeat_seconds / 4, 0.5)
+        while not self._pump_stop.wait(interval):
+            if not self._io_lock.acquire(blocking=False):
+                continue
+            try:
+                if self._connection is None or self._connection.is_closed:
+                    continue
+                self._record_handler_gap()
+                self._connection.process_data_events(time_limit=0)
+            except (AMQPError, OSError, RuntimeError):
+                # The worker thread reconnects on its next operation.
+                logger.exception("Queue heartbeat pump failed to service the connection")
+            finally:
+                self._io_lock.release()
+
+    def _record_handler_gap(self) -> None:
+        """Count a worker gap that outlived the heartbeat timeout while deliveries were unacked."""
+        gap = time.monotonic() - self._last_activity
+        stats = self.heartbeat_stats
+        stats.longest_gap_seconds = max(stats.longest_gap_seconds, gap)
+        if self._gap_counted or gap <= self.heartbeat_seconds or not self._unacked_tags:
+            return
+        self._gap_counted = True
+        stats.handler_gaps_protected += 1
+        stats.unacked_deliveries_protected += len(self._unacked_tags)
+        logger.info(
+            "Kept queue connection alive through a %.0fs handler; avoided redelivery of %s message(s)",
+            gap,
+            len(self._unacked_tags),
+        )
+
+    def _mark_activity(self) -> None:
+        """Record that the worker thread just used the connection."""
+        self._last_activity = time.monotonic()
+        self._gap_counted = False
+
+    def _get_polled(self, queue_name: str, *, timeout_seconds: float) -> QueueDelivery | None:
+        """Poll the queue with ``basic_get`` until a message arrives or the timeout expires.
+
+        The queue is always checked at least once, so a zero timeout is a
+        single non-blocking poll.
+        """
+        deadline = time.monotonic() + timeout_seconds
+        while True:
+            try:
+                self._ensure_channel()
+                self._declare_once(queue_name)
+                method, properties, body = self._channel.basic_get(queue=queue_name, auto_ack=False)
+                if method and body:
+                    return self._delivery(method, properties, body)
+            except (AMQPError, OSError, RuntimeError):
+                logger.exception("Queue consume failed; reconnecting and retrying")
+                self._reconnect()
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(0.1)
+
+    def _get_pushed(self, queue_name: str, *, timeout_seconds: float) -> QueueDelivery | None:
+        """Wait on broker-pushed deliveries until one is buffered or the timeout expires.
+
+        Connection events are processed at least once, so a zero timeout still
+        picks up deliveries the broker has already sent.
+        """
+        deadline = time.monotonic() + timeout_seconds
+        while True:
+            buffered = self._pushed_deliveries.get(queue_name)
+            if buffered:
+                return buffered.popleft()
+            remaining = deadline - time.monotonic()
+            try:
+                self._ensure_consumer(queue_name)
+                self._connection.process_data_events(time_limit=max(remaining, 0))
+            except (AMQPError, OSError, RuntimeError):
+                logger.exception("Queue consumer failed; reconnecting and resubscribing")
+                self._reconnect()
+                time.sleep(0.1)
+            if remaining <= 0:
+                buffered = self._pushed_deliveries.get(queue_name)
+                return buffered.popleft() if buffered else None
+
+    def _ensure_consumer(self, queue_name: str) -> None:
+        """Register the ``basic_consume`` subscription for ``queue_name`` on the current channel once."""
+        self._ensure_channel()
+        if queue_name in self._consumer_tags:
+            return
+        self._declare_once(queue_name)
+        if not self._consumer_tags:
+            self._channel.basic_qos(prefetch_count=self.prefetch_count)
+        self._pushed_deliveries.setdefault(queue_name, deque())
+        self._consumer_tags[queue_name] = self._channel.basic_consume(
+            queue=queue_name,
+            on_message_callback=functools.partial(self._on_pushed_delivery, queue_name),
+            auto_ack=False,
+        )
+
+    def _on_pushed_delivery(
+        self,
+        queue_name: str,
+        _channel: Any,
+        method: Any,
+        properties: Any,
+        body: bytes,
+    ) -> None:
+        """Buffer one broker-pushed delivery until ``_get_pushed`` hands it out."""
+        self._pushed_deliveries[queue_name].append(self._delivery(method, properties, body))
+
+    @staticmethod
+    def _delivery(method: Any, properties: Any, body: bytes) -> QueueDelivery:
+        """Convert pika delivery frames into a backend-neutral delivery."""
+        return QueueDelivery(
+            delivery_tag=int(method.delivery_tag),
+            body=body,
+            content_type=properties.content_type,
+            headers=dict(properties.headers or {}),
+        )
+
+    def _ack_once(self, delivery_tag: int, *, multiple: bool = False) -> None:
+        """Ack one delivery tag (or all up to it) on the current channel."""
+        self._ensure_channel()
+        self._channel.basic_ack(delivery_tag, multiple=multiple)
+
+    def _nack_once(self, delivery_tag: int, *, requeue: bool) -> None:
+        """Nack one delivery tag on the current channel."""
+        self._ensure_channel()
+        self._channel.basic_nack(delivery_tag, requeue=requeue)
+
+    def _publish_once(
+        self,
+        queue_name: str,
+        body: bytes,
+        content_type: str | None,
+        headers: dict[str, Any] | None = None,
+    ) -> None:
+        """Publish payload body to one queue using the current channel."""
+        self._ensure_channel()
+        self._declare_once(queue_name)
+        self._channel.basic_publish(
+            exchange="",
+            routing_key=queue_name,
+            body=body,
+            properties=pika.BasicProperties(content_type=content_type, headers=headers, delivery_mode=2),
+        )
+
+    def _publish_batch_once(self, queue_name: str, bodies: list[bytes], content_type: str | None) -> None:
+        """Pipeline one batch on the transactional publish channel and commit it."""
+        self._ensure_channel()
+        self._declare_once(queue_name)
+        publish_channel = self._ensure_publish_channel()
+        properties = pika.BasicProperties(content_type=content_type, delivery_mode=2)
+        for body in bodies:
+            publish_channel.basic_publish(
+                exchange="",
+                routing_key=queue_name,
+                body=body,
+                properties=properties,
+            )
+        publish_channel.tx_commit()
+
+    def _ensure_publish_channel(self) -> Any:
+        """Open the transactional channel used for batched publishes on first use."""
+        if self._publish_channel is None or self._publish_channel.is_closed:
+            self._publish_channel = self._connection.channel()
+            self._publish_channel.tx_select()
+        return self._publish_channel
+
+    def _declare_once(self, queue_name: str) -> None:
+        """Declare a durable queue once per connection, with its registered arguments."""
+        if queue_name in self._active_queues:
+            return
+        self._ensure_channel()
+        self._channel.queue_declare(
+            queue=queue_name,
+            durable=True,
+            arguments=self._declared_queues.get(queue_name),
+        )
+        self._active_queues.add(queue_name)
+
+    def _retry_operation(self, fn: Callable[[], None], op_name: str) -> None:
+        """Run operation once, reconnect on AMQP failure, then retry once."""
+        try:
+            fn()
+            return
+        except (AMQPError, OSError, RuntimeError):
+            logger.exception("Queue %s failed; reconnecting and retrying", op_name)
+        self._reconnect()
+        fn()
+
+    def _connect(self) -> None:
+        """Open broker connection and channel."""
+        parameters = pika.URLParameters(self._broker_url)
+        if self.heartbeat_seconds:
+            parameters.heartbeat = self.heartbeat_seconds
+        self._connection = pika.BlockingConnection(parameters)
+        self._channel = self._connection.channel()
+
+    def _close(self) -> None:
+        """Close open channel/connection handles safely."""
+        if self._publish_channel is not None:
+            try:
+                self._publish_channel.close()
+            except Exception:
+                pass
+        if self._channel is not None:
+            try:
+                self._channel.close()
+            except Exception:
+                pass
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                pass
+        self._channel = None
+        self._publish_channel = None
+        self._connection = None
+        self._active_queues.clear()
+        # Unacked deliveries are redelivered by the broker once the channel closes,
+        # so buffered tags from the old channel must never be settled.
+        self._consumer_tags.clear()
+        self._pushed_deliveries.clear()
+        self._unacked_tags.clear()
+
+    def _reconnect(self) -> None:
+        """Recreate AMQP connection and channel."""
+        self._close()
+        self._connect()
+
+    def _ensure_channel(self) -> None:
+        """Ensure there is an open AMQP channel."""
+        if self._channel is None or self._connection is None:
+            self._connect()
+            return
+        if self._connection.is_closed or self._channel.is_closed:
+            self._reconnect()
@@ -7,21 +7,29 @@ Role:
 - Wrap queue publish/consume operations for stage-based worker pipelines.
 
 Design intent:
-- Keep AMQP client mechanics isolated from worker services.
+- Keep broker client mechanics isolated from worker services behind a
+  ``QueueBackend`` implementation.
 
 Non-goals:
 - This module does not define business-level message schemas.
 """
 
-import json
-
+import base64
 import logging
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Callable
+from typing import Any, Iterable, Iterator
+
+from pipeline_common.gateways.queue.backend import QueueBackend, QueueDelivery
+from pipeline_common.gateways.queue.backpressure import BackpressurePolicy, ProduceBackpressure
+from pipeline_common.gateways.queue.codec import EnvelopeCodecRegistry
+from pipeline_common.gateways.queue.envelope import Envelope
+from pipeline_common.gateways.queue.lanes import LANE_META_KEY, QueueLanes, WeightedLaneScheduler
+from pipeline_common.gateways.queue.retry import RETRY_ATTEMPT_HEADER, RetryPolicy
+from pipeline_common.helpers.contracts import utc_now_iso
 
-import pika
-from pika.exceptions import AMQPError
+LANE_IDLE_SECONDS = 0.1
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +41,16 @@ class ConsumedMessage:
     payload: dict[str, Any]
     delivery_tag: int
     _queue: "QueueGateway" = field(repr=False)
+    headers: dict[str, Any] = field(default_factory=dict)
+    queue_name: str = ""
+    lane: str | None = None
     _settled: bool = field(default=False, init=False, repr=False)
 
+    @property
+    def attempt(self) -> int:
+        """1-based processing attempt of this delivery under the retry policy."""
+        return int(self.headers.get(RETRY_ATTEMPT_HEADER, 0)) + 1
+
     def ack(self) -> None:
         """Acknowledge the message once."""
         if self._settled:
@@ -49,6 +65,62 @@ class ConsumedMessage:
         self._queue._nack(self.delivery_tag, requeue=requeue)
         self._settled = True
 
+    def retry(self, *, error: str, dlq_payload: dict[str, Any] | None = None) -> None:
+        """Settle a failed message: park it in the next delay queue, or dead-letter it when exhausted.
+
+        Args:
+            error: Failure description recorded in the default DLQ payload.
+            dlq_payload: Payload published to ``dlq`` once attempts are exhausted;
+                defaults to an envelope carrying the original payload and error.
+        """
+        if self._settled:
+            return
+        self._queue._retry(self, error=error, dlq_payload=dlq_payload)
+        self._settled = True
+
+
+@dataclass
+class ConsumedBatch:
+    """Messages popped together and settled with as few broker calls as possible.
+
+    Successful messages are acked through ``QueueGateway._ack_many``: one
+    cumulative ``multiple=True`` ack when the gateway consumes a single queue
+    (deliveries are handed out in tag order and the caller settles one batch
+    before popping the next), one ack per message with lanes, whose
+    consumers interleave tags.
+    """
+
+    messages: list[ConsumedMessage]
+    _queue: "QueueGateway" = field(repr=False)
+
+    def __iter__(self) -> Iterator[ConsumedMessage]:
+        return iter(self.messages)
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def ack_all(self) -> None:
+        """Acknowledge every unsettled message of the batch."""
+        self.settle(failed=())
+
+    def settle(self, failed: Iterable[ConsumedMessage], *, requeue: bool = True) -> None:
+        """Nack ``failed`` messages individually, then ack the rest in as few calls as is safe.
+
+        Args:
+            failed: Messages of this batch whose processing failed.
+            requeue: Whether failed messages go back to the consume queue.
+        """
+        failed_tags = {message.delivery_tag for message in failed}
+        for message in self.messages:
+            if message.delivery_tag in failed_tags:
+                message.nack(requeue=requeue)
+        succeeded = [message for message in self.messages if not message._settled]
+        if not succeeded:
+            return
+        self._queue._ack_many([message.delivery_tag for message in succeeded])
+        for message in succeeded:
+            message._settled = True
+
 
 class QueueGateway:
     """Runtime facade for stage queue interactions.
@@ -57,7 +129,7 @@ class QueueGateway:
     - Infrastructure adapter facade.
 
     Dependencies:
-    - pika/AMQP broker.
+    - A ``QueueBackend`` implementation (RabbitMQ via pika, or in-memory).
     - Runtime queue configuration parsed from job properties.
 
     Design intent:
@@ -65,48 +137,125 @@ class QueueGateway:
 
     Non-goals:
     - Does not provide exactly-once guarantees.
-    - Does not abstract broker topology beyond direct queue names.
+    - Does not abstract broker topology beyond direct queue names and
+      their per-lane siblings (see ``QueueLanes``).
     """
     timeout_seconds: int
+    publish_batch_size: int
+    batch_size: int
+    batch_max_wait_seconds: float
+    codecs: EnvelopeCodecRegistry
+    retry_policy: RetryPolicy
+    backpressure: ProduceBackpressure | None
+    lanes: QueueLanes | None
 
     def __init__(
         self,
-        broker_url: str,
+        backend: QueueBackend,
         queue_config: dict[str, Any],
     ) -> None:
         """Initialize instance state and dependencies."""
-        self._broker_url = broker_url
-        self._enabled = pika is not None
-        self._connection = None
-        self._channel = None
-        if self._enabled:
-            self._connect()
+        self.backend = backend
         self._initialize_stage_contract(queue_config=queue_config)
+        self._declare_stage_queues()
+
+    @property
+    def lane_names(self) -> tuple[str, ...]:
+        """Configured priority lanes; empty when ``job.queue.lanes`` is not set."""
+        return self.lanes.names if self.lanes is not None else ()
+
+    @contextmanager
+    def lane_scope(self, lane: "str | ConsumedMessage | None") -> Iterator[None]:
+        """Route pushes inside the block to ``lane`` unless a payload names its own lane.
+
+        Workers wrap the handling of one consumed message in
+        ``lane_scope(message)`` so everything it produces stays in its lane.
+        """
+        previous = self._outbound_lane
+        self._outbound_lane = lane.lane if isinstance(lane, ConsumedMessage) else lane
+        try:
+            yield
+        finally:
+            self._outbound_lane = previous
 
     def push(self, payload: dict[str, Any]) -> None:
         """Execute push."""
-        self._publish(self.produce, payload)
+        self._publish(*self._route_produce(payload))
+
+    def push_many(self, payloads: Iterable[dict[str, Any]], *, batch_size: int | None = None) -> int:
+        """Publish payloads to the produce queue in broker-committed batches.
+
+        Each batch is handed to the backend as one unit (a single ``tx_commit``
+        round-trip on RabbitMQ), so cost scales with the number of batches
+        instead of the number of payloads.
+
+        Returns:
+            Number of payloads published.
+        """
+        if not self.produce:
+            return 0
+        return self._publish_many(
+            (self._route_produce(payload) for payload in payloads),
+            batch_size=batch_size or self.publish_batch_size,
+        )
 
     def push_dlq(self, payload: dict[str, Any]) -> None:
         """Execute push dlq."""
         self._publish(self.dlq, payload)
 
-    def pop_message(self, timeout_seconds: int | None = None) -> ConsumedMessage | None:
+    def pop_message(self, timeout_seconds: float | None = None) -> ConsumedMessage | None:
         """Execute pop message with explicit ack/nack control."""
         consume_timeout = self.timeout_seconds if timeout_seconds is None else timeout_seconds
-        consumed = self._consume(self.consume, timeout_seconds=consume_timeout)
-        if consumed is None:
-            return None
-        consumed.payload = self.consume_contract(**consumed.payload)
-        return consumed
+        return self._consume(self.consume, timeout_seconds=consume_timeout)
+
+    def pop_batch(self, max_messages: int | None = None, max_wait: float | None = None) -> ConsumedBatch:
+        """Pop up to ``max_messages`` messages, waiting at most ``max_wait`` seconds in total.
+
+        With RabbitMQ push delivery the batch can only fill up to
+        ``prefetch_count`` deliveries, so configure ``prefetch_count >= batch_size``.
+        """
+        limit = self.batch_size if max_messages is None else max_messages
+        wait = self.batch_max_wait_seconds if max_wait is None else max_wait
+        deadline = time.monotonic() + wait
+        messages: list[ConsumedMessage] = []
+        while len(messages) < limit:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            consumed = self._consume(self.consume, timeout_seconds=remaining)
+            if consumed is None:
+                break
+            messages.append(consumed)
+        return ConsumedBatch(messages=messages, _queue=self)
+
+    def wait_for_batch(self, *, poll_interval_seconds: int) -> ConsumedBatch:
+        """Block until a non-empty batch is available, honoring the delivery mode like ``wait_for_message``."""
+        while True:
+            self._wait_for_produce_capacity()
+            batch = self.pop_batch()
+            if batch.messages:
+                return batch
+            if not self.backend.waits_for_deliveries:
+                self.backend.idle(poll_interval_seconds)
 
     def wait_for_message(self, *, poll_interval_seconds: int) -> ConsumedMessage:
-        """Poll until one consumed message is available."""
+        """Block until one consumed message is available.
+
+        Polling backends sleep ``poll_interval_seconds`` between empty polls.
+        Backends that wait on deliveries (RabbitMQ push mode, in-memory)
+        already block in ``pop_message``, so the loop re-enters immediately
+        and a message is handed over as soon as it arrives.
+
+        With ``job.queue.backpressure`` configured, consumption pauses while
+        the ``produce`` queue is above its high-water mark.
+        """
         while True:
+            self._wait_for_produce_capacity()
             message = self.pop_message()
             if message is not None:
                 return message
-            time.sleep(poll_interval_seconds)
+            if not self.backend.waits_for_deliveries:
+                self.backend.idle(poll_interval_seconds)
 
     def push_produce_message(self, **payload: Any) -> None:
         """Execute push produce message."""
@@ -116,122 +265,219 @@ class QueueGateway:
         """Execute push dlq message."""
         self.push_dlq(self.dlq_contract(**payload))
 
+    def queue_depth(self, queue_name: str | None = None) -> int:
+        """Return ready message count for ``queue_name`` (defaults to the consume queue, all lanes)."""
+        if queue_name:
+            return self.backend.queue_depth(queue_name)
+        return self._lanes_depth(self.consume)
+
+    def close(self) -> None:
+        """Release backend resources."""
+        self.backend.close()
+
     def _publish(self, queue_name: str, payload: dict[str, Any]) -> None:
         """Internal helper for publish."""
         if not queue_name:
             return
-        if not self._enabled:
-            return
-        body = json.dumps(payload, sort_keys=True)
-        self._retry_operation(
-            lambda: self._publish_once(queue_name=queue_name, body=body),
-            op_name=f"publish:{queue_name}",
-        )
-
-    def _consume(self, queue_name: str, timeout_seconds: int) -> ConsumedMessage | None:
-        """Internal helper for consume."""
+        body, content_type = self.codecs.encode(payload)
+        self.backend.publish(queue_name, body, content_type=content_type)
+
+    def _publish_many(self, routed: Iterable[tuple[str, dict[str, Any]]], *, batch_size: int) -> int:
+        """Publish ``(queue_name, payload)`` pairs in per-queue batches of ``batch_size`` committed together."""
+        codec = self.codecs.publish_codec
+        published = 0
+        batches: dict[str, list[bytes]] = {}
+        for queue_name, payload in routed:
+            batch = batches.setdefault(queue_name, [])
+            batch.append(codec.encode(payload))
+            if len(batch) >= batch_size:
+                self.backend.publish_batch(queue_name, batch, content_type=codec.CONTENT_TYPE)
+                published += len(batch)
+                batches[queue_name] = []
+        for queue_name, batch in batches.items():
+            if batch:
+                self.backend.publish_batch(queue_name, batch, content_type=codec.CONTENT_TYPE)
+                published += len(batch)
+        return published
+
+    def _route_produce(self, payload: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        """Resolve the produce lane queue for ``payload`` and stamp its lane into ``Envelope.meta``."""
+        if self.lanes is None or not self.produce:
+            return self.produce, payload
+        requested = _payload_lane(payload) or self._outbound_lane
+        lane = self.lanes.resolve(requested)
+        if "payload" in payload and _payload_lane(payload) != lane:
+            payload = {**payload, "meta": {**(payload.get("meta") or {}), LANE_META_KEY: lane}}
+        return self.lanes.queue_name(self.produce, lane), payload
+
+    def _consume(self, queue_name: str, timeout_seconds: float) -> ConsumedMessage | None:
+        """Internal helper for consume; skips deliveries dead-lettered as undecodable."""
         if not queue_name:
             return None
-        if not self._enabled:
-            return None
+        if self._lane_scheduler is not None and queue_name == self.consume:
+            return self._consume_lanes(timeout_seconds)
         deadline = time.monotonic() + timeout_seconds
-        while time.monotonic() < deadline:
-            try:
-                self._ensure_channel()
-                self._channel.queue_declare(queue=queue_name, durable=True)
-                method, _, body = self._channel.basic_get(queue=queue_name, auto_ack=False)
-                if method and body:
-                    return ConsumedMessage(
-                        payload=json.loads(body),
-                        delivery_tag=int(method.delivery_tag),
-                        _queue=self,
-                    )
-            except (AMQPError, OSError, RuntimeError):
-                logger.exception("Queue consume failed; reconnecting and retrying")
-                self._reconnect()
-            time.sleep(0.1)
-        return None
-
-    def _ack(self, delivery_tag: int) -> None:
-        """Acknowledge one consumed message."""
-        self._retry_operation(
-            lambda: self._ack_once(delivery_tag),
-            op_name=f"ack:{delivery_tag}",
+        while True:
+            delivery = self.backend.get(queue_name, max(deadline - time.monotonic(), 0))
+            if delivery is None:
+                return None
+            consumed = self._consumed_message(delivery, queue_name=queue_name)
+            if consumed is not None:
+                return consumed
+
+    def _consume_lanes(self, timeout_seconds: float) -> ConsumedMessage | None:
+        """Pop from the consume lane queues in weighted round-robin order.
+
+        Every lane is tried without blocking, scheduled lane first, so an idle
+        lane never delays another; when all lanes are empty the backend idles
+        briefly (servicing heartbeats) until ``timeout_seconds`` runs out.
+        """
+        lane_queues = self.lanes.queue_names(self.consume)
+        deadline = time.monotonic() + timeout_seconds
+        while True:
+            for lane in self._lane_scheduler.next_order():
+                delivery = self.backend.get(lane_queues[lane], 0)
+                if delivery is None:
+                    continue
+                consumed = self._consumed_message(delivery, queue_name=lane_queues[lane], lane=lane)
+                if consumed is not None:
+                    return consumed
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            self.backend.idle(min(LANE_IDLE_SECONDS, remaining))
+
+    def _consumed_message(
+        self,
+        delivery: QueueDelivery,
+        *,
+        queue_name: str,
+        lane: str | None = None,
+    ) -> ConsumedMessage | None:
+        """Wrap one raw backend delivery; an undecodable one is dead-lettered and ``None`` returned.
+
+        Decoding is deterministic, so a malformed body skips the delay queues
+        and goes straight to the DLQ instead of escaping the consume loop
+        unsettled.
+        """
+        try:
+            payload = self.consume_contract(**self.codecs.decode(delivery.body, delivery.content_type))
+        except Exception as exc:
+            self._dead_letter_undecodable(delivery, queue_name=queue_name, error=exc)
+            return None
+        return ConsumedMessage(
+            payload=payload,
+            delivery_tag=delivery.delivery_tag,
+            _queue=self,
+            headers=delivery.headers,
+            queue_name=queue_name,
+            lane=lane or _payload_lane(payload),
         )
 
+    def _ack(self, delivery_tag: int, *, multiple: bool = False) -> None:
+        """Acknowledge one consumed message, or every unacked tag up to it when ``multiple``."""
+        self.backend.ack(delivery_tag, multiple=multiple)
+
+    def _ack_many(self, delivery_tags: list[int]) -> None:
+        """Acknowledge the unsettled deliveries of one batch.
+
+        Without lanes a single queue is consumed, so every unacked tag up to
+        the highest one belongs to the batch and one cumulative ack covers
+        it. With lanes, RabbitMQ push mode buffers deliveries of every lane
+        queue and the scheduler hands them out out of tag order, so a
+        cumulative ack could cover buffered, unprocessed deliveries of another
+        lane; each tag is acked on its own instead.
+        """
+        if self.lanes is None:
+            self._ack(max(delivery_tags), multiple=True)
+            return
+        for delivery_tag in sorted(delivery_tags):
+            self._ack(delivery_tag)
+
     def _nack(self, delivery_tag: int, *, requeue: bool) -> None:
         """Negative-ack one consumed message."""
-        self._retry_operation(
-            lambda: self._nack_once(delivery_tag, requeue=requeue),
-            op_name=f"nack:{delivery_tag}:requeue={requeue}",
-        )
-
-    def _ack_once(self, delivery_tag: int) -> None:
-        """Ack one delivery tag on the current channel."""
-        self._ensure_channel()
-        self._channel.basic_ack(delivery_tag)
-
-    def _nack_once(self, delivery_tag: int, *, requeue: bool) -> None:
-        """Nack one delivery tag on the current channel."""
-        self._ensure_channel()
-        self._channel.basic_nack(delivery_tag, requeue=requeue)
-
-    def _publish_once(self, queue_name: str, body: str) -> None:
-        """Publish payload body to one queue using the current channel."""
-        self._ensure_channel()
-        self._channel.queue_declare(queue=queue_name, durable=True)
-        self._channel.basic_publish(
-            exchange="",
-            routing_key=queue_name,
-            body=body,
-            properties=pika.BasicProperties(delivery_mode=2),
-        )
-
-    def _retry_operation(self, fn: Callable[[], None], op_name: str) -> None:
-        """Run operation once, reconnect on AMQP failure, then retry once."""
-        try:
-            fn()
-            return
-        except (AMQPError, OSError, RuntimeError):
-            logger.exception("Queue %s failed; reconnecting and retrying", op_name)
-        self._reconnect()
-        fn()
-
-    def _connect(self) -> None:
-        """Open broker connection and channel."""
-        parameters = pika.URLParameters(self._broker_url)
-        self._connection = pika.BlockingConnection(parameters)
-        self._channel = self._connection.channel()
-
-    def _close(self) -> None:
-        """Close open channel/connection handles safely."""
-        if self._channel is not None:
-            try:
-                self._channel.close()
-            except Exception:
-                pass
-        if self._connection is not None:
-            try:
-                self._connection.close()
-            except Exception:
-                pass
-        self._channel = None
-        self._connection = None
-
-    def _reconnect(self) -> None:
-        """Recreate AMQP connection and channel."""
-        if not self._enabled:
+        self.backend.nack(delivery_tag, requeue=requeue)
+
+    def _wait_for_produce_capacity(self) -> None:
+        """Apply the backpressure policy, if configured, before consuming."""
+        if self.backpressure is not None:
+            self.backpressure.wait_for_capacity()
+
+    def _retry(self, message: ConsumedMessage, *, error: str, dlq_payload: dict[str, Any] | None) -> None:
+        """Publish a failed message to its next delay queue or the DLQ, then ack the original."""
+        attempt = message.attempt
+        if attempt in self.retry_policy.retry_attempts:
+            body, content_type = self.codecs.encode(message.payload)
+            self.backend.publish(
+                self.retry_policy.delay_queue_name(message.queue_name or self.consume, attempt),
+                body,
+                content_type=content_type,
+                headers={**message.headers, RETRY_ATTEMPT_HEADER: attempt},
+            )
+            self._ack(message.delivery_tag)
             return
-        self._close()
-        self._connect()
+        self._dead_letter(message, error=error, dlq_payload=dlq_payload)
 
-    def _ensure_channel(self) -> None:
-        """Ensure there is an open AMQP channel."""
-        if self._channel is None or self._connection is None:
-            self._connect()
+    def _dead_letter(self, message: ConsumedMessage, *, error: str, dlq_payload: dict[str, Any] | None) -> None:
+        """Publish a failed message to the DLQ and ack it; without a DLQ, reject it without requeue."""
+        attempt = message.attempt
+        if not self.dlq:
+            self._nack(message.delivery_tag, requeue=False)
             return
-        if self._connection.is_closed or self._channel.is_closed:
-            self._reconnect()
+        self._publish(
+            self.dlq,
+            dlq_payload
+            or Envelope(
+                payload={
+                    "message": message.payload,
+                    "error": error,
+                    "attempts": attempt,
+                    "failed_at": utc_now_iso(),
+                },
+            ).to_payload,
+        )
+        self._ack(message.delivery_tag)
+
+    def _dead_letter_undecodable(self, delivery: QueueDelivery, *, queue_name: str, error: Exception) -> None:
+        """Dead-letter a delivery whose body cannot be decoded, keeping the raw body base64-encoded."""
+        logger.warning("Dead-lettering undecodable delivery %s from '%s': %s", delivery.delivery_tag, queue_name, error)
+        message = ConsumedMessage(
+            payload={
+                "body_base64": base64.b64encode(delivery.body).decode("ascii"),
+                "content_type": delivery.content_type,
+            },
+            delivery_tag=delivery.delivery_tag,
+            _queue=self,
+            headers=delivery.headers,
+            queue_name=queue_name,
+        )
+        self._dead_letter(message, error=f"Undecodable message: {error}", dlq_payload=None)
+        message._settled = True
+
+    def _declare_stage_queues(self) -> None:
+        """Declare configured stage queues (one per lane) and each consume queue's retry delay queues."""
+        consume_queues = self._lane_queue_names(self.consume)
+        for queue_name in (*consume_queues, *self._lane_queue_names(self.produce), self.dlq):
+            if queue_name:
+                self.backend.declare(queue_name)
+        for consume_queue in consume_queues:
+            if not consume_queue:
+                continue
+            for attempt in self.retry_policy.retry_attempts:
+                self.backend.declare(
+                    self.retry_policy.delay_queue_name(consume_queue, attempt),
+                    self.retry_policy.delay_queue_arguments(consume_queue, attempt),
+                )
+
+    def _lane_queue_names(self, base_queue: str) -> list[str]:
+        """Physical queues behind ``base_queue``: one per lane, or the queue itself without lanes."""
+        if self.lanes is None or not base_queue:
+            return [base_queue]
+        return list(self.lanes.queue_names(base_queue).values())
+
+    def _lanes_depth(self, base_queue: str) -> int:
+        """Ready message count summed over the lane queues of ``base_queue``."""
+        return sum(self.backend.queue_depth(queue_name) for queue_name in self._lane_queue_names(base_queue))
 
     def _initialize_stage_contract(
         self,
@@ -243,10 +489,36 @@ class QueueGateway:
         self._bind_direct_queue_config(queue_config)
 
     def _load_stage_runtime_config(self, queue_config: dict[str, Any]) -> None:
-        """Load queue timeout from config payload."""
+        """Load queue timeout and batching settings from config payload."""
         self.timeout_seconds = int(
             queue_config.get("queue_pop_timeout_seconds", queue_config.get("pop_timeout_seconds", 1))
         )
+        self.publish_batch_size = int(queue_config.get("publish_batch_size", 100))
+        if self.publish_batch_size <= 0:
+            raise ValueError("queue publish_batch_size must be greater than zero")
+        self.batch_size = int(queue_config.get("batch_size", 1))
+        if self.batch_size <= 0:
+            raise ValueError("queue batch_size must be greater than zero")
+        self.batch_max_wait_seconds = float(queue_config.get("batch_max_wait_seconds", self.timeout_seconds))
+        self.codecs = EnvelopeCodecRegistry(str(queue_config.get("codec", "json")))
+        self.retry_policy = RetryPolicy.from_config(queue_config.get("retry"))
+        self.lanes = QueueLanes.from_config(queue_config)
+        self._lane_scheduler = WeightedLaneScheduler(self.lanes) if self.lanes is not None else None
+        self._outbound_lane: str | None = None
+        self.backpressure = self._build_backpressure(queue_config)
+
+    def _build_backpressure(self, queue_config: dict[str, Any]) -> ProduceBackpressure | None:
+        """Create the produce-queue backpressure gate from ``job.queue.backpressure``."""
+        policy = BackpressurePolicy.from_config(queue_config.get("backpressure"))
+        produce = str(queue_config.get("produce", ""))
+        if policy is None or not produce:
+            return None
+        return ProduceBackpressure(
+            policy,
+            queue_name=produce,
+            queue_depth=lambda: self._lanes_depth(produce),
+            idle=self.backend.idle,
+        )
 
     def _bind_direct_queue_config(self, queue_config: dict[str, Any]) -> None:
         """Bind queue names/contracts from direct runtime config without stage contracts."""
@@ -256,3 +528,11 @@ class QueueGateway:
         self.consume_contract = dict
         self.produce_contract = dict
         self.dlq_contract = dict
+
+
+def _payload_lane(payload: dict[str, Any]) -> str | None:
+    """Lane carried in an envelope payload's ``meta``, if any."""
+    meta = payload.get("meta")
+    if isinstance(meta, dict):
+        return meta.get(LANE_META_KEY)
+    return None
@@ -0,0 +1,85 @@
+"""Delayed-retry policy for stage queues.
+
+Layer:
+- Infrastructure helper used by ``QueueGateway``.
+
+Role:
+- Describe the per-attempt delay queues that hold failed messages before
+  they flow back into the consume queue, and when to give up.
+
+Design intent:
+- Use broker-native delays: each attempt has its own queue with a
+  queue-level ``x-message-ttl`` and a dead-letter route back to the consume
+  queue, so no consumer or timer is needed and messages in one delay queue
+  all expire in order.
+- Name each delay queue after its TTL (``<consume>.retry.<n>.<ttl_ms>``):
+  RabbitMQ rejects redeclaring a queue with different arguments, so a new
+  delay policy declares new queues instead of failing at startup. Queues of
+  an old policy still expire their messages back to the consume queue and
+  can be deleted once empty.
+- Count attempts in the ``x-retry-attempt`` message header.
+
+Non-goals:
+- Does not classify errors; every failure counts as one attempt.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+RETRY_ATTEMPT_HEADER = "x-retry-attempt"
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential-backoff retry policy for one consume queue."""
+
+    max_attempts: int = 5
+    initial_delay_seconds: float = 5.0
+    backoff_multiplier: float = 4.0
+    max_delay_seconds: float = 900.0
+
+    def __post_init__(self) -> None:
+        if self.max_attempts <= 0:
+            raise ValueError("queue retry max_attempts must be greater than zero")
+        if self.initial_delay_seconds <= 0:
+            raise ValueError("queue retry initial_delay_seconds must be greater than zero")
+        if self.backoff_multiplier < 1:
+            raise ValueError("queue retry backoff_multiplier must be at least 1")
+
+    @classmethod
+    def from_config(cls, retry_config: dict[str, Any] | None) -> "RetryPolicy":
+        """Build a policy from the ``job.queue.retry`` mapping; missing keys keep defaults."""
+        config = retry_config or {}
+        defaults = cls()
+        return cls(
+            max_attempts=int(config.get("max_attempts", defaults.max_attempts)),
+            initial_delay_seconds=float(config.get("initial_delay_seconds", defaults.initial_delay_seconds)),
+            backoff_multiplier=float(config.get("backoff_multiplier", defaults.backoff_multiplier)),
+            max_delay_seconds=float(config.get("max_delay_seconds", defaults.max_delay_seconds)),
+        )
+
+    @property
+    def retry_attempts(self) -> range:
+        """Failed-attempt numbers that are retried (the last attempt goes to the DLQ)."""
+        return range(1, self.max_attempts)
+
+    def delay_seconds(self, attempt: int) -> float:
+        """Delay applied after failed attempt number ``attempt`` (1-based)."""
+        delay = self.initial_delay_seconds * self.backoff_multiplier ** (attempt - 1)
+        return min(delay, self.max_delay_seconds)
+
+    def delay_milliseconds(self, attempt: int) -> int:
+        """Queue TTL, in milliseconds, of the delay queue for failed attempt ``attempt``."""
+        return int(self.delay_seconds(attempt) * 1000)
+
+    def delay_queue_name(self, consume_queue: str, attempt: int) -> str:
+        """Name of the delay queue holding messages after failed attempt ``attempt``; it encodes the TTL."""
+        return f"{consume_queue}.retry.{attempt}.{self.delay_milliseconds(attempt)}"
+
+    def delay_queue_arguments(self, consume_queue: str, attempt: int) -> dict[str, Any]:
+        """AMQP queue arguments that expire messages back into ``consume_queue``."""
+        return {
+            "x-message-ttl": self.delay_milliseconds(attempt),
+            "x-dead-letter-exchange": "",
+            "x-dead-letter-routing-key": consume_queue,
+        }
@@ -9,6 +9,7 @@ class QueueRuntimeSettings:
 
     broker_url: str
     queue_pop_timeout_seconds: int
+    heartbeat_seconds: int
 
     @classmethod
     def from_env(cls) -> "QueueRuntimeSettings":
@@ -16,4 +17,5 @@ class QueueRuntimeSettings:
         return cls(
             broker_url=_required_env("BROKER_URL"),
             queue_pop_timeout_seconds=_required_int("QUEUE_POP_TIMEOUT_SECONDS", 1),
+            heartbeat_seconds=_required_int("QUEUE_HEARTBEAT_SECONDS", 60),
         )
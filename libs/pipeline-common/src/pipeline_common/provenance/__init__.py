@@ -1,19 +1,23 @@
 """Chunk and embedding provenance registry primitives."""
 
 from pipeline_common.provenance.identifiers import (
+    StreamingSha256,
     build_id,
     canonical_json,
     chunk_params_hash,
     embedding_params_hash,
     sha256_hex,
+    sha256_hex_chunks,
     source_content_hash,
 )
 
 __all__ = [
+    "StreamingSha256",
     "build_id",
     "canonical_json",
     "chunk_params_hash",
     "embedding_params_hash",
     "sha256_hex",
+    "sha256_hex_chunks",
     "source_content_hash",
 ]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any
+from typing import Any, Iterable
 
 
 def canonical_json(value: Any) -> str:
@@ -24,6 +24,32 @@ def source_content_hash(source_bytes: bytes) -> str:
     return sha256_hex(source_bytes)
 
 
+class StreamingSha256:
+    """Incremental SHA-256 fed chunk by chunk, so hashing never needs the whole payload in memory."""
+
+    def __init__(self) -> None:
+        self._digest = hashlib.sha256()
+        self.size = 0
+
+    def update(self, chunk: bytes) -> bytes:
+        """Feed one chunk and return it unchanged, so hashing can sit inside a copy loop."""
+        self._digest.update(chunk)
+        self.size += len(chunk)
+        return chunk
+
+    def hexdigest(self) -> str:
+        """Return the SHA-256 hex digest of every chunk fed so far."""
+        return self._digest.hexdigest()
+
+
+def sha256_hex_chunks(chunks: Iterable[bytes]) -> str:
+    """Return the SHA-256 hex digest of a chunked stream; equals ``sha256_hex`` of the joined bytes."""
+    hasher = StreamingSha256()
+    for chunk in chunks:
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
 def chunk_params_hash(chunker_params: dict[str, Any]) -> str:
     """Hash canonical chunker params."""
     return sha256_hex(canonical_json(chunker_params))
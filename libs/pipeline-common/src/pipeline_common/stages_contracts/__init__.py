@@ -10,6 +10,11 @@ from pipeline_common.stages_contracts.step_10_artifact_payloads import (
     StageArtifact,
     StageArtifactMetadata,
 )
+from pipeline_common.stages_contracts.chunk_bundle import (
+    ChunkBundle,
+    ChunkBundleIndex,
+    ChunkBundleRef,
+)
 from pipeline_common.stages_contracts.embedding_artifact import (
     EmbeddingArtifact,
     EmbeddingArtifactMetadata,
@@ -27,6 +32,9 @@ __all__ = [
     "Content",
     "StageArtifact",
     "StageArtifactMetadata",
+    "ChunkBundle",
+    "ChunkBundleIndex",
+    "ChunkBundleRef",
     "EmbeddingArtifact",
     "EmbeddingArtifactMetadata",
     "ExecutionStatus",
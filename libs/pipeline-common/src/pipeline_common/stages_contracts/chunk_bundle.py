@@ -0,0 +1,222 @@
+"""Packed per-run chunk bundle contract.
+
+Layer:
+- Stage contract shared by the chunk writer and chunk readers.
+
+Role:
+- Pack every chunk of one chunking run into a single JSONL object instead of
+  one object per chunk, without changing the chunk payload readers see.
+
+Design intent:
+- Line 1 is a shared header holding the ``StageArtifactMetadata`` fields
+  every chunk of the run has in common (processor, both ``FileMetadata``
+  blocks and params); each following line holds one chunk's
+  ``content_metadata`` and ``content``.
+- ``ChunkBundleIndex`` lists the header and every chunk line as byte
+  ranges; it is stored next to the bundle and its ranges are carried in each
+  chunk's ``ChunkBundleRef`` URI, so readers fetch one chunk with range reads
+  and never need the whole bundle.
+- ``rebuild_chunk_payload`` returns the exact canonical JSON the per-chunk
+  object would have held, so content hashes downstream do not depend on the
+  storage format.
+
+Non-goals:
+- Bundles must be stored uncompressed; range reads see stored bytes.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Sequence
+from urllib.parse import parse_qsl, urlencode
+
+from pipeline_common.stages_contracts.step_10_artifact_payloads import StageArtifact
+
+CHUNK_BUNDLE_FORMAT = "chunk-bundle/1"
+
+
+def _canonical_json(payload: Any) -> bytes:
+    return json.dumps(payload, sort_keys=True, ensure_ascii=True, separators=(",", ":")).encode("utf-8")
+
+
+@dataclass(frozen=True)
+class ChunkBundleRef:
+    """Address of one chunk line inside a bundle object.
+
+    Rendered as the bundle URI plus a fragment
+    (``...chunks.bundle.jsonl#chunk=<id>&header=<n>&offset=<n>&length=<n>``),
+    which is what the chunk stage publishes downstream in bundle mode.
+    """
+
+    bundle_uri: str
+    chunk_id: str
+    header_length: int
+    offset: int
+    length: int
+
+    @property
+    def fragment(self) -> str:
+        return urlencode(
+            {"chunk": self.chunk_id, "header": self.header_length, "offset": self.offset, "length": self.length}
+        )
+
+    @property
+    def uri(self) -> str:
+        return f"{self.bundle_uri}#{self.fragment}"
+
+    @property
+    def chunk_uri(self) -> str:
+        """URI the chunk would have as its own object in objects mode.
+
+        ``<run>/chunks.bundle.jsonl`` maps to ``<run>/chunks/<chunk_id>.json``,
+        so provenance derived from it (doc id, run id, source type) matches
+        the per-chunk layout.
+        """
+        run_uri = self.bundle_uri.rsplit("/", 1)[0]
+        return f"{run_uri}/chunks/{self.chunk_id}.json"
+
+    @property
+    def header_range(self) -> tuple[int, int]:
+        """Inclusive byte range of the shared header line."""
+        return (0, self.header_length - 1)
+
+    @property
+    def chunk_range(self) -> tuple[int, int]:
+        """Inclusive byte range of this chunk's line."""
+        return (self.offset, self.offset + self.length - 1)
+
+    @classmethod
+    def parse(cls, uri: str) -> ChunkBundleRef | None:
+        """Parse a chunk reference URI; plain object URIs (no fragment) return ``None``."""
+        bundle_uri, separator, fragment = uri.partition("#")
+        if not separator:
+            return None
+        fields = dict(parse_qsl(fragment))
+        try:
+            return cls(
+                bundle_uri=bundle_uri,
+                chunk_id=fields["chunk"],
+                header_length=int(fields["header"]),
+                offset=int(fields["offset"]),
+                length=int(fields["length"]),
+            )
+        except (KeyError, ValueError):
+            raise ValueError(f"Invalid chunk bundle reference: {uri!r}") from None
+
+
+@dataclass(frozen=True)
+class ChunkBundleEntry:
+    """Byte range of one chunk line inside a bundle."""
+
+    chunk_id: str
+    offset: int
+    length: int
+
+
+@dataclass(frozen=True)
+class ChunkBundleIndex:
+    """Offset index of a bundle: header length plus one entry per chunk, in chunk order."""
+
+    header_length: int
+    chunks: tuple[ChunkBundleEntry, ...]
+
+    def refs(self, bundle_uri: str) -> list[ChunkBundleRef]:
+        """Build the reference of every chunk in the bundle stored at ``bundle_uri``."""
+        return [
+            ChunkBundleRef(
+                bundle_uri=bundle_uri,
+                chunk_id=entry.chunk_id,
+                header_length=self.header_length,
+                offset=entry.offset,
+                length=entry.length,
+            )
+            for entry in self.chunks
+        ]
+
+    @property
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "format": CHUNK_BUNDLE_FORMAT,
+            "header": {"offset": 0, "length": self.header_length},
+            "chunks": [
+                {"chunk_id": entry.chunk_id, "offset": entry.offset, "length": entry.length}
+                for entry in self.chunks
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> ChunkBundleIndex:
+        """Parse a stored index object."""
+        if payload.get("format") != CHUNK_BUNDLE_FORMAT:
+            raise ValueError(f"Unsupported chunk bundle format: {payload.get('format')!r}")
+        return cls(
+            header_length=int(payload["header"]["length"]),
+            chunks=tuple(
+                ChunkBundleEntry(chunk_id=str(entry["chunk_id"]), offset=int(entry["offset"]), length=int(entry["length"]))
+                for entry in payload["chunks"]
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class ChunkBundle:
+    """Encoded bundle body plus its offset index."""
+
+    payload: bytes
+    index: ChunkBundleIndex
+
+    @classmethod
+    def from_artifacts(cls, artifacts: Sequence[StageArtifact]) -> ChunkBundle:
+        """Pack chunk artifacts of one run; they must share every metadata field but ``content_metadata``.
+
+        Raises:
+            ValueError: When ``artifacts`` is empty or their shared metadata differs.
+        """
+        if not artifacts:
+            raise ValueError("A chunk bundle needs at least one chunk artifact")
+        shared_metadata = cls._shared_metadata(artifacts[0])
+        header_line = _canonical_json({"format": CHUNK_BUNDLE_FORMAT, "metadata": shared_metadata}) + b"\n"
+        lines = [header_line]
+        entries: list[ChunkBundleEntry] = []
+        offset = len(header_line)
+        for artifact in artifacts:
+            if cls._shared_metadata(artifact) != shared_metadata:
+                raise ValueError("Chunk artifacts of one bundle must share processor, document metadata and params")
+            payload = artifact.to_dict
+            line = _canonical_json(
+                {"content_metadata": payload["metadata"]["content_metadata"], "content": payload["content"]}
+            ) + b"\n"
+            entries.append(
+                ChunkBundleEntry(chunk_id=str(artifact.content_metadata["chunk_id"]), offset=offset, length=len(line))
+            )
+            lines.append(line)
+            offset += len(line)
+        return cls(
+            payload=b"".join(lines),
+            index=ChunkBundleIndex(header_length=len(header_line), chunks=tuple(entries)),
+        )
+
+    @staticmethod
+    def _shared_metadata(artifact: StageArtifact) -> dict[str, Any]:
+        metadata = dict(artifact.to_dict["metadata"])
+        metadata.pop("content_metadata")
+        return metadata
+
+
+def rebuild_chunk_payload(header_line: bytes, chunk_line: bytes) -> bytes:
+    """Rebuild the canonical per-chunk ``StageArtifact`` JSON from a header line and one chunk line.
+
+    Raises:
+        ValueError: When the header is not a supported bundle header.
+    """
+    header = json.loads(header_line)
+    if header.get("format") != CHUNK_BUNDLE_FORMAT:
+        raise ValueError(f"Unsupported chunk bundle format: {header.get('format')!r}")
+    chunk = json.loads(chunk_line)
+    return _canonical_json(
+        {
+            "metadata": {**header["metadata"], "content_metadata": chunk["content_metadata"]},
+            "content": chunk["content"],
+        }
+    )
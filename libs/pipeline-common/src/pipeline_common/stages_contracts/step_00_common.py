@@ -57,6 +57,23 @@ class FileMetadata:
         default_content_type: str = "application/octet-stream",
     ) -> "FileMetadata":
         """Build metadata for a source object directly from its storage URI and raw bytes."""
+        return cls.from_source_hash(
+            uri=uri,
+            content_hash=source_content_hash(payload),
+            security_clearance=security_clearance,
+            default_content_type=default_content_type,
+        )
+
+    @classmethod
+    def from_source_hash(
+        cls,
+        *,
+        uri: str,
+        content_hash: str,
+        security_clearance: str = "",
+        default_content_type: str = "application/octet-stream",
+    ) -> "FileMetadata":
+        """Build metadata for a source object from its storage URI and a precomputed content hash."""
         resolved_content_type = mimetypes.guess_type(uri)[0]
         if resolved_content_type is None:
             resolved_content_type = default_content_type
@@ -67,7 +84,7 @@ class FileMetadata:
             security_clearance=security_clearance,
             source_type=Path(uri).suffix.lower().lstrip("."),
             content_type=resolved_content_type,
-            source_content_hash=source_content_hash(payload),
+            source_content_hash=content_hash,
         )
 
     @property
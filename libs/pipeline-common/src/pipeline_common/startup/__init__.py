@@ -1,6 +1,7 @@
 """Worker startup package exports."""
 
 from pipeline_common.startup.contracts import (
+    AsyncWorkerService,
     WorkerConfigExtractor,
     WorkerPollingContract,
     WorkerService,
@@ -11,6 +12,7 @@ from pipeline_common.startup.runtime_context import WorkerRuntimeContext
 from pipeline_common.startup.runtime_factory import RuntimeContextFactory
 
 __all__ = [
+    "AsyncWorkerService",
     "JobPropertiesParser",
     "RuntimeContextFactory",
     "WorkerConfigExtractor",
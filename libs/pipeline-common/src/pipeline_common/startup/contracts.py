@@ -1,13 +1,19 @@
 """Startup contracts shared by worker entrypoints."""
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Generic, Mapping, TypeVar
+from typing import Any, Callable, Generic, Mapping, TypeVar
 
+from pipeline_common.gateways.queue import AsyncConsumedMessage, AsyncQueueGateway
 from pipeline_common.startup.runtime_context import WorkerRuntimeContext
 
 TWorkerConfig = TypeVar("TWorkerConfig")
 TWorkerService = TypeVar("TWorkerService", bound="WorkerService")
+TResult = TypeVar("TResult")
+
+logger = logging.getLogger(__name__)
 
 
 class WorkerService(ABC):
@@ -18,6 +24,73 @@ class WorkerService(ABC):
         """Start serving worker loop."""
 
 
+class AsyncWorkerService(WorkerService):
+    """Asyncio worker contract running up to ``max_in_flight`` handlers concurrently.
+
+    ``serve`` owns the event loop: it pulls messages from the async stage
+    queue, gates them with a semaphore sized to the gateway's
+    ``max_in_flight`` and runs ``handle`` for each one as its own task.
+    Handlers settle their message with ``ack``/``retry``; a handler that
+    raises before settling hands the message to the retry policy (delay
+    queue, then DLQ), like the blocking workers do.
+
+    Blocking gateways (object storage, lineage, HTTP clients) should be
+    called through ``run_blocking``. Per-run stateful gateways such as the
+    lineage runtime must not be shared across concurrent handlers.
+    """
+
+    @property
+    @abstractmethod
+    def stage_queue(self) -> AsyncQueueGateway:
+        """Async stage queue this worker consumes from."""
+
+    @abstractmethod
+    async def handle(self, message: AsyncConsumedMessage) -> None:
+        """Process one message and settle it."""
+
+    def serve(self) -> None:
+        """Run the async worker loop until cancelled."""
+        asyncio.run(self.serve_async())
+
+    async def serve_async(self) -> None:
+        """Dispatch deliveries to concurrent handlers bounded by ``max_in_flight``."""
+        stage_queue = self.stage_queue
+        in_flight = asyncio.Semaphore(stage_queue.max_in_flight)
+        handlers: set[asyncio.Task[None]] = set()
+        try:
+            while True:
+                await in_flight.acquire()
+                try:
+                    message = await stage_queue.get()
+                except BaseException:
+                    in_flight.release()
+                    raise
+                handler = asyncio.create_task(self._run_handler(message, in_flight))
+                handlers.add(handler)
+                handler.add_done_callback(handlers.discard)
+        finally:
+            if handlers:
+                await asyncio.gather(*handlers, return_exceptions=True)
+            await stage_queue.close()
+
+    async def run_blocking(self, fn: Callable[..., TResult], *args: Any, **kwargs: Any) -> TResult:
+        """Run one blocking call on the default thread pool."""
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def _run_handler(self, message: AsyncConsumedMessage, in_flight: asyncio.Semaphore) -> None:
+        """Run ``handle`` for one message and release its in-flight slot."""
+        try:
+            await self.handle(message)
+        except Exception as exc:
+            logger.exception("Async handler failed for delivery %s", message.delivery_tag)
+            try:
+                await message.retry(error=str(exc))
+            except Exception:
+                logger.exception("Failed to route delivery %s to retry", message.delivery_tag)
+        finally:
+            in_flight.release()
+
+
 class WorkerConfigExtractor(Generic[TWorkerConfig], ABC):
     """Extractor contract for typed worker config."""
 
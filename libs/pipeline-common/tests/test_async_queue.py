@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from pipeline_common.gateways.queue import (
+    AsyncConsumedMessage,
+    AsyncQueueGateway,
+    Envelope,
+    InMemoryBroker,
+    InMemoryQueueBackend,
+    QueueGateway,
+)
+from pipeline_common.startup import AsyncWorkerService
+
+_QUEUE_CONFIG = {
+    "consume": "work",
+    "produce": "next",
+    "dlq": "work.dlq",
+    "retry": {"max_attempts": "2", "initial_delay_seconds": "0.01", "backoff_multiplier": "1"},
+}
+
+
+class _Worker(AsyncWorkerService):
+    def __init__(self, stage_queue: AsyncQueueGateway, *, expected: int) -> None:
+        self._stage_queue = stage_queue
+        self.expected = expected
+        self.handled: list[str] = []
+        self.running = 0
+        self.peak_running = 0
+        self.done = asyncio.Event()
+
+    @property
+    def stage_queue(self) -> AsyncQueueGateway:
+        return self._stage_queue
+
+    async def handle(self, message: AsyncConsumedMessage) -> None:
+        self.running += 1
+        self.peak_running = max(self.peak_running, self.running)
+        try:
+            await asyncio.sleep(0.02)
+            value = message.payload["payload"]
+            self.handled.append(value)
+            if len(self.handled) >= self.expected:
+                self.done.set()
+            if value == "fails":
+                raise RuntimeError("boom")
+            await self.stage_queue.push(Envelope(payload=value).to_payload, lane=message)
+            await message.ack()
+        finally:
+            self.running -= 1
+
+
+class AsyncWorkerServiceTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.broker = InMemoryBroker()
+        self.producer = QueueGateway(InMemoryQueueBackend(self.broker), {"produce": "work"})
+        self.observer = InMemoryQueueBackend(self.broker)
+
+    def _run(self, *, expected: int, max_in_flight: int = 2) -> _Worker:
+        async def main() -> _Worker:
+            stage_queue = AsyncQueueGateway(
+                QueueGateway(InMemoryQueueBackend(self.broker), _QUEUE_CONFIG), max_in_flight=max_in_flight
+            )
+            worker = _Worker(stage_queue, expected=expected)
+            serving = asyncio.create_task(worker.serve_async())
+            await asyncio.wait_for(worker.done.wait(), timeout=5)
+            await asyncio.sleep(0.1)
+            serving.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await serving
+            return worker
+
+        return asyncio.run(main())
+
+    def _dead_letters(self) -> list[dict]:
+        codecs = QueueGateway(self.observer, {}).codecs
+        letters = []
+        while (delivery := self.observer.get("work.dlq", 0)) is not None:
+            letters.append(codecs.decode(delivery.body, delivery.content_type)["payload"])
+        return letters
+
+    def test_handlers_run_concurrently_up_to_max_in_flight(self) -> None:
+        self.producer.push_many(Envelope(payload=f"doc-{index}").to_payload for index in range(6))
+
+        worker = self._run(expected=6, max_in_flight=3)
+
+        self.assertEqual(sorted(worker.handled), [f"doc-{index}" for index in range(6)])
+        self.assertEqual(worker.peak_running, 3)
+        self.assertEqual(self.observer.queue_depth("next"), 6)
+        self.assertEqual(self.observer.queue_depth("work"), 0)
+
+    def test_raising_handler_goes_through_delay_queue_then_dlq(self) -> None:
+        self.producer.push(Envelope(payload="fails").to_payload)
+
+        with self.assertLogs("pipeline_common.startup.contracts", level="ERROR"):
+            worker = self._run(expected=2)
+
+        self.assertEqual(worker.handled, ["fails", "fails"])
+        letters = self._dead_letters()
+        self.assertEqual([(letter["attempts"], letter["error"]) for letter in letters], [(2, "boom")])
+        self.assertEqual(self.observer.queue_depth("work"), 0)
+
+    def test_undecodable_message_is_dead_lettered_and_consumption_continues(self) -> None:
+        self.observer.publish("work", b"{not json", content_type="application/json")
+        self.producer.push(Envelope(payload="doc-1").to_payload)
+
+        with self.assertLogs("pipeline_common.gateways.queue.queue", level="WARNING"):
+            worker = self._run(expected=1)
+
+        self.assertEqual(worker.handled, ["doc-1"])
+        letters = self._dead_letters()
+        self.assertEqual(len(letters), 1)
+        self.assertTrue(letters[0]["error"].startswith("Undecodable message"))
+        self.assertEqual(letters[0]["message"]["body_base64"], "e25vdCBqc29u")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import unittest
+
+from pipeline_common.gateways.queue import (
+    BackpressurePolicy,
+    Envelope,
+    InMemoryBroker,
+    InMemoryQueueBackend,
+    ProduceBackpressure,
+    QueueGateway,
+)
+
+
+class _ScriptedDepth:
+    def __init__(self, depths: list[int]) -> None:
+        self.depths = depths
+        self.samples = 0
+
+    def __call__(self) -> int:
+        depth = self.depths[min(self.samples, len(self.depths) - 1)]
+        self.samples += 1
+        return depth
+
+
+class ProduceBackpressureTest(unittest.TestCase):
+    def _gate(self, depth: _ScriptedDepth, *, check_interval_seconds: float = 60.0) -> ProduceBackpressure:
+        self.idled: list[float] = []
+        policy = BackpressurePolicy(high_water_mark=10, low_water_mark=4, check_interval_seconds=check_interval_seconds)
+        return ProduceBackpressure(policy, queue_name="next", queue_depth=depth, idle=self.idled.append)
+
+    def test_pauses_at_high_water_mark_and_resumes_only_below_low_water_mark(self) -> None:
+        depth = _ScriptedDepth([10, 9, 5, 4])
+        gate = self._gate(depth)
+
+        with self.assertLogs("pipeline_common.gateways.queue.backpressure", level="INFO") as logs:
+            gate.wait_for_capacity()
+
+        self.assertEqual(depth.samples, 4)
+        self.assertEqual(self.idled, [60.0, 60.0, 60.0])
+        self.assertEqual(gate.pause_count, 1)
+        self.assertGreaterEqual(gate.paused_seconds, 0.0)
+        self.assertEqual([record.getMessage().split(" ")[0] for record in logs.records], ["Pausing", "Resuming"])
+
+    def test_depth_is_sampled_once_per_interval_while_running(self) -> None:
+        depth = _ScriptedDepth([3, 12])
+        gate = self._gate(depth)
+
+        self.assertTrue(gate.has_capacity())
+        self.assertTrue(gate.has_capacity())
+        gate.wait_for_capacity()
+
+        self.assertEqual(depth.samples, 1)
+        self.assertEqual(self.idled, [])
+
+    def test_paused_gate_samples_on_every_check(self) -> None:
+        depth = _ScriptedDepth([11, 11, 2])
+        gate = self._gate(depth)
+
+        with self.assertLogs("pipeline_common.gateways.queue.backpressure", level="INFO"):
+            self.assertFalse(gate.has_capacity())
+            self.assertFalse(gate.has_capacity())
+            self.assertTrue(gate.has_capacity())
+
+        self.assertEqual(depth.samples, 3)
+
+    def test_policy_rejects_inverted_marks(self) -> None:
+        with self.assertRaises(ValueError):
+            BackpressurePolicy(high_water_mark=4, low_water_mark=4)
+        self.assertIsNone(BackpressurePolicy.from_config({"low_water_mark": "2"}))
+        self.assertEqual(BackpressurePolicy.from_config({"high_water_mark": "9"}).low_water_mark, 4)
+
+
+class QueueGatewayBackpressureTest(unittest.TestCase):
+    def test_gate_watches_the_produce_lanes(self) -> None:
+        broker = InMemoryBroker()
+        queue_config = {
+            "consume": "work",
+            "produce": "next",
+            "lanes": {"high": {"weight": 3}, "low": {"weight": 1}},
+            "default_lane": "low",
+            "backpressure": {"high_water_mark": "3", "low_water_mark": "1"},
+        }
+        gateway = QueueGateway(InMemoryQueueBackend(broker), queue_config)
+        gateway.push_many(
+            Envelope(payload=index, meta={"lane": lane}).to_payload for index, lane in enumerate(["high", "low", "high"])
+        )
+
+        with self.assertLogs("pipeline_common.gateways.queue.backpressure", level="INFO"):
+            self.assertFalse(gateway.backpressure.has_capacity())
+        self.assertIsNone(QueueGateway(InMemoryQueueBackend(broker), {"consume": "work"}).backpressure)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+import unittest
+
+from pipeline_common.stages_contracts import ChunkBundleIndex, ChunkBundleRef
+from pipeline_common.stages_contracts.chunk_bundle import ChunkBundleEntry, rebuild_chunk_payload
+
+_BUNDLE_URI = "s3://pipeline/dev/03_chunks/doc-1/run-1/chunks.bundle.jsonl"
+
+
+class ChunkBundleRefTest(unittest.TestCase):
+    def test_uri_round_trips_through_parse(self) -> None:
+        ref = ChunkBundleRef(bundle_uri=_BUNDLE_URI, chunk_id="c-0001", header_length=120, offset=120, length=64)
+
+        self.assertEqual(ChunkBundleRef.parse(ref.uri), ref)
+        self.assertEqual(ref.header_range, (0, 119))
+        self.assertEqual(ref.chunk_range, (120, 183))
+        self.assertEqual(ref.chunk_uri, "s3://pipeline/dev/03_chunks/doc-1/run-1/chunks/c-0001.json")
+
+    def test_plain_object_uri_is_not_a_reference(self) -> None:
+        self.assertIsNone(ChunkBundleRef.parse("s3://pipeline/dev/03_chunks/doc-1/run-1/chunks/c-0001.json"))
+
+    def test_incomplete_fragment_is_rejected(self) -> None:
+        for fragment in ("chunk=c-0001&header=120&offset=120", "chunk=c-0001&header=x&offset=120&length=64"):
+            with self.subTest(fragment=fragment), self.assertRaises(ValueError):
+                ChunkBundleRef.parse(f"{_BUNDLE_URI}#{fragment}")
+
+    def test_index_builds_one_reference_per_chunk_in_order(self) -> None:
+        index = ChunkBundleIndex(
+            header_length=100,
+            chunks=(ChunkBundleEntry("c-0001", 100, 40), ChunkBundleEntry("c-0002", 140, 50)),
+        )
+
+        refs = index.refs(_BUNDLE_URI)
+
+        self.assertEqual([(ref.chunk_id, ref.offset, ref.length) for ref in refs], [("c-0001", 100, 40), ("c-0002", 140, 50)])
+        self.assertEqual(ChunkBundleIndex.from_dict(index.to_dict), index)
+
+
+class RebuildChunkPayloadTest(unittest.TestCase):
+    def test_merges_shared_header_with_chunk_line(self) -> None:
+        header_line = json.dumps({"format": "chunk-bundle/1", "metadata": {"processor": {"name": "chunker"}}}).encode()
+        chunk_line = json.dumps({"content_metadata": {"chunk_id": "c-0001"}, "content": {"text": "hello"}}).encode()
+
+        payload = json.loads(rebuild_chunk_payload(header_line, chunk_line))
+
+        self.assertEqual(
+            payload,
+            {
+                "metadata": {"processor": {"name": "chunker"}, "content_metadata": {"chunk_id": "c-0001"}},
+                "content": {"text": "hello"},
+            },
+        )
+
+    def test_unknown_header_format_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            rebuild_chunk_payload(b'{"format":"chunk-bundle/0","metadata":{}}', b'{"content_metadata":{},"content":{}}')
+
+
+if __name__ == "__main__":
+    unittest.main()
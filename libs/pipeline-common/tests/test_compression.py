@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+
+from pipeline_common.gateways.object_storage import CompressionPolicy, LocalFileSystemClient, ObjectStorageGateway
+from pipeline_common.gateways.object_storage.compression import key_has_prefix
+
+
+class KeyPrefixTest(unittest.TestCase):
+    def test_prefix_matches_only_the_leading_folder(self) -> None:
+        self.assertTrue(key_has_prefix("05_embeddings/doc-1.json", "05_embeddings/"))
+        self.assertTrue(key_has_prefix("dev/05_embeddings/doc-1.json", "05_embeddings/"))
+        self.assertFalse(key_has_prefix("dev/archive/05_embeddings/doc-1.json", "05_embeddings/"))
+        self.assertFalse(key_has_prefix("05_embeddings", "05_embeddings/"))
+
+    def test_policy_selects_codec_by_environment_scoped_prefix(self) -> None:
+        policy = CompressionPolicy.from_spec("05_embeddings/=gzip, 07_metadata/=GZIP")
+
+        self.assertEqual(policy.rules, (("05_embeddings/", "gzip"), ("07_metadata/", "gzip")))
+        self.assertEqual(policy.codec_for_key("dev/05_embeddings/doc-1.json").NAME, "gzip")
+        self.assertEqual(policy.codec_for_key("07_metadata/run.json").NAME, "gzip")
+        self.assertIsNone(policy.codec_for_key("dev/03_chunks/05_embeddings/doc-1.json"))
+        self.assertIsNone(CompressionPolicy.from_spec("").codec_for_key("dev/05_embeddings/doc-1.json"))
+
+    def test_invalid_spec_is_rejected(self) -> None:
+        for spec in ("05_embeddings/", "05_embeddings/=lz4", "=gzip"):
+            with self.subTest(spec=spec), self.assertRaises(ValueError):
+                CompressionPolicy.from_spec(spec)
+
+
+class CompressedRoundTripTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._root = tempfile.TemporaryDirectory()
+        self.client = LocalFileSystemClient(root=self._root.name)
+        self.client.create_bucket("pipeline")
+        self.gateway = ObjectStorageGateway(self.client, compression=CompressionPolicy.from_spec("05_embeddings/=gzip"))
+
+    def tearDown(self) -> None:
+        self._root.cleanup()
+
+    def test_compressed_prefix_is_stored_gzip_and_read_back_decoded(self) -> None:
+        payload = b'{"vector":[' + b"0.125," * 500 + b"0.5]}"
+        uri = self.gateway.build_uri("pipeline", "dev/05_embeddings/doc-1.json")
+
+        self.gateway.write_object(uri, payload, content_type="application/json")
+
+        stored = self.client.read_bytes("pipeline", "dev/05_embeddings/doc-1.json")
+        self.assertEqual(self.client.stat_object("pipeline", "dev/05_embeddings/doc-1.json").content_encoding, "gzip")
+        self.assertLess(len(stored), len(payload))
+        self.assertEqual(self.gateway.read_object(uri), payload)
+        self.assertEqual(self.gateway.read_many([uri])[uri].payload, payload)
+
+    def test_other_prefixes_are_stored_as_is(self) -> None:
+        payload = b'{"text":"hello"}'
+        uri = self.gateway.build_uri("pipeline", "dev/03_chunks/doc-1.json")
+
+        self.gateway.write_object(uri, payload, content_type="application/json")
+
+        self.assertEqual(self.client.read_bytes("pipeline", "dev/03_chunks/doc-1.json"), payload)
+        self.assertIsNone(self.client.stat_object("pipeline", "dev/03_chunks/doc-1.json").content_encoding)
+        self.assertEqual(self.gateway.read_object(uri), payload)
+
+
+if __name__ == "__main__":
+    unittest.main()
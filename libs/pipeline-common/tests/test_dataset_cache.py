@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from pipeline_common.gateways.lineage import DatasetPropertiesCache
+
+
+class DatasetPropertiesCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._directory.name, "lineage", "datasets.sqlite")
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _cache(self, **kwargs) -> DatasetPropertiesCache:
+        cache = DatasetPropertiesCache(**kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_pending_emit_counts_as_cached_only_until_its_ttl(self) -> None:
+        cache = self._cache(pending_ttl_sec=0.05)
+        cache.mark_pending("urn:a")
+        cache.mark_pending("urn:b")
+        cache.discard_pending("urn:b")
+
+        self.assertTrue(cache.contains("urn:a"))
+        self.assertFalse(cache.contains("urn:b"))
+        time.sleep(0.06)
+        self.assertFalse(cache.contains("urn:a"))
+
+        cache.add("urn:a")
+        time.sleep(0.06)
+        self.assertTrue(cache.contains("urn:a"))
+        stats = cache.stats
+        self.assertEqual((stats.avoided_emits, stats.misses, stats.pending, stats.entries), (2, 2, 0, 1))
+
+    def test_lru_evicts_the_least_recently_used_urn(self) -> None:
+        cache = self._cache(max_entries=2)
+        cache.add("urn:a")
+        cache.add("urn:b")
+        self.assertTrue(cache.contains("urn:a"))
+
+        cache.add("urn:c")
+
+        self.assertFalse(cache.contains("urn:b"))
+        self.assertTrue(cache.contains("urn:a"))
+        self.assertEqual(cache.stats.evictions, 1)
+
+    def test_confirmed_urns_survive_a_restart_through_the_store(self) -> None:
+        first = self._cache(path=self.path)
+        first.mark_pending("urn:pending")
+        first.add("urn:confirmed")
+        first.close()
+
+        restarted = self._cache(path=self.path)
+
+        self.assertTrue(restarted.contains("urn:confirmed"))
+        self.assertTrue(restarted.contains("urn:confirmed"))
+        self.assertFalse(restarted.contains("urn:pending"))
+        stats = restarted.stats
+        self.assertEqual((stats.store_hits, stats.avoided_emits, stats.entries), (1, 2, 1))
+
+    def test_store_keeps_only_the_newest_rows(self) -> None:
+        cache = self._cache(path=self.path, max_entries=10, max_store_entries=10)
+        for index in range(1000):
+            cache.add(f"urn:{index:04d}")
+        cache.close()
+
+        with sqlite3.connect(self.path) as connection:
+            urns = [row[0] for row in connection.execute("SELECT urn FROM emitted_datasets ORDER BY rowid")]
+        self.assertEqual(urns, [f"urn:{index:04d}" for index in range(990, 1000)])
+
+    def test_unavailable_store_falls_back_to_memory(self) -> None:
+        blocker = os.path.join(self._directory.name, "not-a-directory")
+        open(blocker, "w").close()
+
+        with self.assertLogs("pipeline_common.gateways.lineage.dataset_cache", level="WARNING"):
+            cache = self._cache(path=os.path.join(blocker, "datasets.sqlite"))
+        cache.add("urn:a")
+
+        self.assertTrue(cache.contains("urn:a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from types import SimpleNamespace
+
+from pipeline_common.gateways.lineage import JobConfigBundle, JobConfigBundleStore, JobConfigEntry
+from pipeline_common.gateways.lineage.contracts import DataHubDataJobKey
+
+_KEY = DataHubDataJobKey(flow_id="governed-rag", job_id="embed_chunks", flow_platform="airflow")
+_OTHER_KEY = DataHubDataJobKey(flow_id="governed-rag", job_id="index_weaviate", flow_platform="airflow")
+
+
+def _entry(key: DataHubDataJobKey, **properties: str) -> JobConfigEntry:
+    return JobConfigEntry(
+        flow_platform=key.flow_platform, flow_id=key.flow_id, job_id=key.job_id, custom_properties=properties
+    )
+
+
+class _JobInfoReader:
+    def __init__(self, custom_properties: dict[str, str] | None) -> None:
+        self.custom_properties = custom_properties
+        self.calls = 0
+
+    def get_datajob_info(self, job_urn: str) -> SimpleNamespace | None:
+        self.calls += 1
+        if self.custom_properties is None:
+            return None
+        return SimpleNamespace(customProperties=dict(self.custom_properties))
+
+
+class JobConfigBundleTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bundle = JobConfigBundle.from_entries(
+            [_entry(_OTHER_KEY, batch_size="8"), _entry(_KEY, batch_size="32", model="hash-32")]
+        )
+
+    def test_json_round_trip_keeps_jobs_and_checksum(self) -> None:
+        loaded = JobConfigBundle.from_json(self.bundle.to_json())
+
+        self.assertEqual(loaded.jobs, self.bundle.jobs)
+        self.assertEqual((loaded.checksum, loaded.compiled_at), (self.bundle.checksum, self.bundle.compiled_at))
+        self.assertEqual(loaded.get(_KEY).custom_properties, {"batch_size": "32", "model": "hash-32"})
+
+    def test_checksum_versions_the_jobs_only(self) -> None:
+        reordered = JobConfigBundle.from_entries(list(reversed(list(self.bundle.jobs.values()))))
+        changed = self.bundle.with_entry(_entry(_KEY, batch_size="64", model="hash-32"))
+
+        self.assertEqual(JobConfigBundle(jobs=reordered.jobs, compiled_at="later").checksum, self.bundle.checksum)
+        self.assertNotEqual(changed.checksum, self.bundle.checksum)
+
+    def test_tampered_bundles_are_rejected(self) -> None:
+        payload = json.loads(self.bundle.to_json())
+        edited_property = json.loads(self.bundle.to_json())
+        edited_property["jobs"][0]["custom_properties"]["batch_size"] = "9"
+        edited_checksum = {**payload, "checksum": "0" * 64}
+        unknown_format = {**payload, "format": "job-config-bundle/0"}
+
+        for tampered in (edited_property, edited_checksum, unknown_format):
+            with self.assertRaises(ValueError):
+                JobConfigBundle.from_json(json.dumps(tampered))
+        with self.assertRaises(ValueError):
+            JobConfigBundle.from_entries([_entry(_KEY), _entry(_KEY, batch_size="1")])
+
+
+class JobConfigBundleStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._directory.name, "job-config.json")
+        JobConfigBundle.from_entries([_entry(_KEY, batch_size="32")]).write(self.path)
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _store(self, **kwargs) -> JobConfigBundleStore:
+        with self.assertLogs("pipeline_common.gateways.lineage.job_config_bundle", level="INFO"):
+            store = JobConfigBundleStore(self.path, **kwargs)
+        self.addCleanup(store.close)
+        return store
+
+    def test_refresh_rewrites_the_bundle_only_when_datahub_changed(self) -> None:
+        store = self._store()
+
+        self.assertFalse(store.refresh(_KEY, "urn:job", _JobInfoReader({"batch_size": "32"})))
+        self.assertFalse(store.refresh(_KEY, "urn:job", _JobInfoReader(None)))
+        with self.assertLogs("pipeline_common.gateways.lineage.job_config_bundle", level="WARNING"):
+            self.assertTrue(store.refresh(_KEY, "urn:job", _JobInfoReader({"batch_size": 64})))
+
+        self.assertEqual(store.custom_properties(_KEY), {"batch_size": "64"})
+        self.assertEqual(self._store().custom_properties(_KEY), {"batch_size": "64"})
+
+    def test_refresh_adds_jobs_missing_from_the_bundle(self) -> None:
+        store = self._store()
+        self.assertIsNone(store.custom_properties(_OTHER_KEY))
+
+        with self.assertLogs("pipeline_common.gateways.lineage.job_config_bundle", level="WARNING"):
+            self.assertTrue(store.refresh(_OTHER_KEY, "urn:other", _JobInfoReader({"batch_size": "8"})))
+
+        reloaded = self._store()
+        self.assertEqual(reloaded.custom_properties(_OTHER_KEY), {"batch_size": "8"})
+        self.assertEqual(reloaded.custom_properties(_KEY), {"batch_size": "32"})
+
+    def test_watched_jobs_are_refreshed_in_the_background(self) -> None:
+        store = self._store(refresh_interval_sec=0.01)
+        reader = _JobInfoReader({"batch_size": "128"})
+
+        with self.assertLogs("pipeline_common.gateways.lineage.job_config_bundle", level="WARNING"):
+            store.watch(_KEY, "urn:job", reader)
+            deadline = time.monotonic() + 5
+            while store.custom_properties(_KEY) != {"batch_size": "128"} and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        self.assertEqual(store.custom_properties(_KEY), {"batch_size": "128"})
+        self.assertGreaterEqual(reader.calls, 1)
+
+    def test_missing_or_corrupt_bundle_leaves_the_store_empty(self) -> None:
+        with open(self.path, "w", encoding="utf-8") as handle:
+            handle.write("{not json")
+        self.assertIsNone(self._store().bundle)
+
+        os.remove(self.path)
+        self.assertIsNone(self._store().custom_properties(_KEY))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from typing import Any
+
+from pipeline_common.gateways.lineage import AggregatingRuntimeLineage, DatasetPlatform
+from pipeline_common.gateways.lineage.runtime_contracts import CustomProperties, RunSpec
+
+
+class _RecordingGateway:
+    def __init__(self, *, fail_terminal: bool = False) -> None:
+        self.events: list[tuple[Any, ...]] = []
+        self.fail_terminal = fail_terminal
+        self.closed = threading.Event()
+        self._runs = 0
+        self._run: RunSpec | None = None
+
+    def start_run(self) -> RunSpec:
+        self._runs += 1
+        self._run = RunSpec(
+            run_id=f"run-{self._runs}", custom_properties=CustomProperties(job_version="1"), inputs=[], outputs=[]
+        )
+        self.events.append(("start", self._run.run_id))
+        return self._run
+
+    def add_input(self, name: str, platform: DatasetPlatform) -> str:
+        self.events.append(("input", name))
+        return name
+
+    def add_output(self, name: str, platform: DatasetPlatform) -> str:
+        self.events.append(("output", name))
+        return name
+
+    def complete_run(self) -> str:
+        return self._terminal("complete", None)
+
+    def fail_run(self, error_message: str | None) -> str:
+        return self._terminal("fail", error_message)
+
+    def abort_run(self) -> None:
+        self.events.append(("abort", self._run.run_id))
+        self.closed.set()
+
+    def _terminal(self, status: str, error_message: str | None) -> str:
+        if self.fail_terminal:
+            raise ConnectionError("DataHub unavailable")
+        self.events.append((status, self._run.run_id, error_message, self._run.custom_properties.dump()))
+        self.closed.set()
+        return self._run.run_id
+
+    def terminals(self) -> list[tuple[Any, ...]]:
+        return [event for event in self.events if event[0] in ("complete", "fail", "abort")]
+
+
+class AggregatingRuntimeLineageTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.gateway = _RecordingGateway()
+
+    def _lineage(self, **kwargs: Any) -> AggregatingRuntimeLineage:
+        lineage = AggregatingRuntimeLineage(self.gateway, **kwargs)
+        self.addCleanup(lineage.close)
+        return lineage
+
+    def _item(self, lineage: AggregatingRuntimeLineage, name: str, *, error: str | None = None) -> None:
+        lineage.start_run()
+        lineage.add_input(name, DatasetPlatform.S3)
+        if error is None:
+            lineage.add_output(f"{name}.out", DatasetPlatform.S3)
+            lineage.complete_run()
+        else:
+            lineage.fail_run(error)
+
+    def test_window_closes_after_max_items_with_counts(self) -> None:
+        lineage = self._lineage(max_items=3)
+
+        with self.assertLogs("pipeline_common.gateways.lineage.aggregation", level="WARNING"):
+            for index in range(4):
+                self._item(lineage, f"doc-{index}", error="boom" if index == 1 else None)
+
+        window_properties = {"job_version": "1", "error_message": "boom", "items_total": "3", "items_failed": "1"}
+        self.assertEqual(self.gateway.terminals(), [("complete", "run-1", None, window_properties)])
+        starts = [event for event in self.gateway.events if event[0] == "start"]
+        self.assertEqual(starts, [("start", "run-1"), ("start", "run-2")])
+
+    def test_window_fails_only_when_every_item_failed(self) -> None:
+        lineage = self._lineage()
+
+        with self.assertLogs("pipeline_common.gateways.lineage.aggregation", level="WARNING"):
+            self._item(lineage, "doc-0", error="first")
+            self._item(lineage, "doc-1", error="last")
+        lineage.flush()
+
+        self.assertEqual(
+            self.gateway.terminals(),
+            [("fail", "run-1", "last", {"job_version": "1", "items_total": "2", "items_failed": "2"})],
+        )
+
+    def test_flush_waits_for_the_open_item_and_empty_windows_are_aborted(self) -> None:
+        lineage = self._lineage()
+        lineage.start_run()
+        lineage.flush()
+        self.assertEqual(self.gateway.terminals(), [])
+
+        lineage.abort_run()
+        lineage.flush()
+
+        self.assertEqual(self.gateway.terminals(), [("abort", "run-1")])
+
+    def test_idle_window_is_closed_by_the_timer(self) -> None:
+        lineage = self._lineage(max_window_sec=0.05)
+        self._item(lineage, "doc-0")
+
+        self.assertTrue(self.gateway.closed.wait(5))
+        self.assertEqual(self.gateway.terminals()[0][:2], ("complete", "run-1"))
+
+    def test_failed_terminal_emit_aborts_the_window(self) -> None:
+        self.gateway.fail_terminal = True
+        lineage = self._lineage()
+        self._item(lineage, "doc-0")
+
+        with self.assertLogs("pipeline_common.gateways.lineage.aggregation", level="ERROR"):
+            lineage.flush()
+
+        self.assertEqual(self.gateway.terminals(), [("abort", "run-1")])
+
+    def test_calls_outside_an_item_are_rejected(self) -> None:
+        lineage = self._lineage()
+
+        with self.assertRaises(ValueError):
+            lineage.add_input("doc-0", DatasetPlatform.S3)
+        with self.assertRaises(ValueError):
+            lineage.complete_run()
+
+
+if __name__ == "__main__":
+    unittest.main()
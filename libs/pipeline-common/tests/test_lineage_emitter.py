@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import threading
+import unittest
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.metadata.schema_classes import StatusClass
+
+from pipeline_common.gateways.lineage import BufferedMcpEmitter
+
+
+def _mcps(start: int, count: int = 1) -> list[MetadataChangeProposalWrapper]:
+    return [
+        MetadataChangeProposalWrapper(
+            entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:s3,doc-{index},PROD)",
+            aspect=StatusClass(removed=False),
+        )
+        for index in range(start, start + count)
+    ]
+
+
+def _indexes(urns: list[str]) -> list[int]:
+    return [int(urn.split("doc-")[1].split(",")[0]) for urn in urns]
+
+
+class _GatedSink:
+    """Record emitted MCPs; the first call waits for ``release`` so the queue can fill up behind it."""
+
+    def __init__(self, *, gated: bool = False, fail: bool = False) -> None:
+        self.calls: list[list[str]] = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.fail = fail
+        if not gated:
+            self.release.set()
+
+    def emit_mcps(self, mcps: list[MetadataChangeProposalWrapper]) -> None:
+        self.entered.set()
+        self.release.wait(5)
+        if self.fail:
+            raise ConnectionError("DataHub unavailable")
+        self.calls.append([mcp.entityUrn for mcp in mcps])
+
+    @property
+    def urns(self) -> list[str]:
+        return [urn for call in self.calls for urn in call]
+
+
+class BufferedMcpEmitterTest(unittest.TestCase):
+    def _emitter(self, sink: _GatedSink, **kwargs) -> BufferedMcpEmitter:
+        kwargs.setdefault("flush_interval_sec", 0.01)
+        emitter = BufferedMcpEmitter(sink, **kwargs)
+        self.addCleanup(emitter.close)
+        return emitter
+
+    def _fill_behind_in_flight_batch(self, sink: _GatedSink, emitter: BufferedMcpEmitter) -> None:
+        emitter.emit_mcps(_mcps(0, 2))
+        self.assertTrue(sink.entered.wait(5))
+        emitter.emit_mcps(_mcps(2, 2))
+
+    def test_coalesces_batches_in_emission_order(self) -> None:
+        sink = _GatedSink()
+        emitter = self._emitter(sink, max_batch_mcps=4, flush_interval_sec=0.2)
+
+        for start in range(0, 10, 2):
+            emitter.emit_mcps(_mcps(start, 2))
+
+        self.assertTrue(emitter.flush(timeout=5))
+        self.assertEqual(_indexes(sink.urns), list(range(10)))
+        self.assertLessEqual(max(len(call) for call in sink.calls), 4)
+        self.assertLess(len(sink.calls), 5)
+        stats = emitter.stats
+        self.assertEqual((stats.enqueued, stats.emitted, stats.pending), (10, 10, 0))
+
+    def test_drop_policy_drops_mcps_that_do_not_fit(self) -> None:
+        sink = _GatedSink(gated=True)
+        emitter = self._emitter(sink, max_queue_size=1, overflow_policy="drop")
+        self._fill_behind_in_flight_batch(sink, emitter)
+
+        with self.assertLogs("pipeline_common.gateways.lineage.emitter", level="WARNING"):
+            emitter.emit_mcps(_mcps(4, 3))
+        sink.release.set()
+
+        self.assertTrue(emitter.flush(timeout=5))
+        self.assertEqual(_indexes(sink.urns), [0, 1, 2, 3])
+        self.assertEqual((emitter.stats.dropped, emitter.stats.emitted), (3, 4))
+
+    def test_block_policy_drops_after_the_timeout(self) -> None:
+        sink = _GatedSink(gated=True)
+        emitter = self._emitter(sink, max_queue_size=1, block_timeout_sec=0.05)
+        self._fill_behind_in_flight_batch(sink, emitter)
+
+        with self.assertLogs("pipeline_common.gateways.lineage.emitter", level="WARNING"):
+            emitter.emit_mcps(_mcps(4))
+        sink.release.set()
+
+        self.assertTrue(emitter.flush(timeout=5))
+        self.assertEqual(emitter.stats.dropped, 1)
+
+    def test_spill_policy_hands_the_backlog_to_the_overflow_sink_oldest_first(self) -> None:
+        sink = _GatedSink(gated=True)
+        overflow = _GatedSink()
+        emitter = self._emitter(sink, max_queue_size=2, overflow_policy="spill", overflow_sink=overflow)
+        self._fill_behind_in_flight_batch(sink, emitter)
+        emitter.emit_mcps(_mcps(4))
+
+        emitter.emit_mcps(_mcps(5, 2))
+        emitter.emit_mcps(_mcps(7))
+        with self.assertLogs("pipeline_common.gateways.lineage.emitter", level="WARNING"):
+            emitter.emit_mcps(_mcps(8))
+        sink.release.set()
+
+        self.assertTrue(emitter.flush(timeout=5))
+        self.assertEqual(_indexes(sink.urns), [0, 1])
+        self.assertEqual(_indexes(overflow.urns), [2, 3, 4, 5, 6, 7])
+        stats = emitter.stats
+        self.assertEqual((stats.emitted, stats.spilled, stats.dropped, stats.pending), (2, 6, 1, 0))
+
+    def test_send_failures_are_counted_not_raised(self) -> None:
+        emitter = self._emitter(_GatedSink(fail=True))
+
+        with self.assertLogs("pipeline_common.gateways.lineage.emitter", level="WARNING"):
+            emitter.emit_mcps(_mcps(0, 3))
+            self.assertTrue(emitter.flush(timeout=5))
+
+        self.assertEqual((emitter.stats.failed, emitter.stats.pending), (3, 0))
+
+    def test_close_flushes_and_rejects_later_emits(self) -> None:
+        sink = _GatedSink()
+        emitter = self._emitter(sink, flush_interval_sec=1.0)
+        emitter.emit_mcps(_mcps(0, 2))
+
+        emitter.close()
+
+        self.assertEqual(_indexes(sink.urns), [0, 1])
+        with self.assertRaises(RuntimeError):
+            emitter.emit_mcps(_mcps(2))
+
+    def test_spill_requires_an_overflow_sink(self) -> None:
+        with self.assertRaises(ValueError):
+            BufferedMcpEmitter(_GatedSink(), overflow_policy="spill")
+
+
+if __name__ == "__main__":
+    unittest.main()
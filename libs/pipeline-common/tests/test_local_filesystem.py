@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from pipeline_common.gateways.object_storage import CompressionPolicy, LocalFileSystemClient, ObjectStorageGateway
+
+
+class LocalFileSystemClientTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._root = tempfile.TemporaryDirectory()
+        self.client = LocalFileSystemClient(root=self._root.name, mmap_threshold_bytes=8)
+        self.client.create_bucket("pipeline")
+
+    def tearDown(self) -> None:
+        self._root.cleanup()
+
+    def _write(self, key: str, payload: bytes = b"x", **kwargs) -> None:
+        self.client.write_bytes("pipeline", key, payload, kwargs.pop("content_type", "text/plain"), **kwargs)
+
+    def test_iter_keys_yields_s3_order_and_skips_temp_files(self) -> None:
+        for key in ("dev/ab", "dev/a/c", "dev/a-b", "dev/a/b", "dev/b"):
+            self._write(key)
+        (Path(self._root.name) / "pipeline" / "dev" / ".tmp-partial").write_bytes(b"x")
+
+        self.assertEqual(self.client.list_keys("pipeline", "dev/a"), ["dev/a-b", "dev/a/b", "dev/a/c", "dev/ab"])
+        self.assertEqual(list(self.client.iter_keys("pipeline", "dev/", start_after="dev/a/c")), ["dev/ab", "dev/b"])
+        self.assertEqual(self.client.list_keys("pipeline", "missing/"), [])
+
+    def test_sidecar_carries_content_type_encoding_and_tags(self) -> None:
+        self._write("dev/doc.json", b"body", content_type="application/json", metadata={"doc": "1"}, content_encoding="gzip")
+        self.client.put_object_tags("pipeline", "dev/doc.json", {"stage": "raw"})
+
+        stat = self.client.stat_object("pipeline", "dev/doc.json")
+        self.assertEqual(self.client.read_bytes_with_encoding("pipeline", "dev/doc.json"), (b"body", "gzip"))
+        self.assertEqual((stat.size, stat.content_type, stat.metadata), (4, "application/json", {"doc": "1"}))
+        self.assertEqual(self.client.list_keys("pipeline", ""), ["dev/doc.json"])
+
+    def test_ranged_streams_read_small_and_mapped_objects(self) -> None:
+        self._write("dev/small", b"abcd")
+        self._write("dev/large", b"0123456789abcdef")
+
+        for key, byte_range, expected in (
+            ("dev/small", (1, 2), b"bc"),
+            ("dev/large", (10, None), b"abcdef"),
+            ("dev/large", (4, 100), b"456789abcdef"),
+        ):
+            stream = self.client.open_stream("pipeline", key, byte_range=byte_range)
+            try:
+                self.assertEqual(stream.read(), expected)
+            finally:
+                stream.close()
+
+    def test_multipart_upload_joins_parts_in_part_order(self) -> None:
+        upload_id = self.client.create_multipart_upload("pipeline", "dev/big.bin", content_type="application/octet-stream")
+        second = self.client.upload_part("pipeline", "dev/big.bin", upload_id, 2, b"world")
+        first = self.client.upload_part("pipeline", "dev/big.bin", upload_id, 1, b"hello ")
+        self.client.complete_multipart_upload("pipeline", "dev/big.bin", upload_id, [(2, second), (1, first)])
+
+        self.assertEqual(self.client.read_bytes("pipeline", "dev/big.bin"), b"hello world")
+        self.assertEqual(self.client.stat_object("pipeline", "dev/big.bin").content_type, "application/octet-stream")
+        self.assertFalse(any((Path(self._root.name) / ".uploads").iterdir()))
+
+    def test_copy_keeps_encoding_and_tags_and_replaces_metadata_when_given(self) -> None:
+        self._write("dev/src", b"body", metadata={"doc": "1"}, content_encoding="gzip")
+        self.client.put_object_tags("pipeline", "dev/src", {"stage": "raw"})
+
+        self.client.copy_object("pipeline", "dev/src", "dev/kept")
+        self.client.copy_object("pipeline", "dev/src", "dev/replaced", metadata={"doc": "2"})
+
+        self.assertEqual(self.client.read_bytes_with_encoding("pipeline", "dev/kept"), (b"body", "gzip"))
+        self.assertEqual(self.client.stat_object("pipeline", "dev/kept").metadata, {"doc": "1"})
+        self.assertEqual(self.client.stat_object("pipeline", "dev/replaced").metadata, {"doc": "2"})
+        self.assertEqual(self.client._read_metadata("pipeline", "dev/replaced")["tags"], {"stage": "raw"})
+
+    def test_keys_cannot_escape_their_bucket_and_deletes_are_idempotent(self) -> None:
+        with self.assertRaises(ValueError):
+            self.client.read_bytes("pipeline", "../outside")
+        self._write("dev/doc")
+
+        self.assertEqual(self.client.delete_objects("pipeline", ["dev/doc", "dev/doc", "../outside"]).keys(), {"../outside"})
+        self.assertFalse(self.client.object_exists("pipeline", "dev/doc"))
+
+
+class WriteIfAbsentTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._root = tempfile.TemporaryDirectory()
+        self.client = LocalFileSystemClient(root=self._root.name)
+        self.client.create_bucket("pipeline")
+
+    def tearDown(self) -> None:
+        self._root.cleanup()
+
+    def test_existing_object_keeps_its_body_and_metadata(self) -> None:
+        gateway = ObjectStorageGateway(self.client, compression=CompressionPolicy.from_spec("05_embeddings/=gzip"))
+        uri = gateway.build_uri("pipeline", "dev/05_embeddings/doc-1/c-1.json")
+
+        self.assertTrue(gateway.write_if_absent(uri, b'{"v":1}', content_type="application/json"))
+        self.assertFalse(gateway.write_if_absent(uri, b'{"v":2}', content_type="text/plain"))
+
+        stat = gateway.stat_object(uri)
+        self.assertEqual(gateway.read_object(uri), b'{"v":1}')
+        self.assertEqual((stat.content_type, stat.content_encoding), ("application/json", "gzip"))
+
+    def test_concurrent_creators_leave_the_winners_metadata(self) -> None:
+        for round_index in range(50):
+            key = f"dev/05_embeddings/doc-{round_index}.json"
+            barrier = threading.Barrier(8)
+            winners: list[int] = []
+
+            def create(writer: int) -> None:
+                barrier.wait()
+                if self.client.write_bytes_if_absent(
+                    "pipeline", key, f"writer-{writer}".encode(), "text/plain", metadata={"writer": str(writer)}
+                ):
+                    winners.append(writer)
+
+            threads = [threading.Thread(target=create, args=(writer,)) for writer in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(len(winners), 1)
+            self.assertEqual(self.client.read_bytes("pipeline", key), f"writer-{winners[0]}".encode())
+            self.assertEqual(self.client.stat_object("pipeline", key).metadata, {"writer": str(winners[0])})
+
+    def test_stale_claim_from_a_crashed_writer_is_taken_over(self) -> None:
+        claim = self.client._claim_path("pipeline", "dev/05_embeddings/doc-1.json")
+        claim.parent.mkdir(parents=True)
+        claim.touch()
+
+        self.assertFalse(self.client.write_bytes_if_absent("pipeline", "dev/05_embeddings/doc-1.json", b"x", "text/plain"))
+
+        stale = time.time() - 3600
+        os.utime(claim, (stale, stale))
+        self.assertTrue(self.client.write_bytes_if_absent("pipeline", "dev/05_embeddings/doc-1.json", b"x", "text/plain"))
+        self.assertFalse(claim.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
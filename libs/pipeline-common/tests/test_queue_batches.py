@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import unittest
+from collections import deque
+from typing import Any
+
+from pipeline_common.gateways.queue import Envelope, QueueGateway
+from pipeline_common.gateways.queue.backend import QueueDelivery
+from pipeline_common.gateways.queue.in_memory_backend import InMemoryBroker, InMemoryQueueBackend
+
+
+class _PushBufferedBackend(InMemoryQueueBackend):
+    """Assign delivery tags when messages are buffered, across every queue, as RabbitMQ push delivery does."""
+
+    def __init__(self, broker: InMemoryBroker, queue_names: list[str]) -> None:
+        super().__init__(broker)
+        self._queue_names = queue_names
+        self._buffered: dict[str, deque[QueueDelivery]] = {name: deque() for name in queue_names}
+
+    def get(self, queue_name: str, timeout_seconds: float) -> QueueDelivery | None:
+        if not any(self._buffered.values()):
+            self._buffer_ready()
+        buffered = self._buffered[queue_name]
+        return buffered.popleft() if buffered else None
+
+    def _buffer_ready(self) -> None:
+        while True:
+            delivered = False
+            for name in self._queue_names:
+                delivery = super().get(name, 0)
+                if delivery is not None:
+                    self._buffered[name].append(delivery)
+                    delivered = True
+            if not delivered:
+                return
+
+
+def _envelope(value: Any, lane: str | None = None) -> dict[str, Any]:
+    return Envelope(payload=value, meta={"lane": lane} if lane else None).to_payload
+
+
+class ConsumedBatchSettleTest(unittest.TestCase):
+    def test_single_queue_batch_acks_processed_and_requeues_failed(self) -> None:
+        broker = InMemoryBroker()
+        QueueGateway(InMemoryQueueBackend(broker), {"produce": "work"}).push_many(_envelope(i) for i in range(4))
+        consumer = QueueGateway(InMemoryQueueBackend(broker), {"consume": "work", "batch_size": 3})
+
+        batch = consumer.pop_batch(max_wait=0.1)
+        batch.settle(failed=[batch.messages[1]], requeue=True)
+
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(consumer.backend._unacked, {})
+        self.assertEqual(consumer.queue_depth(), 2)
+        self.assertEqual(consumer.pop_message(timeout_seconds=0).payload["payload"], 1)
+
+    def test_interleaved_lanes_ack_only_the_batch(self) -> None:
+        broker = InMemoryBroker()
+        queue_config = {
+            "consume": "work",
+            "batch_size": 2,
+            "lanes": {"high": {"weight": 3}, "low": {"weight": 1}},
+            "default_lane": "low",
+        }
+        QueueGateway(InMemoryQueueBackend(broker), {**queue_config, "produce": "work"}).push_many(
+            [_envelope("low-1", "low"), _envelope("high-1", "high"), _envelope("low-2", "low"), _envelope("high-2", "high")]
+        )
+        backend = _PushBufferedBackend(broker, ["work", "work.high"])
+        consumer = QueueGateway(backend, queue_config)
+
+        batch = consumer.pop_batch(max_wait=0.1)
+        self.assertEqual([message.payload["payload"] for message in batch], ["high-1", "high-2"])
+        self.assertEqual([message.delivery_tag for message in batch], [2, 4])
+        batch.ack_all()
+
+        self.assertEqual(sorted(backend._unacked), [1, 3])
+        backend.close()
+        self.assertEqual(consumer.queue_depth("work"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
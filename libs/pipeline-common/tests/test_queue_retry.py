@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import time
+import unittest
+from typing import Any
+
+from pipeline_common.gateways.queue import Envelope, QueueGateway
+from pipeline_common.gateways.queue.in_memory_backend import InMemoryBroker, InMemoryQueueBackend
+from pipeline_common.gateways.queue.retry import RETRY_ATTEMPT_HEADER, RetryPolicy
+
+
+def _envelope(value: Any) -> dict[str, Any]:
+    return Envelope(payload=value).to_payload
+
+
+def _consumer(broker: InMemoryBroker, initial_delay_seconds: str) -> QueueGateway:
+    return QueueGateway(
+        InMemoryQueueBackend(broker),
+        {
+            "consume": "work",
+            "dlq": "work.dlq",
+            "retry": {"max_attempts": "3", "initial_delay_seconds": initial_delay_seconds, "backoff_multiplier": "2"},
+        },
+    )
+
+
+class RetryRoutingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.broker = InMemoryBroker()
+        self.consumer = _consumer(self.broker, "0.01")
+        QueueGateway(InMemoryQueueBackend(self.broker), {"produce": "work"}).push(_envelope("doc-1"))
+
+    def test_failed_message_moves_through_delay_queues_then_dlq(self) -> None:
+        for attempt in (1, 2):
+            message = self.consumer.pop_message(timeout_seconds=1)
+            self.assertEqual(message.attempt, attempt)
+            message.retry(error="boom")
+            delay_queue = self.consumer.retry_policy.delay_queue_name("work", attempt)
+            self.assertEqual(self.consumer.queue_depth(delay_queue) + self.consumer.queue_depth(), 1)
+
+        message = self.consumer.pop_message(timeout_seconds=1)
+        self.assertEqual(message.headers[RETRY_ATTEMPT_HEADER], 2)
+        self.assertEqual(message.attempt, 3)
+        message.retry(error="boom")
+        self.assertEqual(self.consumer.backend._unacked, {})
+
+        dead_letter = self.consumer.backend.get("work.dlq", 0)
+        payload = self.consumer.codecs.decode(dead_letter.body, dead_letter.content_type)["payload"]
+        self.assertEqual(payload["attempts"], 3)
+        self.assertEqual(payload["error"], "boom")
+        self.assertEqual(payload["message"]["payload"], "doc-1")
+        self.assertEqual(self.consumer.queue_depth(), 0)
+
+    def test_retry_of_settled_message_is_a_no_op(self) -> None:
+        message = self.consumer.pop_message(timeout_seconds=1)
+        message.ack()
+        message.retry(error="boom")
+
+        self.assertEqual(self.consumer.queue_depth(self.consumer.retry_policy.delay_queue_name("work", 1)), 0)
+
+    def test_changed_delay_policy_declares_new_delay_queues(self) -> None:
+        slower = _consumer(self.broker, "30")
+
+        self.assertEqual(self.consumer.retry_policy.delay_queue_name("work", 1), "work.retry.1.10")
+        self.assertEqual(slower.retry_policy.delay_queue_name("work", 2), "work.retry.2.60000")
+
+        slower.pop_message(timeout_seconds=1).retry(error="boom")
+        time.sleep(0.05)
+
+        self.assertEqual(slower.queue_depth("work.retry.1.30000"), 1)
+        self.assertEqual(slower.queue_depth("work.retry.1.10"), 0)
+        self.assertIsNone(slower.pop_message(timeout_seconds=0))
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def test_delay_queue_arguments_match_the_name(self) -> None:
+        policy = RetryPolicy.from_config({"max_attempts": "3", "initial_delay_seconds": "1.5", "backoff_multiplier": "2"})
+
+        self.assertEqual(policy.delay_queue_name("work.high", 2), "work.high.retry.2.3000")
+        self.assertEqual(
+            policy.delay_queue_arguments("work.high", 2),
+            {"x-message-ttl": 3000, "x-dead-letter-exchange": "", "x-dead-letter-routing-key": "work.high"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
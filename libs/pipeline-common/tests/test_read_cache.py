@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from pipeline_common.gateways.object_storage import CachingObjectStorageGateway, DiskReadCache, LocalFileSystemClient
+
+
+class _CountingClient(LocalFileSystemClient):
+    def __init__(self, *, root: str) -> None:
+        super().__init__(root=root)
+        self.reads = 0
+
+    def read_bytes_with_encoding(self, bucket: str, key: str) -> tuple[bytes, str | None]:
+        self.reads += 1
+        return super().read_bytes_with_encoding(bucket, key)
+
+
+class DiskReadCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = self._directory.name
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def test_evicts_least_recently_used_entries_over_budget(self) -> None:
+        cache = DiskReadCache(directory=self.directory, max_bytes=10)
+        cache.put("uri-a", None, b"aaaa")
+        cache.put("uri-b", "etag-1", b"bbbb")
+        self.assertEqual(cache.get("uri-a"), b"aaaa")
+
+        cache.put("uri-c", None, b"cccc")
+        cache.put("uri-d", None, b"x" * 11)
+
+        self.assertIsNone(cache.get("uri-b", "etag-1"))
+        self.assertIsNone(cache.get("uri-d"))
+        self.assertEqual(cache.get("uri-c"), b"cccc")
+        stats = cache.stats
+        self.assertEqual((stats.hits, stats.misses, stats.evictions), (2, 2, 1))
+        self.assertEqual((stats.entries, stats.bytes_used), (2, 8))
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+
+    def test_entries_are_keyed_by_etag(self) -> None:
+        cache = DiskReadCache(directory=self.directory, max_bytes=100)
+        cache.put("uri-a", "etag-1", b"old")
+
+        self.assertIsNone(cache.get("uri-a", "etag-2"))
+        self.assertIsNone(cache.get("uri-a"))
+        cache.invalidate("uri-a", "etag-1")
+        self.assertIsNone(cache.get("uri-a", "etag-1"))
+
+    def test_restart_reindexes_entries_by_mtime_and_drops_temp_files(self) -> None:
+        cache = DiskReadCache(directory=self.directory, max_bytes=100)
+        for uri in ("uri-new", "uri-old", "uri-mid"):
+            cache.put(uri, None, b"1234")
+        for age, uri in ((100, "uri-old"), (50, "uri-mid"), (0, "uri-new")):
+            stamp = 1_700_000_000 - age
+            os.utime(Path(self.directory) / DiskReadCache._entry_name(uri, None), (stamp, stamp))
+        (Path(self.directory) / ".tmp-abandoned").write_bytes(b"partial")
+
+        restarted = DiskReadCache(directory=self.directory, max_bytes=8)
+
+        self.assertEqual(restarted.stats.evictions, 1)
+        self.assertIsNone(restarted.get("uri-old"))
+        self.assertEqual(restarted.get("uri-mid"), b"1234")
+        self.assertEqual(restarted.get("uri-new"), b"1234")
+        self.assertFalse((Path(self.directory) / ".tmp-abandoned").exists())
+
+
+class CachingObjectStorageGatewayTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._root = tempfile.TemporaryDirectory()
+        self.client = _CountingClient(root=os.path.join(self._root.name, "storage"))
+        self.client.create_bucket("pipeline")
+        self.gateway = CachingObjectStorageGateway(
+            self.client,
+            cache=DiskReadCache(directory=os.path.join(self._root.name, "cache"), max_bytes=1024),
+        )
+
+    def tearDown(self) -> None:
+        self._root.cleanup()
+
+    def test_immutable_keys_hit_without_touching_storage_until_rewritten(self) -> None:
+        uri = self.gateway.build_uri("pipeline", "dev/04_chunks/doc-1/c-1.json")
+        self.gateway.write_object(uri, b"v1")
+
+        self.assertEqual([self.gateway.read_object(uri) for _ in range(3)], [b"v1"] * 3)
+        self.assertEqual(self.client.reads, 1)
+
+        self.gateway.write_object(uri, b"v2")
+        self.assertEqual(self.gateway.read_object(uri), b"v2")
+        self.assertEqual(self.client.reads, 2)
+
+    def test_mutable_keys_are_revalidated_by_etag(self) -> None:
+        uri = self.gateway.build_uri("pipeline", "dev/07_metadata/state.json")
+        self.client.write_bytes("pipeline", "dev/07_metadata/state.json", b"v1", "application/json")
+
+        self.assertEqual([self.gateway.read_object(uri) for _ in range(2)], [b"v1"] * 2)
+        self.assertEqual(self.client.reads, 1)
+
+        self.client.write_bytes("pipeline", "dev/07_metadata/state.json", b"v2-longer", "application/json")
+        self.assertEqual(self.gateway.read_object(uri), b"v2-longer")
+        self.assertEqual(self.client.reads, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()